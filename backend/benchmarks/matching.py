@@ -0,0 +1,302 @@
+"""
+Matching benchmark for TalentSync backend
+
+Generates synthetic candidate and job pools, seeded from the skills in
+init-mongo.js, and times job -> candidates matching both as a pure scoring
+kernel and end to end through MatchingService.get_candidates_for_job.
+
+Usage (from the backend directory):
+    python -m benchmarks.matching
+    python -m benchmarks.matching --sizes 1000 10000 --queries 200 --scoring plain idf
+    python -m benchmarks.matching --mongo-url mongodb://localhost:27017
+
+Without --mongo-url candidates are served from an in-memory stand-in for the
+candidates collection; with it they are written to a scratch database that
+is dropped afterwards.
+"""
+import argparse
+import asyncio
+import json
+import os
+import re
+import resource
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections import Counter
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from bson import ObjectId
+
+from src.models.candidate import Candidate
+from src.models.job_posting import JobPosting
+from src.services.match_cache_service import MatchCacheService
+from src.services.matching_service import MatchingService
+from src.services.semantic_index_service import SemanticIndexService
+from src.services.skill_index_service import SkillIndexService
+from src.utils.scoring import MATCH_THRESHOLD, SCORING_IDF, SCORING_MODES, SCORING_PLAIN, SCORING_SEMANTIC
+from src.utils.skills import SKILL_ALIASES
+from src.utils.text_features import job_text
+
+INIT_MONGO_JS = Path(__file__).resolve().parents[2] / "init-mongo.js"
+DEFAULT_SIZES = [1_000, 10_000, 100_000, 1_000_000]
+LOCATIONS = ["San Francisco, CA", "New York, NY", "Austin, TX", "Seattle, WA", "Remote", "Boston, MA", "Chicago, IL"]
+# Queries traced for peak memory; tracing is too slow to apply to every timed query
+MEMORY_QUERIES = 10
+FILLER = "team delivered projects production systems customers design reviews ownership mentoring".split()
+
+
+@dataclass
+class BenchmarkResult:
+    pool_size: int
+    scoring: str
+    kernel_p50_ms: float
+    kernel_p99_ms: float
+    end_to_end_p50_ms: float
+    end_to_end_p99_ms: float
+    build_seconds: float
+    index_memory_mb: float
+    query_peak_memory_mb: float
+
+
+def load_skill_weights(path: Path = INIT_MONGO_JS) -> Tuple[List[str], np.ndarray]:
+    """
+    Skill vocabulary and sampling weights
+
+    Skills seen in init-mongo.js are weighted by how often they occur there,
+    with a Zipf-like tail so a few skills are common and most are rare. The
+    canonical skill registry fills in when the seed script is not available.
+    """
+    counts: Counter = Counter()
+    if path.exists():
+        for skill_list in re.findall(r"skills:\s*\[([^\]]*)\]", path.read_text()):
+            counts.update(re.findall(r'"([^"]+)"', skill_list))
+    for skill in SKILL_ALIASES:
+        counts.setdefault(skill, 1)
+
+    skills = [skill for skill, _ in counts.most_common()]
+    ranks = np.arange(1, len(skills) + 1)
+    weights = np.array([counts[skill] for skill in skills], dtype=np.float64) / ranks ** 0.5
+    return skills, weights / weights.sum()
+
+
+class SyntheticPool:
+    """Deterministic candidate and job documents drawn from the skill distribution"""
+
+    def __init__(self, seed: int = 42):
+        self.random = np.random.default_rng(seed)
+        self.skills, self.weights = load_skill_weights()
+
+    def _skill_sample(self, low: int, high: int) -> List[str]:
+        count = int(self.random.integers(low, high + 1))
+        picks = self.random.choice(len(self.skills), size=count, replace=False, p=self.weights)
+        return [self.skills[pick] for pick in picks]
+
+    def candidates(self, count: int) -> List[Dict[str, Any]]:
+        now = datetime.utcnow()
+        docs = []
+        for _ in range(count):
+            skills = self._skill_sample(3, 12)
+            years = int(self.random.integers(0, 20))
+            filler = [FILLER[i] for i in self.random.integers(0, len(FILLER), size=20)]
+            docs.append({
+                "_id": ObjectId(),
+                "name": "Synthetic Candidate",
+                "skills": skills,
+                "location": LOCATIONS[int(self.random.integers(0, len(LOCATIONS)))],
+                "experience": f"{years} years of professional experience",
+                "raw_text": " ".join(skills + filler),
+                "created_at": now - timedelta(days=int(self.random.integers(0, 720))),
+            })
+        return docs
+
+    def jobs(self, count: int) -> List[JobPosting]:
+        return [
+            JobPosting(
+                title="Synthetic Role",
+                description="Looking for an engineer to build and operate production systems",
+                skills=self._skill_sample(4, 8),
+                location=LOCATIONS[int(self.random.integers(0, len(LOCATIONS)))]
+            )
+            for _ in range(count)
+        ]
+
+
+class InMemoryCandidateService:
+    """Stand-in for CandidateService serving the synthetic pool from a dict"""
+
+    def __init__(self, docs: Sequence[Dict[str, Any]]):
+        self.docs = {str(doc["_id"]): doc for doc in docs}
+
+    async def get_candidates_by_ids(self, candidate_ids: List[str], exclude_fields: Optional[List[str]] = None) -> List[Candidate]:
+        excluded = set(exclude_fields or [])
+        return [
+            Candidate(**{key: value for key, value in self.docs[candidate_id].items() if key not in excluded})
+            for candidate_id in candidate_ids
+            if candidate_id in self.docs
+        ]
+
+
+def percentile_ms(samples: List[float], percentile: float) -> float:
+    return float(np.percentile(samples, percentile) * 1000) if samples else 0.0
+
+
+async def time_queries(queries: Sequence[Any], run: Callable) -> List[float]:
+    samples = []
+    for query in queries:
+        started = time.perf_counter()
+        result = run(query)
+        if asyncio.iscoroutine(result):
+            await result
+        samples.append(time.perf_counter() - started)
+    return samples
+
+
+def build_indexes(docs: Sequence[Dict[str, Any]], scoring_modes: Sequence[str], data_dir: Path):
+    skill_index = SkillIndexService("candidates", with_bitsets=True)
+    for doc in docs:
+        skill_index.add_entry(str(doc["_id"]), doc["skills"], doc)
+    skill_index._built = True
+
+    semantic_index = SemanticIndexService(data_dir / "semantic_index.npz")
+    if SCORING_SEMANTIC in scoring_modes:
+        for doc in docs:
+            semantic_index._append_row(str(doc["_id"]), doc["raw_text"])
+    semantic_index._built = True
+    return skill_index, semantic_index
+
+
+def kernel(service: MatchingService, scoring: str) -> Callable[[JobPosting], Any]:
+    """The pure scoring step of a matching request, without fetching candidates"""
+    if scoring == SCORING_SEMANTIC:
+        return lambda job: service.semantic_index.similarities(job_text(job.dict()))
+
+    def score(job: JobPosting):
+        skills = list(dict.fromkeys(job.skills))
+        weights = service.skill_index.idf_weights(skills) if scoring == SCORING_IDF else None
+        return service.skill_index.bitsets.match(skills, MATCH_THRESHOLD, weights)
+    return score
+
+
+async def run_pool(
+    pool_size: int,
+    scoring_modes: Sequence[str],
+    queries: int,
+    limit: int,
+    mongo_url: Optional[str],
+    seed: int
+) -> List[BenchmarkResult]:
+    generator = SyntheticPool(seed)
+    docs = generator.candidates(pool_size)
+    jobs = generator.jobs(queries)
+
+    database = None
+    if mongo_url:
+        from motor.motor_asyncio import AsyncIOMotorClient
+        from src.services.candidate_service import CandidateService
+        from src.services import db_service
+
+        client = AsyncIOMotorClient(mongo_url)
+        database = client[f"talentsync_benchmark_{os.getpid()}"]
+        db_service.database_service.client = client
+        db_service.database_service.database = database
+        for start in range(0, len(docs), 10_000):
+            await database.candidates.insert_many(docs[start:start + 10_000], ordered=False)
+        candidate_service = CandidateService()
+    else:
+        candidate_service = InMemoryCandidateService(docs)
+
+    try:
+        with tempfile.TemporaryDirectory() as data_dir:
+            # Building once under tracing sizes the indexes; build time includes the tracing overhead
+            tracemalloc.start()
+            started = time.perf_counter()
+            skill_index, semantic_index = build_indexes(docs, scoring_modes, Path(data_dir))
+            build_seconds = time.perf_counter() - started
+            index_bytes, _ = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+            service = MatchingService()
+            service.skill_index = skill_index
+            service.semantic_index = semantic_index
+            service.candidate_service = candidate_service
+            # Every timed query must be scored, not served from the match cache
+            service.match_cache = MatchCacheService(max_entries=0)
+
+            results = []
+            for scoring in scoring_modes:
+                end_to_end = lambda job: service.get_candidates_for_job(job, limit=limit, scoring=scoring)
+                # Warm caches (IDF weights, semantic row norms) before timing
+                await time_queries(jobs[:1], end_to_end)
+                kernel_samples = await time_queries(jobs, kernel(service, scoring))
+                end_to_end_samples = await time_queries(jobs, end_to_end)
+
+                # Memory is traced in a separate pass so tracing does not skew the timings
+                tracemalloc.start()
+                await time_queries(jobs[:MEMORY_QUERIES], end_to_end)
+                _, query_peak = tracemalloc.get_traced_memory()
+                tracemalloc.stop()
+
+                results.append(BenchmarkResult(
+                    pool_size=pool_size,
+                    scoring=scoring,
+                    kernel_p50_ms=percentile_ms(kernel_samples, 50),
+                    kernel_p99_ms=percentile_ms(kernel_samples, 99),
+                    end_to_end_p50_ms=percentile_ms(end_to_end_samples, 50),
+                    end_to_end_p99_ms=percentile_ms(end_to_end_samples, 99),
+                    build_seconds=build_seconds,
+                    index_memory_mb=index_bytes / 1e6,
+                    query_peak_memory_mb=query_peak / 1e6
+                ))
+            return results
+    finally:
+        if database is not None:
+            await database.client.drop_database(database.name)
+            database.client.close()
+
+
+def print_table(results: Sequence[BenchmarkResult]):
+    header = (
+        f"{'pool':>9} {'scoring':>9} {'kernel p50':>11} {'kernel p99':>11} {'e2e p50':>9} {'e2e p99':>9} "
+        f"{'build s':>8} {'index MB':>9} {'query MB':>9}"
+    )
+    print(header)
+    print("-" * len(header))
+    for result in results:
+        print(
+            f"{result.pool_size:>9} {result.scoring:>9} "
+            f"{result.kernel_p50_ms:>9.2f}ms {result.kernel_p99_ms:>9.2f}ms "
+            f"{result.end_to_end_p50_ms:>7.2f}ms {result.end_to_end_p99_ms:>7.2f}ms "
+            f"{result.build_seconds:>8.1f} {result.index_memory_mb:>9.1f} {result.query_peak_memory_mb:>9.1f}"
+        )
+
+
+async def main(argv: Optional[Sequence[str]] = None) -> List[BenchmarkResult]:
+    parser = argparse.ArgumentParser(description="Benchmark job -> candidates matching on synthetic pools")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="candidate pool sizes")
+    parser.add_argument("--queries", type=int, default=100, help="jobs matched per pool")
+    parser.add_argument("--limit", type=int, default=50, help="page size for end-to-end requests")
+    parser.add_argument("--scoring", nargs="+", default=[SCORING_PLAIN], choices=SCORING_MODES)
+    parser.add_argument("--mongo-url", default=None, help="time end-to-end reads against this mongod")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--json", type=Path, default=None, help="also write results to this file")
+    args = parser.parse_args(argv)
+
+    results = []
+    for size in args.sizes:
+        results += await run_pool(size, args.scoring, args.queries, args.limit, args.mongo_url, args.seed)
+    print_table(results)
+    print(f"max RSS: {resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024:.0f} MB", file=sys.stderr)
+
+    if args.json:
+        args.json.write_text(json.dumps([asdict(result) for result in results], indent=2))
+    return results
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
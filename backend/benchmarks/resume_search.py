@@ -0,0 +1,147 @@
+"""
+Resume search benchmark for TalentSync backend
+
+Indexes synthetic resumes with ResumeSearchService and times keyword,
+boolean and phrase queries against them. Resume words follow a Zipf
+distribution over a generated vocabulary, with skills from init-mongo.js
+mixed in, so postings lists have realistic lengths.
+
+Usage (from the backend directory):
+    python -m benchmarks.resume_search
+    python -m benchmarks.resume_search --sizes 10000 100000 --words 400
+"""
+import argparse
+import json
+import tempfile
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+from bson import ObjectId
+
+from benchmarks.matching import SyntheticPool, percentile_ms
+from src.services.resume_search_service import ResumeSearchService
+
+DEFAULT_SIZES = [10_000, 100_000]
+VOCABULARY_SIZE = 50_000
+
+
+@dataclass
+class ResumeSearchResult:
+    pool_size: int
+    query_kind: str
+    p50_ms: float
+    p99_ms: float
+    mean_hits: float
+    index_seconds: float
+    segments: int
+    index_mb: float
+
+
+class SyntheticResumes:
+    """Deterministic resume texts: Zipf-distributed filler words plus a handful of skills"""
+
+    def __init__(self, seed: int = 42):
+        self.random = np.random.default_rng(seed)
+        self.pool = SyntheticPool(seed)
+        self.vocabulary = np.array([f"w{rank}" for rank in range(VOCABULARY_SIZE)])
+        weights = 1.0 / np.arange(1, VOCABULARY_SIZE + 1)
+        self.weights = weights / weights.sum()
+
+    def resumes(self, count: int, words: int) -> List[str]:
+        texts = []
+        filler = self.vocabulary[self.random.choice(VOCABULARY_SIZE, size=(count, words), p=self.weights)]
+        for row in filler:
+            skills = self.pool._skill_sample(3, 12)
+            texts.append(" ".join(row.tolist() + skills))
+        return texts
+
+    def queries(self, count: int) -> Dict[str, List[str]]:
+        def skill() -> str:
+            return self.pool._skill_sample(1, 1)[0]
+
+        def word(low: int, high: int) -> str:
+            return f"w{int(self.random.integers(low, high))}"
+
+        return {
+            "term": [skill() for _ in range(count)],
+            "and": [f"{skill()} AND {skill()}" for _ in range(count)],
+            "or": [f"{skill()} OR {word(100, 1000)}" for _ in range(count)],
+            "not": [f"{skill()} -{word(0, 20)}" for _ in range(count)],
+            "phrase": [f'"{word(0, 50)} {word(0, 50)}"' for _ in range(count)],
+        }
+
+
+def directory_mb(path: Path) -> float:
+    return sum(file.stat().st_size for file in path.rglob("*") if file.is_file()) / 1e6
+
+
+def run_pool(pool_size: int, words: int, queries: int, limit: int, seed: int) -> List[ResumeSearchResult]:
+    generator = SyntheticResumes(seed)
+    texts = generator.resumes(pool_size, words)
+    with tempfile.TemporaryDirectory() as data_dir:
+        service = ResumeSearchService(Path(data_dir))
+        started = time.perf_counter()
+        for text in texts:
+            service.add_document(str(ObjectId()), text)
+        service.flush()
+        index_seconds = time.perf_counter() - started
+        index_mb = directory_mb(Path(data_dir))
+
+        results = []
+        for kind, kind_queries in generator.queries(queries).items():
+            service.search(kind_queries[0], limit)
+            samples, hits = [], []
+            for query in kind_queries:
+                started = time.perf_counter()
+                found = service.search(query, limit)
+                samples.append(time.perf_counter() - started)
+                hits.append(len(found))
+            results.append(ResumeSearchResult(
+                pool_size=pool_size,
+                query_kind=kind,
+                p50_ms=percentile_ms(samples, 50),
+                p99_ms=percentile_ms(samples, 99),
+                mean_hits=float(np.mean(hits)),
+                index_seconds=index_seconds,
+                segments=len(service._segments),
+                index_mb=index_mb
+            ))
+    return results
+
+
+def print_table(results: Sequence[ResumeSearchResult]):
+    header = f"{'pool':>9} {'query':>7} {'p50':>9} {'p99':>9} {'hits':>6} {'index s':>8} {'segments':>8} {'MB':>7}"
+    print(header)
+    print("-" * len(header))
+    for result in results:
+        print(
+            f"{result.pool_size:>9} {result.query_kind:>7} {result.p50_ms:>7.2f}ms {result.p99_ms:>7.2f}ms "
+            f"{result.mean_hits:>6.1f} {result.index_seconds:>8.1f} {result.segments:>8} {result.index_mb:>7.1f}"
+        )
+
+
+def main(argv: Optional[Sequence[str]] = None) -> List[ResumeSearchResult]:
+    parser = argparse.ArgumentParser(description="Benchmark BM25 resume search")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="resume counts")
+    parser.add_argument("--words", type=int, default=300, help="filler words per resume")
+    parser.add_argument("--queries", type=int, default=100, help="queries per kind")
+    parser.add_argument("--limit", type=int, default=20, help="results per query")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--json", type=Path, default=None, help="also write results to this file")
+    args = parser.parse_args(argv)
+
+    results = []
+    for size in args.sizes:
+        results += run_pool(size, args.words, args.queries, args.limit, args.seed)
+    print_table(results)
+
+    if args.json:
+        args.json.write_text(json.dumps([asdict(result) for result in results], indent=2))
+    return results
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+"""
+MinHash/LSH shortlisting benchmark for TalentSync backend
+
+Compares job -> candidates matching over the MinHash/LSH shortlist against
+the exact path on synthetic pools, for a grid of (bands, rows per band)
+settings. Recall is the share of the exact top ``--limit`` candidates that
+the shortlisted path also returns; shortlist is the share of the pool that
+was exact-scored.
+
+Usage (from the backend directory):
+    python -m benchmarks.shortlist
+    python -m benchmarks.shortlist --sizes 100000 --lsh 16x1 32x2 64x3 --scoring idf
+"""
+import argparse
+import asyncio
+import json
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from benchmarks.matching import InMemoryCandidateService, SyntheticPool, percentile_ms, time_queries
+from src.services.match_cache_service import MatchCacheService
+from src.services.matching_service import MatchingService
+from src.services.minhash_shortlist_service import MinHashShortlistService
+from src.services.skill_index_service import SkillIndexService
+from src.utils.scoring import SCORING_PLAIN, SKILL_SCORING_MODES
+
+DEFAULT_SIZES = [100_000, 1_000_000]
+DEFAULT_SETTINGS = ["16x1", "32x2", "64x3", "32x3"]
+
+
+@dataclass
+class ShortlistResult:
+    pool_size: int
+    scoring: str
+    bands: int
+    rows_per_band: int
+    recall_mean: float
+    recall_p5: float
+    shortlist_share: float
+    exact_p50_ms: float
+    shortlist_p50_ms: float
+    shortlist_p99_ms: float
+    signing_seconds: float
+
+
+def parse_setting(setting: str) -> Tuple[int, int]:
+    bands, rows_per_band = setting.lower().split("x")
+    return int(bands), int(rows_per_band)
+
+
+async def run_pool(
+    pool_size: int,
+    settings: Sequence[Tuple[int, int]],
+    scoring_modes: Sequence[str],
+    queries: int,
+    limit: int,
+    seed: int
+) -> List[ShortlistResult]:
+    generator = SyntheticPool(seed)
+    docs = generator.candidates(pool_size)
+    jobs = generator.jobs(queries)
+
+    skill_index = SkillIndexService("candidates", with_bitsets=True)
+    for doc in docs:
+        skill_index.add_entry(str(doc["_id"]), doc["skills"], doc)
+    skill_index._built = True
+
+    service = MatchingService()
+    service.skill_index = skill_index
+    service.candidate_service = InMemoryCandidateService(docs)
+    service.match_cache = MatchCacheService(max_entries=0)
+    service.shortlist_min_pool_size = 0
+
+    results = []
+    for scoring in scoring_modes:
+        exact = lambda job: service.get_candidates_for_job(job, limit=limit, scoring=scoring, exact=True)
+        await time_queries(jobs[:1], exact)
+        exact_samples = await time_queries(jobs, exact)
+        exact_top = [{str(candidate.id) for candidate in await exact(job)} for job in jobs]
+
+        for bands, rows_per_band in settings:
+            shortlist = MinHashShortlistService(bands, rows_per_band)
+            for candidate_id in skill_index.entry_ids():
+                shortlist.set_row(skill_index.bitsets.row_of(candidate_id), skill_index.get_skills(candidate_id))
+            started = time.perf_counter()
+            shortlist.refresh()
+            signing_seconds = time.perf_counter() - started
+            skill_index.shortlist = shortlist
+
+            approximate = lambda job: service.get_candidates_for_job(job, limit=limit, scoring=scoring)
+            samples = await time_queries(jobs, approximate)
+            recalls, shares = [], []
+            for job, expected in zip(jobs, exact_top):
+                found = {str(candidate.id) for candidate in await approximate(job)}
+                recalls.append(len(found & expected) / len(expected) if expected else 1.0)
+                shares.append(len(shortlist.shortlist(list(dict.fromkeys(job.skills)))) / pool_size)
+
+            results.append(ShortlistResult(
+                pool_size=pool_size,
+                scoring=scoring,
+                bands=bands,
+                rows_per_band=rows_per_band,
+                recall_mean=float(np.mean(recalls)),
+                recall_p5=float(np.percentile(recalls, 5)),
+                shortlist_share=float(np.mean(shares)),
+                exact_p50_ms=percentile_ms(exact_samples, 50),
+                shortlist_p50_ms=percentile_ms(samples, 50),
+                shortlist_p99_ms=percentile_ms(samples, 99),
+                signing_seconds=signing_seconds
+            ))
+    return results
+
+
+def print_table(results: Sequence[ShortlistResult]):
+    header = (
+        f"{'pool':>9} {'scoring':>8} {'bands':>6} {'rows':>5} {'recall':>7} {'p5':>6} {'share':>6} "
+        f"{'exact p50':>10} {'lsh p50':>9} {'lsh p99':>9} {'sign s':>7}"
+    )
+    print(header)
+    print("-" * len(header))
+    for result in results:
+        print(
+            f"{result.pool_size:>9} {result.scoring:>8} {result.bands:>6} {result.rows_per_band:>5} "
+            f"{result.recall_mean:>7.3f} {result.recall_p5:>6.2f} {result.shortlist_share:>6.3f} "
+            f"{result.exact_p50_ms:>8.2f}ms {result.shortlist_p50_ms:>7.2f}ms {result.shortlist_p99_ms:>7.2f}ms "
+            f"{result.signing_seconds:>7.1f}"
+        )
+
+
+async def main(argv: Optional[Sequence[str]] = None) -> List[ShortlistResult]:
+    parser = argparse.ArgumentParser(description="Benchmark MinHash/LSH shortlisting against exact matching")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="candidate pool sizes")
+    parser.add_argument("--lsh", nargs="+", default=DEFAULT_SETTINGS, help="BANDSxROWS settings to compare")
+    parser.add_argument("--queries", type=int, default=100, help="jobs matched per pool")
+    parser.add_argument("--limit", type=int, default=50, help="page size recall is measured on")
+    parser.add_argument("--scoring", nargs="+", default=[SCORING_PLAIN], choices=SKILL_SCORING_MODES)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--json", type=Path, default=None, help="also write results to this file")
+    args = parser.parse_args(argv)
+
+    settings = [parse_setting(setting) for setting in args.lsh]
+    results = []
+    for size in args.sizes:
+        results += await run_pool(size, settings, args.scoring, args.queries, args.limit, args.seed)
+    print_table(results)
+
+    if args.json:
+        args.json.write_text(json.dumps([asdict(result) for result in results], indent=2))
+    return results
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -2,34 +2,109 @@
 Candidate API endpoints for TalentSync backend
 """
 from typing import List, Optional
-from fastapi import APIRouter, HTTPException, Depends, UploadFile, File, Form
-from fastapi.responses import JSONResponse, Response
+from fastapi import APIRouter, BackgroundTasks, HTTPException, Depends, UploadFile, File, Form, Query
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 import logging
 import hashlib
+from bson import ObjectId
 
 from ..models.candidate import (CandidateCreate, CandidateUpdate, CandidateResponse, 
-                               CandidateLLMCreate, CandidateExtraDetailResponse)
+                               CandidateLLMCreate, CandidateExtraDetailResponse, CandidateFacetResults,
+                               CandidateImportResult, CandidateBulkDelete, CandidateCleanupResult,
+                               ResumeSearchHit)
+from ..services.candidate_cleanup_service import candidate_cleanup_service
+from ..services.candidate_export_service import (EXPORT_BATCH_SIZE, EXPORT_FORMAT_PATTERN, EXPORT_MEDIA_TYPES,
+                                                 candidate_export_service, export_columns)
+from ..services.candidate_import_service import IMPORT_FORMAT_PATTERN, candidate_import_service, import_format
 from ..services.candidate_service import CandidateService
-from ..services.document_service import DocumentService
+from ..services.document_service import DocumentService, remove_files
 from ..services.file_parsing_service import FileParsingService
 from ..services.llm_extraction_service import LLMExtractionService
+from ..services.resume_search_service import resume_search_service
+from ..utils.pagination import NEXT_CURSOR_HEADER
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/candidates", tags=["candidates"])
 
+VIEW_PATTERN = "^(summary|full)$"
+INCLUDE_PATTERN = "^extra_details$"
+
 
 @router.get("/", response_model=List[CandidateResponse])
 async def list_candidates(
-    skip: int = 0,
-    limit: int = 100,
+    response: Response,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=1000),
+    cursor: Optional[str] = None,
+    view: str = Query("full", pattern=VIEW_PATTERN),
+    include: Optional[str] = Query(None, pattern=INCLUDE_PATTERN),
     candidate_service: CandidateService = Depends(lambda: CandidateService())
 ):
-    """Get all candidates with pagination"""
-    candidates = await candidate_service.get_candidates(skip=skip, limit=limit)
+    """
+    Get candidates, newest first
+
+    If more remain, the ``X-Next-Cursor`` response header holds the ``cursor``
+    for the next page. Cursor pages cost the same however deep they are and do
+    not shift when candidates are added meanwhile. ``skip`` is still accepted
+    for offset paging but gets slower the deeper it goes.
+
+    ``view=summary`` leaves ``raw_text`` out (``has_raw_text`` says whether
+    there is one; fetch it from ``/{candidate_id}/raw-text``), the default
+    ``view=full`` keeps it. ``include=extra_details`` adds every candidate's
+    extra details, read for the whole page in one query.
+    """
+    summary = view == "summary"
+    if skip:
+        candidates = await candidate_service.get_candidates(skip=skip, limit=limit, summary=summary)
+    else:
+        try:
+            candidates, next_cursor = await candidate_service.get_candidate_page(
+                limit=limit, cursor=cursor, summary=summary
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        if next_cursor:
+            response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    if include == "extra_details":
+        return await candidate_service.to_responses_with_extra_details(candidates)
     return [candidate_service.to_response(candidate) for candidate in candidates]
 
 
+@router.get("/resume-search", response_model=List[ResumeSearchHit])
+async def search_resumes(
+    q: str,
+    limit: int = Query(20, ge=1, le=1000),
+    candidate_service: CandidateService = Depends(lambda: CandidateService())
+):
+    """
+    Keyword search over resume text, best BM25 matches first
+
+    Words must all appear unless joined by ``OR``; ``NOT`` or a leading ``-``
+    excludes a word, double quotes match an exact phrase and parentheses
+    group, e.g. ``kafka AND (fintech OR payments) -intern``.
+    """
+    if not resume_search_service.is_built:
+        raise HTTPException(status_code=503, detail="Resume search index is still being built")
+    try:
+        hits = resume_search_service.search(q, limit=limit)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    candidates = await candidate_service.get_candidates_by_ids(
+        [candidate_id for candidate_id, _ in hits], exclude_fields=["raw_text"]
+    )
+    by_id = {str(candidate.id): candidate for candidate in candidates}
+    results = []
+    for candidate_id, score in hits:
+        if candidate_id in by_id:
+            # Only candidates with resume text are indexed; the text itself was not read
+            response = candidate_service.to_response(by_id[candidate_id])
+            response.has_raw_text = True
+            results.append(ResumeSearchHit(score=score, candidate=response))
+    return results
+
+
 @router.post("/", response_model=dict)
 async def create_candidate(
     name: str = Form(...),
@@ -95,18 +170,99 @@ async def create_candidate_json(
     }
 
 
+@router.post("/import", response_model=CandidateImportResult)
+async def import_candidates(
+    file: UploadFile = File(...),
+    file_format: Optional[str] = Query(None, alias="format", pattern=IMPORT_FORMAT_PATTERN)
+):
+    """
+    Bulk import candidates from an NDJSON or CSV file
+
+    NDJSON has one candidate object per line; CSV has a header row of
+    candidate field names, with skills separated by commas, semicolons or
+    pipes within their cell. The format defaults to the file extension
+    (.ndjson, .jsonl or .csv). Valid rows are inserted even when others fail;
+    every row that was not is reported with its number and reason.
+    """
+    file_format = file_format or import_format(file.filename)
+    if file_format is None:
+        raise HTTPException(status_code=400, detail="Pass format=ndjson or format=csv, or upload a .ndjson, .jsonl or .csv file")
+    return await candidate_import_service.import_file(file.file, file_format)
+
+
+@router.get("/export")
+async def export_candidates(
+    file_format: str = Query("csv", alias="format", pattern=EXPORT_FORMAT_PATTERN),
+    fields: Optional[str] = Query(None, description="Comma-separated columns; all but raw_text by default"),
+    batch_size: int = Query(EXPORT_BATCH_SIZE, ge=1, le=10000)
+):
+    """
+    Export every candidate as CSV, NDJSON or Parquet, newest first
+
+    The file is streamed from a database cursor ``batch_size`` candidates at
+    a time, so exports of any size use the same memory.
+    """
+    try:
+        columns = export_columns(fields)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    chunks = candidate_export_service.open_export(file_format, columns, batch_size)
+    return StreamingResponse(
+        chunks,
+        media_type=EXPORT_MEDIA_TYPES[file_format],
+        headers={"Content-Disposition": f"attachment; filename=candidates.{file_format}"}
+    )
+
+
+@router.post("/bulk-delete", response_model=CandidateCleanupResult)
+async def bulk_delete_candidates(selection: CandidateBulkDelete, background_tasks: BackgroundTasks):
+    """
+    Delete many candidates with their documents, raw text and extra details
+
+    Select candidates by ``ids``, or by any of ``query``, ``skills``,
+    ``location`` and ``created_before`` (all must match). Database rows are
+    removed in batches before the response; upload files are unlinked in
+    the background after it, and ``files`` counts those queued.
+    """
+    result, file_paths = await candidate_cleanup_service.delete_candidates(selection)
+    background_tasks.add_task(remove_files, file_paths)
+    return result
+
+
 @router.get("/{candidate_id}", response_model=CandidateResponse)
 async def get_candidate(
     candidate_id: str,
+    include: Optional[str] = Query(None, pattern=INCLUDE_PATTERN),
     candidate_service: CandidateService = Depends(lambda: CandidateService())
 ):
-    """Get a specific candidate by ID"""
+    """Get a specific candidate by ID; ``include=extra_details`` reads them in the same query"""
+    if include == "extra_details":
+        details = await candidate_service.get_candidate_details(candidate_id)
+        if not details:
+            raise HTTPException(status_code=404, detail="Candidate not found")
+        candidate, _, extra_details = details
+        response = candidate_service.to_response(candidate)
+        response.extra_details = extra_details
+        return response
+
     candidate = await candidate_service.get_candidate(candidate_id)
     if not candidate:
         raise HTTPException(status_code=404, detail="Candidate not found")
     return candidate_service.to_response(candidate)
 
 
+@router.get("/{candidate_id}/raw-text", response_model=dict)
+async def get_candidate_raw_text(
+    candidate_id: str,
+    candidate_service: CandidateService = Depends(lambda: CandidateService())
+):
+    """Get the resume text extracted for a candidate"""
+    raw_text = await candidate_service.get_candidate_raw_text(candidate_id)
+    if raw_text is None:
+        raise HTTPException(status_code=404, detail="Candidate not found")
+    return {"candidate_id": candidate_id, "raw_text": raw_text}
+
+
 @router.put("/{candidate_id}", response_model=CandidateResponse)
 async def update_candidate(
     candidate_id: str,
@@ -121,22 +277,16 @@ async def update_candidate(
 
 
 @router.delete("/{candidate_id}")
-async def delete_candidate(
-    candidate_id: str,
-    candidate_service: CandidateService = Depends(lambda: CandidateService()),
-    document_service: DocumentService = Depends(lambda: DocumentService())
-):
-    """Delete a specific candidate and associated documents"""
-    # First delete associated document if exists
-    document = await document_service.get_document_by_candidate(candidate_id)
-    if document:
-        await document_service.delete_document(str(document.id))
-    
-    # Then delete candidate
-    success = await candidate_service.delete_candidate(candidate_id)
-    if not success:
+async def delete_candidate(candidate_id: str, background_tasks: BackgroundTasks):
+    """Delete a specific candidate with its documents, raw text and extra details"""
+    if not ObjectId.is_valid(candidate_id):
+        raise HTTPException(status_code=404, detail="Candidate not found")
+    result, file_paths = await candidate_cleanup_service.delete_candidates(CandidateBulkDelete(ids=[candidate_id]))
+    if not result.candidates:
         raise HTTPException(status_code=404, detail="Candidate not found")
     
+    # Upload files are unlinked after the response is sent
+    background_tasks.add_task(remove_files, file_paths)
     return Response(status_code=204)
 
 
@@ -179,12 +329,11 @@ async def get_candidate_extra_details(
 ):
     """Get all extra details for a specific candidate"""
     try:
-        # Verify candidate exists
-        candidate = await candidate_service.get_candidate(candidate_id)
-        if not candidate:
+        # The candidate and its extra details are read together, so a missing candidate is a 404
+        extra_details = await candidate_service.find_candidate_extra_details(candidate_id)
+        if extra_details is None:
             raise HTTPException(status_code=404, detail="Candidate not found")
         
-        extra_details = await candidate_service.get_candidate_extra_details(candidate_id)
         return extra_details
         
     except HTTPException:
@@ -322,17 +471,59 @@ async def upload_candidate_document(
 async def search_candidates(
     q: Optional[str] = None,
     skills: Optional[str] = None,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=1000),
+    view: str = Query("full", pattern=VIEW_PATTERN),
     candidate_service: CandidateService = Depends(lambda: CandidateService())
 ):
-    """Search candidates by name, email, or skills"""
+    """
+    Search candidates, most relevant first
+
+    ``q`` matches words in the name, email, skills, summary and resume text;
+    ``skills`` is a comma-separated list of which candidates need at least
+    one. ``view`` works as for the list.
+    """
     skills_list = None
     if skills:
         skills_list = [skill.strip() for skill in skills.split(',') if skill.strip()]
     
-    candidates = await candidate_service.search_candidates(q or "", skills_list)
+    candidates = await candidate_service.search_candidates(
+        q or "", skills_list, summary=view == "summary", skip=skip, limit=limit
+    )
     return [candidate_service.to_response(candidate) for candidate in candidates]
 
 
+@router.get("/search/facets", response_model=CandidateFacetResults)
+async def facet_search_candidates(
+    q: Optional[str] = None,
+    skills: Optional[str] = None,
+    location: Optional[str] = None,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(20, ge=1, le=1000),
+    facet_limit: int = Query(10, ge=1, le=100),
+    candidate_service: CandidateService = Depends(lambda: CandidateService())
+):
+    """
+    Search candidates as ``/search/`` does, with facet counts over every match
+
+    ``facets`` holds the top ``facet_limit`` skills and locations and the
+    experience ranges, each with how many matching candidates have it; pass a
+    location facet's value back as ``location`` to drill down.
+    """
+    skills_list = None
+    if skills:
+        skills_list = [skill.strip() for skill in skills.split(',') if skill.strip()]
+
+    candidates, total, facets = await candidate_service.facet_search(
+        q or "", skills_list, location=location, skip=skip, limit=limit, facet_limit=facet_limit
+    )
+    return CandidateFacetResults(
+        candidates=[candidate_service.to_response(candidate) for candidate in candidates],
+        total=total,
+        facets=facets
+    )
+
+
 @router.post("/{candidate_id}/profile-summary")
 async def generate_profile_summary(
     candidate_id: str,
@@ -349,10 +540,11 @@ async def generate_profile_summary(
     try:
         logger.info(f"Generating profile summary for candidate {candidate_id}")
         
-        # Verify candidate exists
-        candidate = await candidate_service.get_candidate(candidate_id)
-        if not candidate:
+        # Read the candidate with its extra details in one query
+        details = await candidate_service.get_candidate_details(candidate_id)
+        if not details:
             raise HTTPException(status_code=404, detail="Candidate not found")
+        candidate, _, extra_details = details
         
         # Check if LLM service is available
         if not llm_service.is_service_available():
@@ -374,16 +566,12 @@ async def generate_profile_summary(
             "raw_text": candidate.raw_text or ""
         }
         
-        # Get feedback and extra details
-        feedback_data = []
-        try:
-            extra_details = await candidate_service.get_candidate_extra_details(candidate_id)
-            for detail in extra_details:
-                if detail.text_content and detail.text_content.strip():
-                    feedback_data.append(detail.text_content.strip())
-        except Exception as e:
-            logger.warning(f"Could not retrieve extra details for candidate {candidate_id}: {str(e)}")
-            # Continue without feedback data
+        # Feedback and extra details
+        feedback_data = [
+            detail.text_content.strip()
+            for detail in extra_details
+            if detail.text_content and detail.text_content.strip()
+        ]
         
         # Generate profile summary using LLM
         try:
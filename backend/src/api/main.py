@@ -1,18 +1,46 @@
 """
 Main FastAPI application for TalentSync backend
 """
+import asyncio
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
 
+from ..services.candidate_cleanup_service import candidate_cleanup_service
+from ..services.candidate_service import CandidateService
 from ..services.db_service import database_service
+from ..services.match_store_service import match_store_service
+from ..services.resume_search_service import resume_search_service
+from ..services.semantic_index_service import semantic_index_service
+from ..services.skill_index_service import job_skill_index_service, skill_index_service
+from ..services.skill_registry_service import skill_registry_service
 from ..utils.config import config
 from ..utils.logging import logger
+from ..utils.pagination import NEXT_CURSOR_HEADER
 
 from .jobs import router as jobs_router
 from .matching import router as matching_router
+from .matching import candidate_router as candidate_matching_router
 from .candidates import router as candidates_router
 from .documents import router as documents_router
+from .skills import router as skills_router
+
+
+async def build_indexes():
+    """Build the indexes that requests can do without while they are not ready yet"""
+    try:
+        await match_store_service.ensure_built()
+    except Exception as e:
+        logger.error(f"Error building match store: {str(e)}")
+    try:
+        await semantic_index_service.ensure_built()
+    except Exception as e:
+        logger.error(f"Error building semantic index: {str(e)}")
+    try:
+        await resume_search_service.build()
+    except Exception as e:
+        logger.error(f"Error building resume search index: {str(e)}")
 
 
 @asynccontextmanager
@@ -22,11 +50,26 @@ async def lifespan(app: FastAPI):
     logger.info("Starting TalentSync backend...")
     await database_service.connect_to_mongo()
     logger.info("Connected to MongoDB")
-    
+    await CandidateService().ensure_indexes()
+    await skill_registry_service.publish()
+    await skill_index_service.build()
+    await job_skill_index_service.build()
+    # Serve requests while the slower indexes build; reads use live scoring, semantic
+    # matching waits and resume search answers 503 until they are ready
+    indexing = asyncio.create_task(build_indexes())
+    sweeper = None
+    if config.ORPHAN_SWEEP_INTERVAL_SECONDS > 0:
+        sweeper = asyncio.create_task(candidate_cleanup_service.run_sweeper(config.ORPHAN_SWEEP_INTERVAL_SECONDS))
+
     yield
     
     # Shutdown
     logger.info("Shutting down TalentSync backend...")
+    indexing.cancel()
+    if sweeper is not None:
+        sweeper.cancel()
+    await semantic_index_service.close()
+    await resume_search_service.close()
     await database_service.close_mongo_connection()
     logger.info("Disconnected from MongoDB")
 
@@ -46,14 +89,17 @@ app.add_middleware(
     allow_origins=config.CORS_ORIGINS,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER],
 )
 
 # Include routers with API prefix
 api_prefix = "/api"
 app.include_router(jobs_router, prefix=api_prefix)
 app.include_router(matching_router, prefix=api_prefix)
+app.include_router(candidate_matching_router, prefix=api_prefix)
 app.include_router(candidates_router, prefix=api_prefix)
 app.include_router(documents_router, prefix=api_prefix)
+app.include_router(skills_router, prefix=api_prefix)
 
 
 @app.get("/")
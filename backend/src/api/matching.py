@@ -1,21 +1,106 @@
 """
 Candidate matching API routes for TalentSync backend
 """
-from fastapi import APIRouter, HTTPException
-from typing import List
+from datetime import datetime
+from fastapi import APIRouter, HTTPException, Query, Response
+from fastapi.responses import StreamingResponse
+from typing import List, Optional
 
-from ..models.candidate import Candidate
+from ..models.candidate import Candidate, CandidateFilters
+from ..models.job_posting import JobMatch
 from ..services.job_service import job_service
+from ..services.match_cache_service import match_cache_service
 from ..services.matching_service import matching_service
+from ..utils.ndjson import NDJSON_MEDIA_TYPE, ndjson_lines
+from ..utils.pagination import NEXT_CURSOR_HEADER
+from ..utils.scoring import SCORING_MODES, SCORING_PLAIN, SKILL_SCORING_MODES
 
 router = APIRouter(prefix="/jobs", tags=["matching"])
+candidate_router = APIRouter(prefix="/candidates", tags=["matching"])
+
+SCORING_PATTERN = f"^({'|'.join(SCORING_MODES)})$"
+SKILL_SCORING_PATTERN = f"^({'|'.join(SKILL_SCORING_MODES)})$"
+FORMAT_PATTERN = "^(json|ndjson)$"
 
 
 @router.get("/{job_id}/candidates", response_model=List[Candidate])
-async def get_candidates_for_job(job_id: str):
-    """Get candidates matching a job posting"""
+async def get_candidates_for_job(
+    job_id: str,
+    response: Response,
+    limit: Optional[int] = Query(None, ge=1, le=1000),
+    cursor: Optional[str] = None,
+    min_score: Optional[float] = Query(None, ge=0, le=100),
+    scoring: str = Query(SCORING_PLAIN, pattern=SCORING_PATTERN),
+    location: Optional[str] = None,
+    min_experience_years: Optional[float] = Query(None, ge=0),
+    max_experience_years: Optional[float] = Query(None, ge=0),
+    created_after: Optional[datetime] = None,
+    exact: bool = False,
+    response_format: str = Query("json", alias="format", pattern=FORMAT_PATTERN)
+):
+    """
+    Get candidates matching a job posting
+
+    Without ``limit`` every match is returned. With ``limit`` only that many
+    top matches are returned and, if more remain, the ``X-Next-Cursor``
+    response header holds the ``cursor`` for the next page. ``scoring=idf``
+    weights each skill by how rare it is among candidates; ``scoring=semantic``
+    ranks by similarity between the resume text and the job description.
+    ``location``,
+    ``min_experience_years``, ``max_experience_years`` and ``created_after``
+    restrict which candidates are scored at all. Very large pools are
+    shortlisted approximately before scoring; ``exact=true`` scores them all.
+
+    ``format=ndjson`` streams one candidate per line as they are fetched
+    instead of building the whole list, so large result sets start arriving
+    at once and are never held in memory.
+    """
     job = await job_service.get_job_by_id(job_id)
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
     
-    return await matching_service.get_candidates_for_job(job)
\ No newline at end of file
+    read = matching_service.open_candidate_stream if response_format == "ndjson" else matching_service.get_candidate_page
+    try:
+        candidates, next_cursor = await read(
+            job,
+            limit=limit,
+            cursor=cursor,
+            min_score=min_score,
+            scoring=scoring,
+            filters=CandidateFilters(
+                location=location,
+                min_experience_years=min_experience_years,
+                max_experience_years=max_experience_years,
+                created_after=created_after
+            ),
+            exact=exact
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    if response_format == "ndjson":
+        headers = {NEXT_CURSOR_HEADER: next_cursor} if next_cursor else None
+        return StreamingResponse(ndjson_lines(candidates), media_type=NDJSON_MEDIA_TYPE, headers=headers)
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    return candidates
+
+
+@router.get("/match-cache/stats", response_model=dict)
+async def get_match_cache_stats():
+    """Get hit/miss counters and the current size of the match result cache"""
+    return match_cache_service.stats()
+
+
+@candidate_router.get("/{candidate_id}/jobs", response_model=List[JobMatch])
+async def get_jobs_for_candidate(
+    candidate_id: str,
+    limit: Optional[int] = Query(None, ge=1, le=1000),
+    scoring: str = Query(SCORING_PLAIN, pattern=SKILL_SCORING_PATTERN)
+):
+    """Get job postings matching a candidate, best match first"""
+    candidate = await matching_service.candidate_service.get_candidate(candidate_id)
+    if not candidate:
+        raise HTTPException(status_code=404, detail="Candidate not found")
+
+    return await matching_service.get_jobs_for_candidate(candidate, limit=limit, scoring=scoring)
@@ -0,0 +1,25 @@
+"""
+Skill API endpoints for TalentSync backend
+"""
+from typing import List
+
+from fastapi import APIRouter, Query
+
+from ..models.skill import SkillSuggestion
+from ..services.skill_autocomplete_service import skill_autocomplete_service
+
+router = APIRouter(prefix="/skills", tags=["skills"])
+
+
+@router.get("/autocomplete", response_model=List[SkillSuggestion])
+async def autocomplete_skills(
+    q: str = "",
+    limit: int = Query(10, ge=1, le=100)
+):
+    """
+    Complete a typed skill prefix, most used skills first
+
+    Matches the start of the skill name, of any later word in it, or of a
+    known alias. Served from memory; Mongo is not queried.
+    """
+    return skill_autocomplete_service.suggest(q, limit=limit)
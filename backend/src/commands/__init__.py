@@ -0,0 +1,3 @@
+"""
+Maintenance commands for TalentSync backend
+"""
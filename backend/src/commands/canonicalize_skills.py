@@ -0,0 +1,33 @@
+"""
+Backfill canonical skill names into existing candidates and job postings
+
+Usage (from the backend directory):
+    python -m src.commands.canonicalize_skills
+
+Restart the API afterwards so its in-memory skill indexes pick up the
+rewritten skills.
+"""
+import asyncio
+
+from ..services.db_service import database_service
+from ..services.match_store_service import match_store_service
+from ..services.skill_registry_service import skill_registry_service
+from ..utils.logging import logger
+
+
+async def main():
+    """Publish the alias table, rewrite stored skills and rescore every match"""
+    await database_service.connect_to_mongo()
+    try:
+        await skill_registry_service.publish()
+        updated = await skill_registry_service.backfill()
+        if any(updated.values()):
+            await match_store_service.ensure_indexes()
+            rows = await match_store_service.rebuild()
+            logger.info(f"Rebuilt job_candidate_matches with {rows} rows")
+    finally:
+        await database_service.close_mongo_connection()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,82 @@
+"""
+Report every job posting with its top matching candidates
+
+Usage (from the backend directory):
+    python -m src.commands.match_report
+    python -m src.commands.match_report --output report.ndjson --top 20 --workers 8
+    python -m src.commands.match_report --collection job_match_reports --scoring idf
+
+Without --output the report replaces the contents of the given collection
+(``job_match_reports`` by default), one document per job keyed by job id.
+"""
+import argparse
+import asyncio
+import json
+from datetime import datetime
+from pathlib import Path
+from typing import Optional, Sequence
+
+from pymongo import ReplaceOne
+
+from ..services.db_service import database_service, get_database
+from ..services.match_report_service import match_report_service
+from ..utils.logging import logger
+from ..utils.scoring import SCORING_PLAIN, SKILL_SCORING_MODES
+
+# Reports written per bulk_write when streaming into a collection
+WRITE_BATCH_SIZE = 500
+
+
+async def write_ndjson(path: Path, reports, generated_at: datetime) -> int:
+    written = 0
+    with open(path, "w") as output:
+        async for report in reports:
+            output.write(json.dumps({**report, "generated_at": generated_at.isoformat()}) + "\n")
+            written += 1
+    return written
+
+
+async def write_collection(collection_name: str, reports, generated_at: datetime) -> int:
+    collection = get_database()[collection_name]
+    operations = []
+    written = 0
+    async for report in reports:
+        operations.append(ReplaceOne({"_id": report["job_id"]}, {**report, "generated_at": generated_at}, upsert=True))
+        if len(operations) >= WRITE_BATCH_SIZE:
+            await collection.bulk_write(operations, ordered=False)
+            written += len(operations)
+            operations = []
+    if operations:
+        await collection.bulk_write(operations, ordered=False)
+        written += len(operations)
+    # Jobs deleted since the previous run drop out of the report
+    await collection.delete_many({"generated_at": {"$ne": generated_at}})
+    return written
+
+
+async def main(argv: Optional[Sequence[str]] = None):
+    """Score every job against the whole candidate pool and stream out the reports"""
+    parser = argparse.ArgumentParser(description="Report every job posting with its top matching candidates")
+    parser.add_argument("--top", type=int, default=20, help="candidates reported per job")
+    parser.add_argument("--scoring", default=SCORING_PLAIN, choices=SKILL_SCORING_MODES)
+    parser.add_argument("--workers", type=int, default=None, help="scoring processes (default: CPU count)")
+    parser.add_argument("--output", type=Path, default=None, help="write NDJSON to this file instead of a collection")
+    parser.add_argument("--collection", default="job_match_reports", help="collection the report replaces")
+    args = parser.parse_args(argv)
+
+    await database_service.connect_to_mongo()
+    try:
+        generated_at = datetime.utcnow()
+        reports = match_report_service.generate(top_n=args.top, scoring=args.scoring, workers=args.workers)
+        if args.output:
+            written = await write_ndjson(args.output, reports, generated_at)
+            logger.info(f"Wrote {written} job reports to {args.output}")
+        else:
+            written = await write_collection(args.collection, reports, generated_at)
+            logger.info(f"Wrote {written} job reports to {args.collection}")
+    finally:
+        await database_service.close_mongo_connection()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,26 @@
+"""
+Rebuild the precomputed job x candidate match matrix
+
+Usage (from the backend directory):
+    python -m src.commands.rebuild_matches
+"""
+import asyncio
+
+from ..services.db_service import database_service
+from ..services.match_store_service import match_store_service
+from ..utils.logging import logger
+
+
+async def main():
+    """Recompute every stored job/candidate match from scratch"""
+    await database_service.connect_to_mongo()
+    try:
+        await match_store_service.ensure_indexes()
+        rows = await match_store_service.rebuild()
+        logger.info(f"Rebuilt job_candidate_matches with {rows} rows")
+    finally:
+        await database_service.close_mongo_connection()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -2,12 +2,14 @@
 Candidate model for TalentSync backend
 """
 from datetime import datetime
-from typing import Optional, List, Any
+from typing import Optional, List, Any, Dict
 from bson import ObjectId
-from pydantic import BaseModel, Field, EmailStr, field_validator, ConfigDict
+from pydantic import BaseModel, Field, EmailStr, field_validator, model_validator, ConfigDict
 from pydantic_core import core_schema
 import uuid
 
+from ..utils.skills import canonicalize_skills
+
 
 class PyObjectId(ObjectId):
     @classmethod
@@ -78,7 +80,26 @@ class CandidateBase(BaseModel):
     def validate_skills(cls, v):
         if v is not None and len(v) == 0:
             return None  # Allow empty list to be None
-        return [skill.strip() for skill in v if skill.strip()] if v else None
+        return canonicalize_skills(v) if v else None
+
+
+class CandidateFilters(BaseModel):
+    """Structured filters applied to candidates before they are scored against a job"""
+    location: Optional[str] = None
+    min_experience_years: Optional[float] = Field(None, ge=0)
+    max_experience_years: Optional[float] = Field(None, ge=0)
+    created_after: Optional[datetime] = None
+
+    def is_active(self) -> bool:
+        return any(value is not None for value in self.model_dump().values())
+
+
+class SkillMatch(BaseModel):
+    """How one of a job's skills contributed to a match percentage"""
+    skill: str
+    matched: bool
+    weight: float = 1.0
+    contribution: float = 0.0  # Percentage points this skill added to the match
 
 
 class CandidateCreate(CandidateBase):
@@ -98,7 +119,7 @@ class CandidateUpdate(BaseModel):
         if v is not None:
             if len(v) == 0:
                 raise ValueError('At least one skill is required')
-            return [skill.strip() for skill in v if skill.strip()]
+            return canonicalize_skills(v)
         return v
 
 
@@ -109,9 +130,11 @@ class Candidate(CandidateBase):
     updated_at: datetime = Field(default_factory=datetime.utcnow)
     document_id: Optional[PyObjectId] = None
     raw_text: Optional[str] = None  # Store raw extracted text
+    has_raw_text: Optional[bool] = None  # Set by summary reads, which leave raw_text out
     # Legacy fields for backward compatibility
     match_percentage: float = 0.0
     matched_skills: List[str] = []
+    match_explanation: List[SkillMatch] = []
 
     model_config = ConfigDict(
         populate_by_name=True,
@@ -167,4 +190,76 @@ class CandidateResponse(BaseModel):
     updated_at: datetime
     document_id: Optional[str] = None
     raw_text: Optional[str] = None
-    extra_details: Optional[List[CandidateExtraDetailResponse]] = None
\ No newline at end of file
+    has_raw_text: bool = False
+    extra_details: Optional[List[CandidateExtraDetailResponse]] = None
+
+
+class FacetCount(BaseModel):
+    """How many matching candidates share one facet value"""
+    value: str
+    count: int
+
+
+class CandidateFacetResults(BaseModel):
+    """A page of matching candidates with facet counts over all of them"""
+    candidates: List[CandidateResponse]
+    total: int  # Matching candidates, not just this page
+    facets: Dict[str, List[FacetCount]]
+
+
+class ResumeSearchHit(BaseModel):
+    """A candidate found by resume keyword search"""
+    score: float  # BM25 relevance of the resume to the query
+    candidate: CandidateResponse
+
+
+class CandidateImportError(BaseModel):
+    """A row a bulk import could not insert"""
+    row: int  # 1-based line (NDJSON) or data row after the header (CSV)
+    email: Optional[str] = None
+    reason: str  # invalid, duplicate or error
+    detail: str
+
+
+class CandidateImportResult(BaseModel):
+    """Outcome of a bulk candidate import"""
+    inserted: int = 0
+    duplicates: int = 0
+    failed: int = 0  # Rows rejected for any reason other than a duplicate email
+    errors: List[CandidateImportError] = []
+
+
+class CandidateBulkDelete(BaseModel):
+    """Candidates to delete: the listed ids, or every candidate matching all the given filters"""
+    ids: Optional[List[str]] = None
+    query: Optional[str] = None  # Full-text search, as in candidate search
+    skills: Optional[List[str]] = None  # Any of these
+    location: Optional[str] = None
+    created_before: Optional[datetime] = None
+
+    @field_validator('ids')
+    @classmethod
+    def validate_ids(cls, v):
+        if v is not None:
+            invalid = [candidate_id for candidate_id in v if not ObjectId.is_valid(candidate_id)]
+            if invalid:
+                raise ValueError(f'Invalid candidate ids: {", ".join(invalid)}')
+        return v
+
+    @model_validator(mode='after')
+    def validate_selection(self):
+        has_filters = any(value for value in (self.query, self.skills, self.location, self.created_before))
+        if self.ids and has_filters:
+            raise ValueError('Give either ids or filters, not both')
+        if not self.ids and not has_filters:
+            raise ValueError('Give ids or at least one filter')
+        return self
+
+
+class CandidateCleanupResult(BaseModel):
+    """What a bulk delete or orphan sweep removed"""
+    candidates: int = 0
+    documents: int = 0
+    raw_texts: int = 0
+    extra_details: int = 0
+    files: int = 0  # Upload files removed, or queued for removal after a bulk delete
@@ -6,6 +6,8 @@ from typing import List, Optional
 from datetime import datetime, timezone
 import uuid
 
+from .candidate import SkillMatch
+
 
 class JobPostingBase(BaseModel):
     """Base JobPosting model with common fields"""
@@ -48,4 +50,10 @@ class JobPosting(JobPostingBase):
     created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
     updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
 
-    model_config = ConfigDict(from_attributes=True)
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True)
+
+class JobMatch(JobPosting):
+    """JobPosting ranked against a candidate, with match information"""
+    match_percentage: float = 0.0
+    matched_skills: List[str] = []
+    match_explanation: List[SkillMatch] = []
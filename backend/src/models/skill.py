@@ -0,0 +1,11 @@
+"""
+Skill models for TalentSync backend
+"""
+from pydantic import BaseModel
+
+
+class SkillSuggestion(BaseModel):
+    """A skill completing a typed prefix, with how widely it is used"""
+    skill: str
+    candidates: int = 0  # Candidates listing the skill
+    jobs: int = 0  # Job postings asking for it
@@ -0,0 +1,290 @@
+"""
+Bitset scoring service for TalentSync backend
+"""
+import calendar
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+
+from ..models.candidate import CandidateFilters
+from ..utils.experience import parse_experience_years
+
+_WORD_BITS = 64
+_INITIAL_CAPACITY = 1024
+
+# SWAR popcount constants, used when NumPy has no native bitwise_count (< 2.0)
+_M1 = np.uint64(0x5555555555555555)
+_M2 = np.uint64(0x3333333333333333)
+_M4 = np.uint64(0x0F0F0F0F0F0F0F0F)
+
+
+def _fold_bytes(acc: np.ndarray) -> np.ndarray:
+    """Add up the eight per-byte counters packed in each uint64"""
+    return acc.view(np.uint8).reshape(-1, 8).sum(axis=1, dtype=np.int64)
+
+
+def _masked_popcount(
+    bits: np.ndarray,
+    word_indexes: List[int],
+    masks: List[int],
+    columns: Union[slice, np.ndarray],
+    n_candidates: int
+) -> np.ndarray:
+    """
+    Sum popcount(bits[word] & mask) over the selected words of the selected columns
+
+    The SWAR fallback keeps per-byte counts in the accumulator and only folds
+    them into per-candidate totals every 31 words, the most a byte can hold
+    without overflowing.
+    """
+    words = (bits[word_index, columns] for word_index in word_indexes)
+    masks = [np.uint64(mask) for mask in masks]
+    if hasattr(np, "bitwise_count"):
+        total = np.zeros(n_candidates, dtype=np.int64)
+        for word, mask in zip(words, masks):
+            total += np.bitwise_count(word & mask)
+        return total
+
+    total = np.zeros(n_candidates, dtype=np.int64)
+    acc = np.zeros(n_candidates, dtype=np.uint64)
+    x = np.empty(n_candidates, dtype=np.uint64)
+    t = np.empty(n_candidates, dtype=np.uint64)
+    for i, (word, mask) in enumerate(zip(words, masks)):
+        np.bitwise_and(word, mask, out=x)
+        np.right_shift(x, np.uint64(1), out=t)
+        np.bitwise_and(t, _M1, out=t)
+        np.subtract(x, t, out=x)
+        np.right_shift(x, np.uint64(2), out=t)
+        np.bitwise_and(t, _M2, out=t)
+        np.bitwise_and(x, _M2, out=x)
+        np.add(x, t, out=x)
+        np.right_shift(x, np.uint64(4), out=t)
+        np.add(x, t, out=x)
+        np.bitwise_and(x, _M4, out=x)
+        np.add(acc, x, out=acc)
+        if i % 31 == 30:
+            total += _fold_bytes(acc)
+            acc[:] = 0
+    total += _fold_bytes(acc)
+    return total
+
+
+def _epoch_seconds(moment: datetime) -> float:
+    """Seconds since the epoch, treating naive datetimes as UTC like the rest of the backend"""
+    return calendar.timegm(moment.utctimetuple()) + moment.microsecond / 1e6
+
+
+class BitsetScoringService:
+    """
+    Packed skill bit vectors for every candidate
+
+    Each skill in the vocabulary owns one bit; a candidate is a column of
+    uint64 words. Words are stored word-major so that scoring a job, an AND
+    against the job's mask followed by a popcount, only streams through the
+    few words its skills live in.
+
+    Location, experience and creation time are kept alongside as per-row
+    arrays, so structured filters become a row selection applied before any
+    scoring.
+    """
+
+    def __init__(self):
+        self.clear()
+
+    @property
+    def candidate_count(self) -> int:
+        return len(self._rows)
+
+    @property
+    def vocabulary_size(self) -> int:
+        return len(self._vocabulary)
+
+    def clear(self):
+        """Drop every candidate and the vocabulary"""
+        self._vocabulary: Dict[str, int] = {}
+        self._bits = np.zeros((1, _INITIAL_CAPACITY), dtype=np.uint64)
+        self._locations: Dict[str, int] = {}
+        self._location_codes = np.full(_INITIAL_CAPACITY, -1, dtype=np.int32)
+        self._experience_years = np.full(_INITIAL_CAPACITY, np.nan)
+        self._created_at = np.full(_INITIAL_CAPACITY, np.nan)
+        self._row_ids: List[Optional[str]] = []
+        self._rows: Dict[str, int] = {}
+        self._free_rows: List[int] = []
+
+    def _skill_bit(self, skill: str) -> int:
+        bit = self._vocabulary.get(skill)
+        if bit is None:
+            bit = len(self._vocabulary)
+            self._vocabulary[skill] = bit
+            if bit // _WORD_BITS >= self._bits.shape[0]:
+                self._bits = np.vstack([self._bits, np.zeros_like(self._bits)])
+        return bit
+
+    def _allocate_row(self, candidate_id: str) -> int:
+        if self._free_rows:
+            row = self._free_rows.pop()
+            self._row_ids[row] = candidate_id
+        else:
+            row = len(self._row_ids)
+            self._row_ids.append(candidate_id)
+            if row >= self._bits.shape[1]:
+                self._bits = np.hstack([self._bits, np.zeros_like(self._bits)])
+                self._location_codes = np.concatenate([self._location_codes, np.full_like(self._location_codes, -1)])
+                self._experience_years = np.concatenate([self._experience_years, np.full_like(self._experience_years, np.nan)])
+                self._created_at = np.concatenate([self._created_at, np.full_like(self._created_at, np.nan)])
+        self._rows[candidate_id] = row
+        return row
+
+    def set_candidate(
+        self,
+        candidate_id: str,
+        skills: Optional[Iterable[str]],
+        attributes: Optional[Dict[str, Any]] = None
+    ):
+        """Encode (or re-encode) a candidate's skills as a bit vector, with its filterable attributes"""
+        row = self._rows.get(candidate_id)
+        if row is None:
+            row = self._allocate_row(candidate_id)
+
+        # Resolve bits first: a new skill may widen the matrix
+        bits = [self._skill_bit(skill) for skill in set(skills or [])]
+        self._bits[:, row] = 0
+        for bit in bits:
+            self._bits[bit // _WORD_BITS, row] |= np.uint64(1 << (bit % _WORD_BITS))
+
+        attributes = attributes or {}
+        location = (attributes.get("location") or "").strip().lower()
+        self._location_codes[row] = self._locations.setdefault(location, len(self._locations)) if location else -1
+        experience_years = parse_experience_years(attributes.get("experience"))
+        self._experience_years[row] = np.nan if experience_years is None else experience_years
+        created_at = attributes.get("created_at")
+        self._created_at[row] = _epoch_seconds(created_at) if isinstance(created_at, datetime) else np.nan
+
+    def remove_candidate(self, candidate_id: str):
+        """Clear a candidate's row and make it reusable"""
+        row = self._rows.pop(candidate_id, None)
+        if row is None:
+            return
+        self._bits[:, row] = 0
+        self._location_codes[row] = -1
+        self._experience_years[row] = np.nan
+        self._created_at[row] = np.nan
+        self._row_ids[row] = None
+        self._free_rows.append(row)
+
+    def filter_rows(self, filters: Optional[CandidateFilters]) -> Optional[np.ndarray]:
+        """
+        Select the rows passing the given filters, or None when nothing is filtered
+
+        Location matches case-insensitively anywhere in the stored location.
+        Candidates whose experience or creation time is unknown fail the
+        filters on them.
+        """
+        if filters is None or not filters.is_active():
+            return None
+
+        row_count = len(self._row_ids)
+        keep = np.ones(row_count, dtype=bool)
+        if filters.location:
+            needle = filters.location.strip().lower()
+            codes = [code for location, code in self._locations.items() if needle in location]
+            keep &= np.isin(self._location_codes[:row_count], codes)
+        experience_years = self._experience_years[:row_count]
+        if filters.min_experience_years is not None:
+            keep &= experience_years >= filters.min_experience_years
+        if filters.max_experience_years is not None:
+            keep &= experience_years <= filters.max_experience_years
+        if filters.created_after is not None:
+            keep &= self._created_at[:row_count] >= _epoch_seconds(filters.created_after)
+        return np.flatnonzero(keep)
+
+    def row_of(self, candidate_id: str) -> Optional[int]:
+        """Get the row a candidate is stored in"""
+        return self._rows.get(candidate_id)
+
+    def row_ids(self, rows: np.ndarray) -> List[str]:
+        """Get the candidate ids of the given rows"""
+        return [self._row_ids[row] for row in rows.tolist()]
+
+    def _job_mask(self, skills: Iterable[str]) -> Dict[int, int]:
+        """Build the job's mask over only the words that contain one of its skills"""
+        words: Dict[int, int] = {}
+        for skill in skills:
+            bit = self._vocabulary.get(skill)
+            if bit is None:
+                continue
+            word = bit // _WORD_BITS
+            words[word] = words.get(word, 0) | (1 << (bit % _WORD_BITS))
+        return words
+
+    def _columns(self, rows: Optional[np.ndarray]) -> Tuple[Union[slice, np.ndarray], int]:
+        if rows is None:
+            return slice(0, len(self._row_ids)), len(self._row_ids)
+        return rows, len(rows)
+
+    def score(self, skills: Iterable[str], rows: Optional[np.ndarray] = None) -> np.ndarray:
+        """Number of the given skills held by each row (or each selected row), as one vectorized popcount-of-AND"""
+        words = self._job_mask(skills)
+        columns, row_count = self._columns(rows)
+        if row_count == 0 or not words:
+            return np.zeros(row_count, dtype=np.int64)
+        return _masked_popcount(self._bits, list(words), list(words.values()), columns, row_count)
+
+    def weighted_score(self, weights: Dict[str, float], rows: Optional[np.ndarray] = None) -> np.ndarray:
+        """Summed weight of the given skills held by each row (or each selected row)"""
+        columns, row_count = self._columns(rows)
+        total = np.zeros(row_count, dtype=np.float64)
+        held = np.empty(row_count, dtype=np.uint64)
+        for skill, weight in weights.items():
+            bit = self._vocabulary.get(skill)
+            if bit is None:
+                continue
+            np.right_shift(self._bits[bit // _WORD_BITS, columns], np.uint64(bit % _WORD_BITS), out=held)
+            np.bitwise_and(held, np.uint64(1), out=held)
+            total += held * weight
+        return total
+
+    def match(
+        self,
+        skills: List[str],
+        threshold: float,
+        weights: Optional[Dict[str, float]] = None,
+        rows: Optional[np.ndarray] = None
+    ) -> Tuple[List[str], np.ndarray]:
+        """
+        Score every candidate, or only the selected rows, against a job's skills
+
+        Returns the ids of candidates whose match percentage is strictly above
+        ``threshold`` together with their percentages, in row order. With
+        ``weights`` the percentage is the share of the job's total skill weight
+        matched instead of the share of its skills.
+        """
+        if not skills:
+            return [], np.zeros(0, dtype=np.float64)
+
+        if weights is not None:
+            percentages = self.weighted_score(weights, rows) * (100 / sum(weights[skill] for skill in skills))
+            hits = np.flatnonzero(percentages > threshold)
+            percentages = percentages[hits]
+        else:
+            counts = self.score(skills, rows)
+            # Integer comparison keeps the threshold exact (1 of 5 skills is not > 20%)
+            hits = np.flatnonzero(counts * 100 > threshold * len(skills))
+            percentages = (counts[hits] / len(skills)) * 100
+
+        if rows is not None:
+            hits = rows[hits]
+        return [self._row_ids[row] for row in hits], percentages
+
+    def matched_skills(self, candidate_id: str, skills: Iterable[str]) -> List[str]:
+        """Decode which of the given skills are set in a candidate's row"""
+        row = self._rows.get(candidate_id)
+        if row is None:
+            return []
+        matched = []
+        for skill in skills:
+            bit = self._vocabulary.get(skill)
+            if bit is not None and int(self._bits[bit // _WORD_BITS, row]) >> (bit % _WORD_BITS) & 1:
+                matched.append(skill)
+        return matched
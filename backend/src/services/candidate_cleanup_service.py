@@ -0,0 +1,183 @@
+"""
+Candidate cleanup service for TalentSync backend
+"""
+import asyncio
+import os
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Tuple
+
+from bson import ObjectId
+
+from ..models.candidate import CandidateBulkDelete, CandidateCleanupResult
+from ..services.candidate_service import CandidateService
+from ..services.db_service import get_database
+from ..services.document_service import remove_files
+from ..services.match_store_service import match_store_service
+from ..services.resume_search_service import resume_search_service
+from ..services.semantic_index_service import semantic_index_service
+from ..services.skill_index_service import skill_index_service
+from ..utils.config import config
+from ..utils.logging import logger
+
+# Candidates removed per round of delete_many calls
+DELETE_BATCH_SIZE = 1000
+
+# Upload files younger than this are left alone by the sweeper: a file is
+# written before its document record, so a new one may not be referenced yet
+ORPHAN_FILE_MIN_AGE_SECONDS = 3600
+
+# Collections holding per-candidate artifacts, keyed by their candidate_id field
+_ARTIFACT_COLLECTIONS = {
+    "documents": "documents",
+    "raw_texts": "raw_text_data",
+    "extra_details": "candidate_extra_details"
+}
+
+
+class CandidateCleanupService:
+    """
+    Cascading candidate deletes and a sweeper for artifacts they left behind
+
+    A bulk delete removes candidates DELETE_BATCH_SIZE at a time: one
+    delete_many per collection per batch, candidates first, so an interrupted
+    delete leaves orphaned artifacts for the sweeper rather than candidates
+    missing their documents. Upload files are only collected, for the caller
+    to unlink in the background once the response is sent.
+    """
+
+    def __init__(self):
+        self._db = None
+        self.candidate_service = CandidateService()
+
+    @property
+    def db(self):
+        if self._db is None:
+            self._db = get_database()
+        return self._db
+
+    @staticmethod
+    def selection_filter(selection: CandidateBulkDelete) -> Dict[str, Any]:
+        """Mongo filter for the candidates a bulk delete selects"""
+        if selection.ids:
+            return {"_id": {"$in": [ObjectId(candidate_id) for candidate_id in selection.ids]}}
+        candidate_filter = CandidateService.search_filter(selection.query, selection.skills, selection.location)
+        if selection.created_before:
+            candidate_filter["created_at"] = {"$lt": selection.created_before}
+        if not candidate_filter:
+            raise ValueError("Refusing to delete candidates without ids or a filter")
+        return candidate_filter
+
+    async def delete_candidates(self, selection: CandidateBulkDelete) -> Tuple[CandidateCleanupResult, List[str]]:
+        """
+        Delete the selected candidates with all their artifacts
+
+        Returns the counts removed and the upload file paths left to unlink.
+        """
+        query = self.selection_filter(selection)
+        result = CandidateCleanupResult()
+        file_paths: List[str] = []
+        batch: List[ObjectId] = []
+        cursor = self.candidate_service.collection.find(query, {"_id": 1}).batch_size(DELETE_BATCH_SIZE)
+        async for document in cursor:
+            batch.append(document["_id"])
+            if len(batch) >= DELETE_BATCH_SIZE:
+                await self._delete_batch(batch, result, file_paths)
+                batch = []
+        if batch:
+            await self._delete_batch(batch, result, file_paths)
+        result.files = len(file_paths)
+        return result, file_paths
+
+    async def _delete_batch(self, object_ids: List[ObjectId], result: CandidateCleanupResult, file_paths: List[str]):
+        deleted = await self.candidate_service.collection.delete_many({"_id": {"$in": object_ids}})
+        result.candidates += deleted.deleted_count
+        file_paths += await self._delete_artifacts(object_ids, result)
+
+        candidate_ids = [str(object_id) for object_id in object_ids]
+        for candidate_id in candidate_ids:
+            skill_index_service.remove_entry(candidate_id)
+            resume_search_service.remove_document(candidate_id)
+        semantic_index_service.remove_documents(candidate_ids)
+        await match_store_service.remove_candidates(object_ids)
+
+    async def _delete_artifacts(self, candidate_ids: List[Any], result: CandidateCleanupResult) -> List[str]:
+        """Delete every artifact of some candidates, returning the upload files their documents pointed at"""
+        artifact_filter = {"candidate_id": {"$in": candidate_ids}}
+        file_paths = [
+            document["raw_file_path"]
+            async for document in self.db.documents.find(artifact_filter, {"raw_file_path": 1})
+            if document.get("raw_file_path")
+        ]
+        for field, collection_name in _ARTIFACT_COLLECTIONS.items():
+            deleted = await self.db[collection_name].delete_many(artifact_filter)
+            setattr(result, field, getattr(result, field) + deleted.deleted_count)
+        return file_paths
+
+    async def _orphaned_candidate_ids(self, collection_name: str) -> List[Any]:
+        """Distinct candidate_ids in an artifact collection that match no candidate"""
+        pipeline = [
+            {"$group": {"_id": "$candidate_id"}},
+            {"$lookup": {"from": "candidates", "localField": "_id", "foreignField": "_id", "as": "candidate"}},
+            {"$match": {"candidate": {"$size": 0}}},
+            {"$project": {"_id": 1}}
+        ]
+        cursor = self.db[collection_name].aggregate(pipeline, allowDiskUse=True)
+        return [document["_id"] async for document in cursor]
+
+    async def sweep_orphans(self) -> CandidateCleanupResult:
+        """Remove artifacts and upload files whose candidate no longer exists"""
+        result = CandidateCleanupResult()
+        orphaned = set()
+        for collection_name in _ARTIFACT_COLLECTIONS.values():
+            orphaned.update(await self._orphaned_candidate_ids(collection_name))
+        orphaned = list(orphaned)
+        file_paths = []
+        for start in range(0, len(orphaned), DELETE_BATCH_SIZE):
+            file_paths += await self._delete_artifacts(orphaned[start:start + DELETE_BATCH_SIZE], result)
+        result.files = await asyncio.to_thread(remove_files, file_paths)
+        result.files += await self._sweep_upload_files()
+        return result
+
+    async def _sweep_upload_files(self) -> int:
+        """Unlink old upload files that no document refers to"""
+        cutoff = time.time() - ORPHAN_FILE_MIN_AGE_SECONDS
+        old_files = await asyncio.to_thread(self._old_upload_files, cutoff)
+        if not old_files:
+            return 0
+        # Older documents store paths relative to the working directory, so compare absolute ones
+        referenced = {
+            os.path.abspath(document["raw_file_path"])
+            async for document in self.db.documents.find({}, {"_id": 0, "raw_file_path": 1})
+            if document.get("raw_file_path")
+        }
+        return await asyncio.to_thread(remove_files, [path for path in old_files if path not in referenced])
+
+    @staticmethod
+    def _old_upload_files(cutoff: float) -> List[str]:
+        """Absolute paths of upload files last modified before cutoff"""
+        files = []
+        for directory, _, filenames in os.walk(os.path.abspath(config.UPLOAD_DIR)):
+            for filename in filenames:
+                path = os.path.join(directory, filename)
+                try:
+                    if os.path.getmtime(path) < cutoff:
+                        files.append(path)
+                except OSError:
+                    continue
+        return files
+
+    async def run_sweeper(self, interval_seconds: int = config.ORPHAN_SWEEP_INTERVAL_SECONDS):
+        """Sweep orphans every interval until cancelled"""
+        while True:
+            await asyncio.sleep(interval_seconds)
+            try:
+                started = datetime.utcnow()
+                result = await self.sweep_orphans()
+                logger.info(f"Orphan sweep finished in {(datetime.utcnow() - started).total_seconds():.1f}s: {result.model_dump()}")
+            except Exception as e:
+                logger.error(f"Orphan sweep failed: {str(e)}")
+
+
+# Global candidate cleanup instance
+candidate_cleanup_service = CandidateCleanupService()
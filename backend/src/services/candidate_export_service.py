@@ -0,0 +1,193 @@
+"""
+Streaming candidate export service for TalentSync backend
+"""
+import csv
+import io
+import json
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+from bson import ObjectId
+from fastapi import HTTPException
+
+from ..services.candidate_service import PAGE_SORT, CandidateService
+from ..utils.ndjson import NDJSON_MEDIA_TYPE
+
+# Documents per cursor batch, and so per chunk of output
+EXPORT_BATCH_SIZE = 1000
+
+EXPORT_FORMAT_PATTERN = "^(csv|ndjson|parquet)$"
+EXPORT_MEDIA_TYPES = {
+    "csv": "text/csv",
+    "ndjson": NDJSON_MEDIA_TYPE,
+    "parquet": "application/vnd.apache.parquet"
+}
+
+# Every exportable column, in output order; resume text is left out unless asked for
+EXPORT_COLUMNS = [
+    "id", "name", "email", "phone", "skills", "experience", "location", "education", "summary",
+    "created_at", "updated_at", "document_id", "raw_text"
+]
+DEFAULT_EXPORT_COLUMNS = [column for column in EXPORT_COLUMNS if column != "raw_text"]
+
+_LIST_COLUMNS = {"skills"}
+_DATETIME_COLUMNS = {"created_at", "updated_at"}
+
+
+def export_columns(fields: Optional[str]) -> List[str]:
+    """Columns named in a comma-separated list, in export order; raises ValueError for unknown names"""
+    if not fields:
+        return DEFAULT_EXPORT_COLUMNS
+    requested = {field.strip() for field in fields.split(",") if field.strip()}
+    unknown = requested.difference(EXPORT_COLUMNS)
+    if unknown:
+        raise ValueError(f"Unknown export fields: {', '.join(sorted(unknown))}")
+    if not requested:
+        raise ValueError("No export fields given")
+    return [column for column in EXPORT_COLUMNS if column in requested]
+
+
+def _row(document: Dict[str, Any], columns: List[str]) -> Dict[str, Any]:
+    row = {}
+    for column in columns:
+        value = document.get("_id" if column == "id" else column)
+        row[column] = str(value) if isinstance(value, ObjectId) else value
+    return row
+
+
+def _csv_value(value: Any) -> Any:
+    if value is None:
+        return ""
+    if isinstance(value, list):
+        return ", ".join(str(item) for item in value)
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def _json_default(value: Any) -> str:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
+
+
+class _ChunkSink:
+    """Write-only file that hands back the bytes written since it was last drained"""
+
+    def __init__(self):
+        self._chunks: List[bytes] = []
+        self._position = 0
+        self.closed = False
+
+    def write(self, data) -> int:
+        data = bytes(data)
+        self._chunks.append(data)
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        # Parquet records row group offsets from this, so it counts everything ever written
+        return self._position
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+class CandidateExportService:
+    """
+    Candidate export streamed straight from a Motor cursor
+
+    Documents are read newest first in cursor batches of ``batch_size`` with
+    only the requested columns projected, and each batch is written out as
+    a chunk of CSV lines, NDJSON lines or one Parquet row group before the
+    next is read, so memory use depends on the batch size, not on how many
+    candidates there are.
+    """
+
+    def __init__(self):
+        self.candidate_service = CandidateService()
+
+    def open_export(
+        self,
+        file_format: str,
+        columns: Optional[List[str]] = None,
+        batch_size: int = EXPORT_BATCH_SIZE
+    ) -> AsyncIterator[bytes]:
+        """Start an export; fails here rather than mid-stream when the format cannot be written"""
+        columns = columns or DEFAULT_EXPORT_COLUMNS
+        if file_format == "csv":
+            return self._csv_chunks(columns, batch_size)
+        if file_format == "ndjson":
+            return self._ndjson_chunks(columns, batch_size)
+        if file_format == "parquet":
+            try:
+                import pyarrow  # noqa: F401 - only Parquet exports need it
+            except ImportError:
+                raise HTTPException(status_code=501, detail="Parquet export requires pyarrow to be installed")
+            return self._parquet_chunks(columns, batch_size)
+        raise ValueError(f"Unsupported export format: {file_format}")
+
+    async def _batches(self, columns: List[str], batch_size: int) -> AsyncIterator[List[Dict[str, Any]]]:
+        projection = {column: 1 for column in columns if column != "id"}
+        if "id" not in columns:
+            projection["_id"] = 0
+        cursor = self.candidate_service.collection.find({}, projection).sort(PAGE_SORT).batch_size(batch_size)
+        batch = []
+        async for document in cursor:
+            batch.append(_row(document, columns))
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    async def _csv_chunks(self, columns: List[str], batch_size: int) -> AsyncIterator[bytes]:
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(columns)
+        async for batch in self._batches(columns, batch_size):
+            writer.writerows([_csv_value(row[column]) for column in columns] for row in batch)
+            yield buffer.getvalue().encode()
+            buffer.seek(0)
+            buffer.truncate()
+        if buffer.tell():
+            # No candidates: still send the header
+            yield buffer.getvalue().encode()
+
+    async def _ndjson_chunks(self, columns: List[str], batch_size: int) -> AsyncIterator[bytes]:
+        async for batch in self._batches(columns, batch_size):
+            yield "".join(json.dumps(row, default=_json_default) + "\n" for row in batch).encode()
+
+    async def _parquet_chunks(self, columns: List[str], batch_size: int) -> AsyncIterator[bytes]:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        def column_type(column: str):
+            if column in _LIST_COLUMNS:
+                return pa.list_(pa.string())
+            if column in _DATETIME_COLUMNS:
+                return pa.timestamp("ms")
+            return pa.string()
+
+        schema = pa.schema([(column, column_type(column)) for column in columns])
+        sink = _ChunkSink()
+        writer = pq.ParquetWriter(pa.PythonFile(sink, mode="w"), schema)
+        try:
+            async for batch in self._batches(columns, batch_size):
+                writer.write_table(pa.Table.from_pylist(batch, schema=schema))
+                yield sink.drain()
+        finally:
+            writer.close()
+        yield sink.drain()
+
+
+# Global candidate export instance
+candidate_export_service = CandidateExportService()
@@ -0,0 +1,176 @@
+"""
+Bulk candidate import service for TalentSync backend
+"""
+import csv
+import json
+import re
+from datetime import datetime
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Tuple
+
+from pydantic import ValidationError
+from pymongo.errors import BulkWriteError
+
+from ..models.candidate import CandidateCreate, CandidateImportError, CandidateImportResult
+from ..services.candidate_service import CandidateService
+from ..services.match_store_service import match_store_service
+from ..services.semantic_index_service import semantic_index_service
+from ..services.skill_index_service import skill_index_service
+from ..utils.text_features import candidate_text
+
+# Rows validated together and written per unordered insert_many
+IMPORT_BATCH_SIZE = 1000
+
+IMPORT_FORMATS = ("ndjson", "csv")
+IMPORT_FORMAT_PATTERN = "^(ndjson|csv)$"
+_EXTENSION_FORMATS = {"ndjson": "ndjson", "jsonl": "ndjson", "csv": "csv"}
+
+# Separators between skills in a CSV cell
+_CSV_SKILL_SEPARATOR = re.compile(r"[,;|]")
+
+_DUPLICATE_KEY = 11000
+
+# (row number, parsed row or None, parse error or None)
+ParsedRow = Tuple[int, Optional[Dict[str, Any]], Optional[str]]
+
+
+def import_format(filename: Optional[str]) -> Optional[str]:
+    """Import format implied by a file's extension, if any"""
+    extension = (filename or "").rsplit(".", 1)[-1].lower()
+    return _EXTENSION_FORMATS.get(extension)
+
+
+def ndjson_rows(file: BinaryIO) -> Iterator[ParsedRow]:
+    """Parse one JSON object per line, numbering rows by line and skipping blank lines"""
+    for number, line in enumerate(file, 1):
+        try:
+            line = line.decode("utf-8-sig").strip()
+            if not line:
+                continue
+            data = json.loads(line)
+        except ValueError as e:
+            yield number, None, f"Invalid JSON: {e}"
+            continue
+        if not isinstance(data, dict):
+            yield number, None, "Each line must be a JSON object"
+            continue
+        yield number, data, None
+
+
+def csv_rows(file: BinaryIO) -> Iterator[ParsedRow]:
+    """Parse CSV with a header row of candidate field names; skills cells hold a separated list"""
+    reader = csv.reader(line.decode("utf-8-sig") for line in file)
+    header = [column.strip().lower() for column in next(reader, [])]
+    for number, values in enumerate(reader, 1):
+        if not any(value.strip() for value in values):
+            continue
+        if len(values) > len(header):
+            yield number, None, f"Expected at most {len(header)} columns, got {len(values)}"
+            continue
+        data = {column: value.strip() or None for column, value in zip(header, values) if column}
+        if data.get("skills"):
+            data["skills"] = [skill.strip() for skill in _CSV_SKILL_SEPARATOR.split(data["skills"]) if skill.strip()]
+        yield number, data, None
+
+
+def _validation_detail(error: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(part) for part in item['loc']) or 'row'}: {item['msg']}" for item in error.errors()
+    )
+
+
+class CandidateImportService:
+    """
+    Bulk candidate import from NDJSON or CSV files
+
+    Rows are parsed lazily from the (disk-spooled) upload and validated
+    IMPORT_BATCH_SIZE at a time; each batch of valid rows is one unordered
+    insert_many, so a duplicate email rejected by the unique index fails its
+    own row while the rest of the batch is still inserted.
+    """
+
+    def __init__(self):
+        self.candidate_service = CandidateService()
+
+    async def import_file(self, file: BinaryIO, file_format: str, batch_size: int = IMPORT_BATCH_SIZE) -> CandidateImportResult:
+        """Import every row of a file, reporting each row that was not inserted"""
+        if file_format not in IMPORT_FORMATS:
+            raise ValueError(f"Unsupported import format: {file_format}")
+        rows = ndjson_rows(file) if file_format == "ndjson" else csv_rows(file)
+        result = CandidateImportResult()
+        batch: List[ParsedRow] = []
+        last_row = 0
+        try:
+            for row in rows:
+                last_row = row[0]
+                batch.append(row)
+                if len(batch) >= batch_size:
+                    await self._import_batch(batch, result)
+                    batch = []
+        except (UnicodeDecodeError, csv.Error) as e:
+            # Rows already read still count; nothing after an unreadable one can be trusted
+            self._reject(result, last_row + 1, None, "invalid", f"Could not read the rest of the file: {str(e)}")
+        if batch:
+            await self._import_batch(batch, result)
+        result.errors.sort(key=lambda error: error.row)
+        return result
+
+    async def _import_batch(self, batch: List[ParsedRow], result: CandidateImportResult):
+        documents, row_numbers = [], []
+        now = datetime.utcnow()
+        for row, data, error in batch:
+            if error is None:
+                try:
+                    candidate = CandidateCreate.model_validate(data)
+                except ValidationError as e:
+                    error = _validation_detail(e)
+            if error is not None:
+                email = data.get("email") if data else None
+                self._reject(result, row, email if isinstance(email, str) else None, "invalid", error)
+                continue
+            document = candidate.model_dump()
+            document["created_at"] = now
+            document["updated_at"] = now
+            documents.append(document)
+            row_numbers.append(row)
+        if not documents:
+            return
+
+        write_errors: Dict[int, dict] = {}
+        try:
+            await self.candidate_service.collection.insert_many(documents, ordered=False)
+        except BulkWriteError as e:
+            write_errors = {write_error["index"]: write_error for write_error in e.details.get("writeErrors", [])}
+        except Exception as e:
+            for row, document in zip(row_numbers, documents):
+                self._reject(result, row, document.get("email"), "error", f"Error inserting candidate: {str(e)}")
+            return
+
+        inserted = []
+        for index, (row, document) in enumerate(zip(row_numbers, documents)):
+            write_error = write_errors.get(index)
+            if write_error is None:
+                inserted.append(document)
+            elif write_error.get("code") == _DUPLICATE_KEY:
+                self._reject(result, row, document.get("email"), "duplicate", "Email already exists")
+            else:
+                self._reject(result, row, document.get("email"), "error", write_error.get("errmsg", "Write failed"))
+
+        result.inserted += len(inserted)
+        for document in inserted:
+            skill_index_service.add_entry(str(document["_id"]), document.get("skills"), document)
+        semantic_index_service.add_documents(
+            (str(document["_id"]), candidate_text(document), document["updated_at"]) for document in inserted
+        )
+        await match_store_service.add_candidates((str(document["_id"]), document.get("skills")) for document in inserted)
+
+    @staticmethod
+    def _reject(result: CandidateImportResult, row: int, email: Optional[str], reason: str, detail: str):
+        if reason == "duplicate":
+            result.duplicates += 1
+        else:
+            result.failed += 1
+        result.errors.append(CandidateImportError(row=row, email=email, reason=reason, detail=detail))
+
+
+# Global candidate import instance
+candidate_import_service = CandidateImportService()
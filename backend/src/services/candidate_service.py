@@ -2,18 +2,70 @@
 Candidate service for TalentSync backend
 """
 from datetime import datetime
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 from bson import ObjectId
+from bson.errors import InvalidId
+from pymongo import ASCENDING, DESCENDING, TEXT
 from pymongo.errors import DuplicateKeyError
 from fastapi import HTTPException, UploadFile
 import io
 
 from ..models.candidate import (Candidate, CandidateCreate, CandidateUpdate, CandidateResponse, 
                                CandidateLLMCreate, CandidateExtraDetail, CandidateExtraDetailCreate,
-                               CandidateExtraDetailResponse)
-from ..models.document import RawTextData
+                               CandidateExtraDetailResponse, FacetCount)
+from ..models.document import Document, RawTextData
 from ..services.db_service import get_database
 from ..services.file_parsing_service import FileParsingService
+from ..services.match_store_service import match_store_service
+from ..services.resume_search_service import resume_search_service
+from ..services.semantic_index_service import semantic_index_service
+from ..services.skill_index_service import skill_index_service
+from ..utils.experience import YEARS_REGEX
+from ..utils.pagination import decode_cursor, encode_cursor
+from ..utils.skills import canonicalize_skills
+from ..utils.text_features import candidate_text
+
+# Newest first; _id breaks created_at ties so the order is total
+PAGE_SORT = [("created_at", DESCENDING), ("_id", DESCENDING)]
+
+# Text index behind search; a match in the name or email outranks one deep in a resume
+SEARCH_INDEX_NAME = "candidate_text_search"
+SEARCH_FIELD_WEIGHTS = {"name": 10, "email": 10, "skills": 5, "summary": 2, "raw_text": 1}
+
+# Lower bounds of the experience facet's buckets in years, and the bucket of candidates stating none
+EXPERIENCE_FACET_BOUNDARIES = [0, 2, 5, 10, 20]
+UNKNOWN_EXPERIENCE = "unknown"
+
+# Years stated in the free-text experience field, as parse_experience_years reads them
+_EXPERIENCE_YEARS = {"$let": {
+    "vars": {"found": {"$regexFind": {"input": "$experience", "regex": YEARS_REGEX, "options": "i"}}},
+    "in": {"$toDouble": {"$arrayElemAt": ["$$found.captures", 0]}}
+}}
+
+# Summary reads fetch only what a CandidateResponse shows, minus the resume text
+SUMMARY_PROJECTION = {
+    **{field: 1 for field in CandidateResponse.model_fields if field not in ("id", "raw_text", "has_raw_text", "extra_details")},
+    "has_raw_text": {"$gt": [{"$strLenBytes": {"$ifNull": ["$raw_text", ""]}}, 0]}
+}
+
+# Joins a candidate's extra details, newest first, on their candidate_id index
+EXTRA_DETAILS_LOOKUP = {"$lookup": {
+    "from": "candidate_extra_details",
+    "localField": "_id",
+    "foreignField": "candidate_id",
+    "pipeline": [{"$sort": {"created_at": -1}}],
+    "as": "extra_details"
+}}
+
+
+def _experience_label(lower_bound) -> str:
+    """Name of the experience facet bucket starting at a boundary"""
+    if lower_bound == UNKNOWN_EXPERIENCE:
+        return UNKNOWN_EXPERIENCE
+    index = EXPERIENCE_FACET_BOUNDARIES.index(lower_bound)
+    if index + 1 == len(EXPERIENCE_FACET_BOUNDARIES):
+        return f"{lower_bound}+ years"
+    return f"{lower_bound}-{EXPERIENCE_FACET_BOUNDARIES[index + 1]} years"
 
 
 class CandidateService:
@@ -54,6 +106,9 @@ class CandidateService:
                 candidate_dict['document_id'] = ObjectId(document_id)
             
             result = await self.collection.insert_one(candidate_dict)
+            skill_index_service.add_entry(str(result.inserted_id), candidate_dict.get('skills'), candidate_dict)
+            semantic_index_service.add_document(str(result.inserted_id), candidate_text(candidate_dict), candidate_dict['updated_at'])
+            await match_store_service.refresh_candidate(str(result.inserted_id), candidate_dict.get('skills'))
             return str(result.inserted_id)
         except DuplicateKeyError:
             raise HTTPException(status_code=400, detail="Email already exists")
@@ -70,10 +125,81 @@ class CandidateService:
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"Error retrieving candidate: {str(e)}")
 
-    async def get_candidates(self, skip: int = 0, limit: int = 100) -> List[Candidate]:
-        """Get all candidates with pagination"""
+    async def get_candidate_details(
+        self,
+        candidate_id: str,
+        summary: bool = False
+    ) -> Optional[Tuple[Candidate, List[Document], List[CandidateExtraDetailResponse]]]:
+        """
+        Get a candidate with its documents and extra details in one aggregation
+
+        The candidate is matched by _id and both related collections are
+        joined with $lookup on their candidate_id indexes, so a full view is
+        a single round trip. Extra details come newest first.
+        """
         try:
-            cursor = self.collection.find().skip(skip).limit(limit).sort("created_at", -1)
+            candidate_object_id = ObjectId(candidate_id)
+        except (InvalidId, TypeError):
+            return None
+        pipeline = [{"$match": {"_id": candidate_object_id}}]
+        if summary:
+            pipeline.append({"$project": SUMMARY_PROJECTION})
+        pipeline += [
+            {"$lookup": {
+                "from": "documents",
+                "localField": "_id",
+                "foreignField": "candidate_id",
+                "as": "documents"
+            }},
+            EXTRA_DETAILS_LOOKUP
+        ]
+        try:
+            results = await self.collection.aggregate(pipeline).to_list(length=1)
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=f"Error retrieving candidate: {str(e)}")
+        if not results:
+            return None
+
+        candidate_doc = results[0]
+        documents = [Document(**document) for document in candidate_doc.pop("documents")]
+        extra_details = [self._extra_detail_response(detail) for detail in candidate_doc.pop("extra_details")]
+        return Candidate(**candidate_doc), documents, extra_details
+
+    async def find_candidate_extra_details(self, candidate_id: str) -> Optional[List[CandidateExtraDetailResponse]]:
+        """
+        Get a candidate's extra details, newest first, or None if there is no such candidate
+
+        One aggregation like get_candidate_details, but the candidate is cut
+        down to its _id and only the extra details are joined.
+        """
+        try:
+            candidate_object_id = ObjectId(candidate_id)
+        except (InvalidId, TypeError):
+            return None
+        pipeline = [{"$match": {"_id": candidate_object_id}}, {"$project": {"_id": 1}}, EXTRA_DETAILS_LOOKUP]
+        try:
+            results = await self.collection.aggregate(pipeline).to_list(length=1)
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=f"Error retrieving extra details: {str(e)}")
+        if not results:
+            return None
+        return [self._extra_detail_response(detail) for detail in results[0]["extra_details"]]
+
+    async def ensure_indexes(self):
+        """Create the indexes pagination, search and extra detail reads rely on"""
+        await self.collection.create_index([("created_at", DESCENDING), ("_id", DESCENDING)])
+        await self.collection.create_index("skills")
+        await self.collection.create_index(
+            [(field, TEXT) for field in SEARCH_FIELD_WEIGHTS],
+            weights=SEARCH_FIELD_WEIGHTS,
+            name=SEARCH_INDEX_NAME
+        )
+        await self.extra_details_collection.create_index([("candidate_id", ASCENDING), ("created_at", DESCENDING)])
+
+    async def get_candidates(self, skip: int = 0, limit: int = 100, summary: bool = False) -> List[Candidate]:
+        """Get all candidates with offset pagination; prefer get_candidate_page for deep pages"""
+        try:
+            cursor = self.collection.find({}, SUMMARY_PROJECTION if summary else None).sort(PAGE_SORT).skip(skip).limit(limit)
             candidate_docs = await cursor.to_list(length=limit)
             candidates = []
             for candidate_doc in candidate_docs:
@@ -82,6 +208,81 @@ class CandidateService:
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"Error retrieving candidates: {str(e)}")
 
+    async def get_candidate_page(
+        self,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        summary: bool = False
+    ) -> Tuple[List[Candidate], Optional[str]]:
+        """
+        Get one page of candidates, newest first
+
+        Keyset pagination on (created_at, _id): the cursor is the last position
+        returned, so every page is one range scan of the (created_at, _id)
+        index however deep it is, and candidates inserted meanwhile never
+        shift later pages. Candidates without created_at (e.g. inserted by the
+        Zoho sync) sort last and are paged on _id alone. Returns the page and
+        the cursor for the next page, or None when there are no more
+        candidates. ``summary`` leaves the resume text in the database.
+        Raises ValueError for a malformed cursor.
+        """
+        query = {}
+        if cursor:
+            position = decode_cursor(cursor)
+            try:
+                after_created_at = position["created_at"]
+                if after_created_at is not None:
+                    after_created_at = datetime.fromisoformat(after_created_at)
+                after_id = ObjectId(position["id"])
+            except (KeyError, TypeError, ValueError, InvalidId):
+                raise ValueError("Invalid cursor")
+            if after_created_at is None:
+                # Matches both a missing and a null created_at
+                query = {"created_at": None, "_id": {"$lt": after_id}}
+            else:
+                query = {"$or": [
+                    {"created_at": {"$lt": after_created_at}},
+                    {"created_at": after_created_at, "_id": {"$lt": after_id}},
+                    {"created_at": None}
+                ]}
+
+        try:
+            # One extra document tells whether another page follows
+            projection = SUMMARY_PROJECTION if summary else None
+            docs = await self.collection.find(query, projection).sort(PAGE_SORT).limit(limit + 1).to_list(length=limit + 1)
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=f"Error retrieving candidates: {str(e)}")
+
+        next_cursor = None
+        if len(docs) > limit:
+            docs = docs[:limit]
+            last = docs[-1]
+            created_at = last.get("created_at")
+            next_cursor = encode_cursor({
+                "created_at": created_at.isoformat() if created_at else None,
+                "id": str(last["_id"])
+            })
+        return [Candidate(**doc) for doc in docs], next_cursor
+
+    async def get_candidates_by_ids(
+        self,
+        candidate_ids: List[str],
+        exclude_fields: Optional[List[str]] = None
+    ) -> List[Candidate]:
+        """Get candidates by a list of IDs in a single query, optionally leaving out heavy fields"""
+        if not candidate_ids:
+            return []
+        try:
+            object_ids = [ObjectId(candidate_id) for candidate_id in candidate_ids]
+            projection = {field: 0 for field in exclude_fields} if exclude_fields else None
+            cursor = self.collection.find({"_id": {"$in": object_ids}}, projection)
+            candidates = []
+            async for candidate_doc in cursor:
+                candidates.append(Candidate(**candidate_doc))
+            return candidates
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=f"Error retrieving candidates: {str(e)}")
+
     async def update_candidate(self, candidate_id: str, candidate_update: CandidateUpdate) -> Optional[Candidate]:
         """Update a candidate"""
         try:
@@ -105,6 +306,10 @@ class CandidateService:
                 )
                 
                 if result:
+                    skill_index_service.add_entry(candidate_id, result.get('skills'), result)
+                    semantic_index_service.add_document(candidate_id, candidate_text(result), result.get('updated_at'))
+                    if 'skills' in update_data:
+                        await match_store_service.refresh_candidate(candidate_id, result.get('skills'))
                     return Candidate(**result)
             return None
         except HTTPException:
@@ -112,38 +317,118 @@ class CandidateService:
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"Error updating candidate: {str(e)}")
 
-    async def delete_candidate(self, candidate_id: str) -> bool:
-        """Delete a candidate"""
+    async def search_candidates(
+        self,
+        query: str,
+        skills: Optional[List[str]] = None,
+        summary: bool = False,
+        skip: int = 0,
+        limit: int = 100
+    ) -> List[Candidate]:
+        """
+        Search candidates by name, email, skills, summary and resume text
+
+        ``query`` goes through the candidates text index, so it matches whole
+        (stemmed) words and the cost follows the number of matches rather than
+        the collection size; results are ranked by relevance. Without a query
+        candidates are listed newest first. ``skills`` keeps candidates having
+        any of them, through the skills index.
+        """
         try:
-            result = await self.collection.delete_one({"_id": ObjectId(candidate_id)})
-            return result.deleted_count > 0
+            cursor = self.collection.find(self.search_filter(query, skills), SUMMARY_PROJECTION if summary else None)
+            candidate_docs = await cursor.sort(self._search_sort(query)).skip(skip).limit(limit).to_list(length=limit)
+            return [Candidate(**candidate_doc) for candidate_doc in candidate_docs]
         except Exception as e:
-            raise HTTPException(status_code=500, detail=f"Error deleting candidate: {str(e)}")
+            raise HTTPException(status_code=500, detail=f"Error searching candidates: {str(e)}")
 
-    async def search_candidates(self, query: str, skills: Optional[List[str]] = None) -> List[Candidate]:
-        """Search candidates by name, email, or skills"""
-        try:
-            search_filter = {}
-            
-            if query:
-                search_filter["$or"] = [
-                    {"name": {"$regex": query, "$options": "i"}},
-                    {"email": {"$regex": query, "$options": "i"}}
+    @staticmethod
+    def search_filter(query: str, skills: Optional[List[str]] = None, location: Optional[str] = None) -> dict:
+        search_filter = {}
+        if query:
+            search_filter["$text"] = {"$search": query}
+        if skills:
+            search_filter["skills"] = {"$in": canonicalize_skills(skills)}
+        if location:
+            search_filter["location"] = location
+        return search_filter
+
+    @staticmethod
+    def _search_sort(query: str) -> list:
+        return [("score", {"$meta": "textScore"}), ("_id", DESCENDING)] if query else PAGE_SORT
+
+    async def facet_search(
+        self,
+        query: str,
+        skills: Optional[List[str]] = None,
+        location: Optional[str] = None,
+        skip: int = 0,
+        limit: int = 20,
+        facet_limit: int = 10
+    ) -> Tuple[List[Candidate], int, Dict[str, List[FacetCount]]]:
+        """
+        Search candidates and count skill, location and experience facets over every match
+
+        One aggregation: the search filter and order, then a projection down
+        to the summary fields, then a $facet computing the page, the total
+        and the top ``facet_limit`` values of each facet side by side. Only
+        the page and the counts leave the database. ``location`` matches a
+        location facet value exactly.
+        """
+        sort = {field: direction for field, direction in self._search_sort(query)}
+        pipeline = [
+            {"$match": self.search_filter(query, skills, location)},
+            {"$sort": sort},
+            {"$project": SUMMARY_PROJECTION},
+            {"$facet": {
+                "candidates": [{"$skip": skip}, {"$limit": limit}],
+                "total": [{"$count": "count"}],
+                "skills": [
+                    {"$unwind": "$skills"},
+                    {"$sortByCount": "$skills"},
+                    {"$limit": facet_limit}
+                ],
+                "location": [
+                    {"$match": {"location": {"$nin": [None, ""]}}},
+                    {"$sortByCount": "$location"},
+                    {"$limit": facet_limit}
+                ],
+                "experience": [
+                    {"$bucket": {
+                        "groupBy": _EXPERIENCE_YEARS,
+                        # The last boundary only closes the top bucket
+                        "boundaries": EXPERIENCE_FACET_BOUNDARIES + [10_000],
+                        "default": UNKNOWN_EXPERIENCE,
+                        "output": {"count": {"$sum": 1}}
+                    }}
                 ]
-            
-            if skills:
-                if "$and" not in search_filter:
-                    search_filter["$and"] = []
-                search_filter["$and"].append({"skills": {"$in": skills}})
-            
-            cursor = self.collection.find(search_filter).sort("created_at", -1)
-            candidates = []
-            for candidate_doc in cursor:
-                candidates.append(Candidate(**candidate_doc))
-            return candidates
+            }}
+        ]
+        try:
+            result = (await self.collection.aggregate(pipeline, allowDiskUse=True).to_list(length=1))[0]
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"Error searching candidates: {str(e)}")
 
+        facets = {
+            name: [FacetCount(value=bucket["_id"], count=bucket["count"]) for bucket in result[name]]
+            for name in ("skills", "location")
+        }
+        facets["experience"] = [
+            FacetCount(value=_experience_label(bucket["_id"]), count=bucket["count"])
+            for bucket in result["experience"]
+        ]
+        total = result["total"][0]["count"] if result["total"] else 0
+        return [Candidate(**doc) for doc in result["candidates"]], total, facets
+
+    async def get_candidate_raw_text(self, candidate_id: str) -> Optional[str]:
+        """Get only a candidate's resume text; None if the candidate does not exist"""
+        try:
+            candidate = await self.collection.find_one({"_id": ObjectId(candidate_id)}, {"raw_text": 1})
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=f"Error retrieving candidate raw text: {str(e)}")
+        if candidate is None:
+            return None
+        return candidate.get("raw_text") or ""
+
     async def get_candidate_by_email(self, email: str) -> Optional[Candidate]:
         """Get a candidate by email"""
         try:
@@ -164,6 +449,7 @@ class CandidateService:
         try:
             # Create candidate document with optional fields
             candidate_dict = candidate_data.dict()
+            candidate_dict['skills'] = canonicalize_skills(candidate_dict.get('skills'))
             candidate_dict['created_at'] = datetime.utcnow()
             candidate_dict['updated_at'] = datetime.utcnow()
             candidate_dict['raw_text'] = raw_text
@@ -172,6 +458,10 @@ class CandidateService:
             # Insert candidate
             result = await self.collection.insert_one(candidate_dict)
             candidate_id = result.inserted_id
+            skill_index_service.add_entry(str(candidate_id), candidate_dict.get('skills'), candidate_dict)
+            semantic_index_service.add_document(str(candidate_id), candidate_text(candidate_dict), candidate_dict['updated_at'])
+            resume_search_service.add_document(str(candidate_id), raw_text)
+            await match_store_service.refresh_candidate(str(candidate_id), candidate_dict.get('skills'))
             
             # Store raw text data separately for future reference
             raw_text_data = {
@@ -213,7 +503,8 @@ class CandidateService:
             created_at=candidate.created_at,
             updated_at=candidate.updated_at,
             document_id=str(candidate.document_id) if candidate.document_id else None,
-            raw_text=getattr(candidate, 'raw_text', None)
+            raw_text=getattr(candidate, 'raw_text', None),
+            has_raw_text=bool(candidate.raw_text) if candidate.has_raw_text is None else candidate.has_raw_text
         )
 
     async def upload_extra_details(self, candidate_id: str, file: UploadFile) -> CandidateExtraDetailResponse:
@@ -322,6 +613,42 @@ class CandidateService:
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"Error retrieving extra details: {str(e)}")
 
+    async def get_extra_details_for_candidates(
+        self,
+        candidate_ids: List[str]
+    ) -> Dict[str, List[CandidateExtraDetailResponse]]:
+        """Get the extra details of many candidates in one query, newest first per candidate"""
+        extra_details = {candidate_id: [] for candidate_id in candidate_ids}
+        if not candidate_ids:
+            return extra_details
+        try:
+            cursor = self.extra_details_collection.find(
+                {"candidate_id": {"$in": [ObjectId(candidate_id) for candidate_id in candidate_ids]}}
+            ).sort("created_at", -1)
+            async for detail_doc in cursor:
+                extra_details[str(detail_doc['candidate_id'])].append(self._extra_detail_response(detail_doc))
+            return extra_details
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=f"Error retrieving extra details: {str(e)}")
+
+    @staticmethod
+    def _extra_detail_response(detail_doc: dict) -> CandidateExtraDetailResponse:
+        return CandidateExtraDetailResponse(
+            id=str(detail_doc['_id']),
+            candidate_id=str(detail_doc['candidate_id']),
+            text_content=detail_doc['text_content'],
+            type=detail_doc.get('type'),
+            created_at=detail_doc['created_at']
+        )
+
+    async def to_responses_with_extra_details(self, candidates: List[Candidate]) -> List[CandidateResponse]:
+        """Convert a page of Candidates to CandidateResponses, reading all their extra details at once"""
+        responses = [self.to_response(candidate) for candidate in candidates]
+        extra_details = await self.get_extra_details_for_candidates([response.id for response in responses])
+        for response in responses:
+            response.extra_details = extra_details[response.id]
+        return responses
+
     async def to_response_with_extra_details(self, candidate: Candidate) -> CandidateResponse:
         """Convert Candidate to CandidateResponse with extra details included"""
         response = self.to_response(candidate)
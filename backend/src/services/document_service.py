@@ -4,7 +4,7 @@ Document service for TalentSync backend
 import os
 import io
 from datetime import datetime
-from typing import Optional
+from typing import Iterable, Optional
 from bson import ObjectId
 from fastapi import HTTPException, UploadFile
 import PyPDF2
@@ -12,12 +12,30 @@ from docx import Document as DocxDocument
 
 from ..models.document import Document, DocumentCreate, DocumentResponse
 from ..services.db_service import get_database
+from ..utils.config import config
+
+
+def remove_files(paths: Iterable[str]) -> int:
+    """Unlink upload files, and their candidate directories once empty; returns how many were removed"""
+    removed = 0
+    for path in paths:
+        try:
+            os.remove(path)
+            removed += 1
+        except OSError:
+            continue  # Already gone, or not ours to remove
+        try:
+            os.rmdir(os.path.dirname(path))
+        except OSError:
+            pass  # Other files remain
+    return removed
 
 
 class DocumentService:
     def __init__(self):
         self._db = None
         self._collection = None
+        self.upload_directory = config.UPLOAD_DIR
     
     @property
     def db(self):
@@ -30,10 +48,6 @@ class DocumentService:
         if self._collection is None:
             self._collection = self.db.documents
         return self._collection
-        self.upload_directory = "uploads"
-        
-        # Create upload directory if it doesn't exist
-        os.makedirs(self.upload_directory, exist_ok=True)
 
     async def create_document(self, candidate_id: str, file: UploadFile) -> str:
         """Create a new document from uploaded file"""
@@ -5,7 +5,10 @@ from typing import List, Optional
 from datetime import datetime, timezone
 
 from ..models.job_posting import JobPosting, JobPostingCreate, JobPostingUpdate, JobPostingLLMCreate
+from ..utils.skills import canonicalize_skills
 from .db_service import database_service
+from .match_store_service import match_store_service
+from .skill_index_service import job_skill_index_service
 
 
 class JobService:
@@ -24,8 +27,11 @@ class JobService:
         """Create a new job posting"""
         collection = database_service.get_collection(self.collection_name)
         job_dict = job_data.dict()
+        job_dict["skills"] = canonicalize_skills(job_dict.get("skills"))
         job_obj = JobPosting(**job_dict)
         await collection.insert_one(job_obj.dict())
+        job_skill_index_service.add_entry(job_obj.id, job_obj.skills)
+        await match_store_service.refresh_job(job_obj.id)
         return job_obj
     
     async def get_job_by_id(self, job_id: str) -> Optional[JobPosting]:
@@ -36,6 +42,14 @@ class JobService:
             return JobPosting(**job)
         return None
     
+    async def get_jobs_by_ids(self, job_ids: List[str]) -> List[JobPosting]:
+        """Get job postings by a list of IDs in a single query"""
+        if not job_ids:
+            return []
+        collection = database_service.get_collection(self.collection_name)
+        jobs = await collection.find({"id": {"$in": job_ids}}).to_list(len(job_ids))
+        return [JobPosting(**job) for job in jobs]
+    
     async def update_job(self, job_id: str, job_update: JobPostingUpdate) -> Optional[JobPosting]:
         """Update an existing job posting"""
         collection = database_service.get_collection(self.collection_name)
@@ -44,25 +58,35 @@ class JobService:
             return None
         
         update_data = {k: v for k, v in job_update.dict().items() if v is not None}
+        if "skills" in update_data:
+            update_data["skills"] = canonicalize_skills(update_data["skills"])
         update_data["updated_at"] = datetime.now(timezone.utc)
         
         await collection.update_one({"id": job_id}, {"$set": update_data})
         
         updated_job = await collection.find_one({"id": job_id})
+        job_skill_index_service.add_entry(job_id, updated_job.get("skills"))
+        if "skills" in update_data:
+            await match_store_service.refresh_job(job_id)
         return JobPosting(**updated_job)
     
     async def create_job_from_llm(self, job_data: JobPostingLLMCreate) -> JobPosting:
         """Create a new job posting from LLM extraction (allows null fields)"""
         collection = database_service.get_collection(self.collection_name)
         job_dict = job_data.dict()
+        job_dict["skills"] = canonicalize_skills(job_dict.get("skills"))
         job_obj = JobPosting(**job_dict)
         await collection.insert_one(job_obj.dict())
+        job_skill_index_service.add_entry(job_obj.id, job_obj.skills)
+        await match_store_service.refresh_job(job_obj.id)
         return job_obj
     
     async def delete_job(self, job_id: str) -> bool:
         """Delete a job posting"""
         collection = database_service.get_collection(self.collection_name)
         result = await collection.delete_one({"id": job_id})
+        job_skill_index_service.remove_entry(job_id)
+        await match_store_service.remove_job(job_id)
         return result.deleted_count > 0
 
 
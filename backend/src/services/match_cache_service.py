@@ -0,0 +1,78 @@
+"""
+Match cache service for TalentSync backend
+"""
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+from ..utils.config import config
+
+
+class MatchCacheService:
+    """
+    Bounded LRU cache of ranked match pages
+
+    Keys are built by the matching service from the versions of both sides of
+    a match: the job's id and ``updated_at`` with the candidate pool's
+    generation, or the candidate's id and ``updated_at`` with the job pool's
+    generation. A write to either side changes the key, so stale pages are
+    never looked up again and simply age out of the LRU.
+
+    The cache is bounded both by entry count and by the number of results
+    held across all entries; a page larger than the whole result budget is
+    not cached.
+    """
+
+    def __init__(self, max_entries: int = config.MATCH_CACHE_MAX_ENTRIES, max_results: int = config.MATCH_CACHE_MAX_RESULTS):
+        self.max_entries = max_entries
+        self.max_results = max_results
+        self.clear()
+
+    def clear(self):
+        """Drop every entry and reset the counters"""
+        self._entries: "OrderedDict[Hashable, Tuple[Any, int]]" = OrderedDict()
+        self._results = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Get a cached value, marking it most recently used"""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    def put(self, key: Hashable, value: Any, size: int = 1):
+        """Cache a value holding ``size`` results, evicting least recently used entries to fit it"""
+        if size > self.max_results or self.max_entries <= 0:
+            return
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self._results -= previous[1]
+        while self._entries and (len(self._entries) >= self.max_entries or self._results + size > self.max_results):
+            _, (_, evicted_size) = self._entries.popitem(last=False)
+            self._results -= evicted_size
+            self.evictions += 1
+        self._entries[key] = (value, size)
+        self._results += size
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters and current size of the cache"""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "results": self._results,
+            "max_entries": self.max_entries,
+            "max_results": self.max_results,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0
+        }
+
+
+# Global match cache instance
+match_cache_service = MatchCacheService()
@@ -0,0 +1,208 @@
+"""
+Match report service for TalentSync backend
+"""
+import asyncio
+import multiprocessing
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from ..services.db_service import get_database
+from ..services.skill_index_service import skill_index_service
+from ..utils.logging import logger
+from ..utils.scoring import MATCH_THRESHOLD, SCORING_IDF, SCORING_PLAIN, SKILL_SCORING_MODES
+
+# Candidate rows scored per task; each task holds a dense rows x job-skills block
+CANDIDATE_BLOCK_SIZE = 4096
+
+# Jobs scored per round; a round's reports are yielded before the next one starts
+JOB_BLOCK_SIZE = 256
+
+# Percentages are ranked as integers in thousandths of a percent: well above
+# float32 rounding error, so equal scores tie and the threshold stays exact
+SCORE_SCALE = 1000
+
+_THRESHOLD_KEY = MATCH_THRESHOLD * SCORE_SCALE
+
+# Candidate skill matrix and job weights held by each worker process
+_worker_state: Tuple[np.ndarray, np.ndarray, np.ndarray] = ()
+
+
+def _init_worker(indptr: np.ndarray, indices: np.ndarray, weights: np.ndarray):
+    global _worker_state
+    _worker_state = (indptr, indices, weights)
+
+
+def _score_block(row_start: int, row_end: int, job_start: int, job_end: int, top_n: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Top candidates of one candidate block for a range of jobs
+
+    The block's skills are expanded into a dense 0/1 matrix and multiplied
+    with the jobs' weight columns in one matrix product. Returns ``top_n``
+    rows per job (row indexes and score keys, ``-1`` where fewer candidates
+    pass the threshold), unordered.
+    """
+    indptr, indices, weights = _worker_state
+    row_count = row_end - row_start
+    offsets = indptr[row_start:row_end + 1]
+    block = np.zeros((row_count, weights.shape[0]), dtype=np.float32)
+    block[np.repeat(np.arange(row_count), np.diff(offsets)), indices[offsets[0]:offsets[-1]]] = 1.0
+
+    keys = np.rint(block @ weights[:, job_start:job_end]).astype(np.int32)
+    keys[keys <= _THRESHOLD_KEY] = -1
+    # Ranking key: score first, then the lower row (the lower candidate id) wins ties;
+    # at most 100000 x CANDIDATE_BLOCK_SIZE, which must stay within int32
+    tie_break = (row_count - 1 - np.arange(row_count, dtype=np.int32))[:, None]
+    ranking = np.where(keys >= 0, keys * row_count + tie_break, -1)
+
+    if row_count > top_n:
+        top = np.argpartition(ranking, row_count - top_n, axis=0)[row_count - top_n:]
+    else:
+        top = np.broadcast_to(np.arange(row_count)[:, None], ranking.shape)
+    return top + row_start, np.take_along_axis(keys, top, axis=0)
+
+
+class MatchReportService:
+    """
+    Every job posting with its best matching candidates, computed in bulk
+
+    The candidate pool is loaded once into a candidates x job-skills matrix
+    with rows in candidate id order, and every job becomes a column of
+    per-skill weights (each skill's share of the job's total, as a
+    percentage). Scores are then one blocked matrix product, split into
+    candidate blocks across a process pool, so the cost is jobs x candidates
+    / cores rather than one full scan per job request. Rankings follow the
+    matching API: percentage desc, candidate id asc, strictly above 20%,
+    with percentages compared to a thousandth of a percent.
+    """
+
+    def __init__(self):
+        self._db = None
+        self.skill_index = skill_index_service
+
+    @property
+    def db(self):
+        if self._db is None:
+            self._db = get_database()
+        return self._db
+
+    async def load_jobs(self) -> List[Dict[str, Any]]:
+        """Every job posting's id, title and skills"""
+        cursor = self.db.job_postings.find({}, {"_id": 0, "id": 1, "title": 1, "skills": 1})
+        return [doc async for doc in cursor]
+
+    async def generate(
+        self,
+        top_n: int = 20,
+        scoring: str = SCORING_PLAIN,
+        workers: Optional[int] = None,
+        jobs: Optional[List[Dict[str, Any]]] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Yield one report per job: its id, title and top ``top_n`` candidates
+
+        Reports are yielded a job block at a time, so they can be streamed
+        out while later blocks are still being scored. ``workers`` defaults
+        to the number of CPUs; with one worker everything runs in-process.
+        """
+        if scoring not in SKILL_SCORING_MODES:
+            raise ValueError(f"Unknown scoring mode: {scoring}")
+        await self.skill_index.ensure_built()
+        if jobs is None:
+            jobs = await self.load_jobs()
+
+        job_weights = []
+        for job in jobs:
+            skills = list(dict.fromkeys(job.get("skills") or []))
+            job_weights.append(self.skill_index.idf_weights(skills) if scoring == SCORING_IDF else dict.fromkeys(skills, 1.0))
+        candidate_ids, indptr, indices, weights = self._build_matrices(job_weights)
+        workers = workers or os.cpu_count() or 1
+        logger.info(
+            f"Scoring {len(jobs)} jobs against {len(candidate_ids)} candidates "
+            f"({weights.shape[0]} skills) with {workers} workers"
+        )
+
+        executor: Optional[Executor] = None
+        if workers > 1 and len(candidate_ids) > CANDIDATE_BLOCK_SIZE:
+            executor = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(indptr, indices, weights)
+            )
+        else:
+            _init_worker(indptr, indices, weights)
+
+        loop = asyncio.get_running_loop()
+        try:
+            for job_start in range(0, len(jobs), JOB_BLOCK_SIZE):
+                job_end = min(job_start + JOB_BLOCK_SIZE, len(jobs))
+                tasks = [
+                    (row_start, min(row_start + CANDIDATE_BLOCK_SIZE, len(candidate_ids)), job_start, job_end, top_n)
+                    for row_start in range(0, len(candidate_ids), CANDIDATE_BLOCK_SIZE)
+                ]
+                if executor is None:
+                    blocks = [_score_block(*task) for task in tasks]
+                else:
+                    blocks = await asyncio.gather(*(loop.run_in_executor(executor, _score_block, *task) for task in tasks))
+
+                if blocks:
+                    rows = np.concatenate([block_rows for block_rows, _ in blocks])
+                    keys = np.concatenate([block_keys for _, block_keys in blocks])
+                for column, job_index in enumerate(range(job_start, job_end)):
+                    top_rows = self._merge(rows[:, column], keys[:, column], top_n) if blocks else []
+                    yield self._report(jobs[job_index], job_weights[job_index], [candidate_ids[row] for row in top_rows])
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+    def _build_matrices(self, job_weights: List[Dict[str, float]]) -> Tuple[List[str], np.ndarray, np.ndarray, np.ndarray]:
+        """Candidate ids with their skills as CSR columns, and the jobs' skill weight matrix"""
+        columns: Dict[str, int] = {}
+        for skill_weights in job_weights:
+            for skill in skill_weights:
+                columns.setdefault(skill, len(columns))
+
+        # Skills no job asks for cannot change any score and are left out
+        candidate_ids = sorted(self.skill_index.entry_ids())
+        lengths = np.zeros(len(candidate_ids), dtype=np.int64)
+        indices = []
+        for row, candidate_id in enumerate(candidate_ids):
+            row_columns = [columns[skill] for skill in self.skill_index.get_skills(candidate_id) if skill in columns]
+            lengths[row] = len(row_columns)
+            indices.extend(row_columns)
+        indptr = np.concatenate([[0], np.cumsum(lengths)]).astype(np.int64)
+
+        # Pre-scaled so the matrix product yields score keys directly
+        weights = np.zeros((len(columns), len(job_weights)), dtype=np.float32)
+        for job_index, skill_weights in enumerate(job_weights):
+            total = sum(skill_weights.values())
+            for skill, weight in skill_weights.items():
+                weights[columns[skill], job_index] = weight * 100 * SCORE_SCALE / total
+        return candidate_ids, indptr, np.array(indices, dtype=np.int32), weights
+
+    @staticmethod
+    def _merge(rows: np.ndarray, keys: np.ndarray, top_n: int) -> List[int]:
+        """Overall top ``top_n`` rows of one job from its per-block tops"""
+        valid = keys >= 0
+        rows, keys = rows[valid], keys[valid]
+        return rows[np.lexsort((rows, -keys))[:top_n]].tolist()
+
+    def _report(self, job: Dict[str, Any], skill_weights: Dict[str, float], candidate_ids: List[str]) -> Dict[str, Any]:
+        candidates = []
+        total = sum(skill_weights.values())
+        for candidate_id in candidate_ids:
+            matched_skills = self.skill_index.matched_skills(candidate_id, skill_weights)
+            # Reported percentages are recomputed exactly rather than read back from the float32 keys
+            candidates.append({
+                "candidate_id": candidate_id,
+                "match_percentage": round(sum(skill_weights[skill] for skill in matched_skills) * 100 / total, 1),
+                "matched_skills": matched_skills
+            })
+        return {"job_id": job.get("id"), "title": job.get("title"), "candidates": candidates}
+
+
+# Global match report instance
+match_report_service = MatchReportService()
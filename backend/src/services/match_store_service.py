@@ -0,0 +1,306 @@
+"""
+Match store service for TalentSync backend
+"""
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from bson import ObjectId
+from pymongo import ASCENDING, DESCENDING
+
+from ..services.db_service import get_database
+from ..services.skill_index_service import job_skill_index_service, skill_index_service
+from ..utils.logging import logger
+from ..utils.scoring import MATCH_THRESHOLD, is_match, match_percentage
+
+# Rows written per insert_many when (re)scoring a whole job column
+WRITE_BATCH_SIZE = 1000
+
+_META_ID = "job_candidate_matches"
+
+
+class MatchStoreService:
+    """
+    Materialized job x candidate match matrix kept in ``job_candidate_matches``
+
+    Only pairs above the match threshold are stored, one document per pair.
+    A candidate's skill change rescores its row against every job; a job's
+    skill change rescores its column against every candidate. A store built
+    by an earlier run is reconciled against the skill indexes at startup, so
+    writes that bypassed the incremental updates (direct inserts, a crash
+    between a candidate write and its rescore) are picked up. Until a build
+    or reconcile finishes, reads fall back to live scoring and incremental
+    updates only note which rows and columns changed; they are rescored once
+    it is done.
+    """
+
+    def __init__(self):
+        self._db = None
+        self._ready = False
+        # Candidates and jobs written while the store was not ready
+        self._pending_candidates: Set[str] = set()
+        self._pending_jobs: Set[str] = set()
+
+    @property
+    def db(self):
+        if self._db is None:
+            self._db = get_database()
+        return self._db
+
+    @property
+    def collection(self):
+        return self.db.job_candidate_matches
+
+    @property
+    def meta_collection(self):
+        return self.db.match_store_meta
+
+    @property
+    def is_ready(self) -> bool:
+        """Whether the store has been fully built and can serve reads"""
+        return self._ready
+
+    async def ensure_indexes(self):
+        """Create the indexes reads and incremental updates rely on"""
+        await self.collection.create_index(
+            [("job_id", ASCENDING), ("candidate_id", ASCENDING)], unique=True
+        )
+        await self.collection.create_index(
+            [("job_id", ASCENDING), ("match_percentage", DESCENDING), ("candidate_id", ASCENDING)]
+        )
+        await self.collection.create_index("candidate_id")
+
+    async def ensure_built(self):
+        """Build the store, or reconcile it if a previous full build is recorded"""
+        await self.ensure_indexes()
+        if await self.meta_collection.find_one({"_id": _META_ID}):
+            await self.reconcile()
+        else:
+            await self.rebuild()
+
+    async def rebuild(self):
+        """Recompute the whole matrix in bulk, one job column at a time"""
+        await skill_index_service.ensure_built()
+        await job_skill_index_service.ensure_built()
+
+        self._ready = False
+        await self.collection.delete_many({})
+        rows = 0
+        for job_id in job_skill_index_service.entry_ids():
+            rows += await self._write_rows(self._score_job_column(job_id))
+
+        await self.meta_collection.replace_one(
+            {"_id": _META_ID}, {"_id": _META_ID, "built_at": datetime.utcnow()}, upsert=True
+        )
+        await self._apply_pending()
+        logger.info(f"Match store rebuilt: {job_skill_index_service.entry_count} jobs, {rows} matches")
+        return rows
+
+    async def reconcile(self):
+        """
+        Rescore every job column from the skill indexes, rewriting only rows that differ
+
+        Reads fall back to live scoring until this finishes. Returns the
+        number of rows deleted or written.
+        """
+        await skill_index_service.ensure_built()
+        await job_skill_index_service.ensure_built()
+
+        self._ready = False
+        job_ids = list(job_skill_index_service.entry_ids())
+        removed = await self.collection.delete_many({"job_id": {"$nin": job_ids}})
+        changed = removed.deleted_count
+        for job_id in job_ids:
+            changed += await self._reconcile_job_column(job_id)
+
+        await self.meta_collection.update_one(
+            {"_id": _META_ID}, {"$set": {"reconciled_at": datetime.utcnow()}}, upsert=True
+        )
+        await self._apply_pending()
+        logger.info(f"Match store reconciled: {len(job_ids)} jobs, {changed} rows changed")
+        return changed
+
+    async def _apply_pending(self):
+        """Rescore what was written during a build or reconcile, then start serving reads"""
+        while self._pending_candidates or self._pending_jobs:
+            candidate_ids, self._pending_candidates = self._pending_candidates, set()
+            job_ids, self._pending_jobs = self._pending_jobs, set()
+            # Rows first: a column rewrite replaces any row written for its job
+            for candidate_id in candidate_ids:
+                await self.collection.delete_many({"candidate_id": ObjectId(candidate_id)})
+                await self._write_rows(
+                    self._score_candidate_row(candidate_id, list(skill_index_service.get_skills(candidate_id)))
+                )
+            for job_id in job_ids:
+                await self.collection.delete_many({"job_id": job_id})
+                await self._write_rows(self._score_job_column(job_id))
+        self._ready = True
+
+    async def _reconcile_job_column(self, job_id: str) -> int:
+        expected = {row["candidate_id"]: row for row in self._score_job_column(job_id)}
+        stale = []
+        async for row in self.collection.find(
+            {"job_id": job_id}, {"_id": 0, "candidate_id": 1, "match_percentage": 1, "matched_skills": 1}
+        ):
+            fresh = expected.get(row["candidate_id"])
+            if (
+                fresh is not None
+                and fresh["match_percentage"] == row["match_percentage"]
+                and sorted(fresh["matched_skills"]) == sorted(row.get("matched_skills") or [])
+            ):
+                del expected[row["candidate_id"]]
+            else:
+                stale.append(row["candidate_id"])
+        for start in range(0, len(stale), WRITE_BATCH_SIZE):
+            await self.collection.delete_many(
+                {"job_id": job_id, "candidate_id": {"$in": stale[start:start + WRITE_BATCH_SIZE]}}
+            )
+        return len(stale) + await self._write_rows(list(expected.values()))
+
+    def _score_job_column(self, job_id: str) -> List[Dict[str, Any]]:
+        """Score one job against every candidate using the skill bitsets"""
+        job_skills = list(job_skill_index_service.get_skills(job_id))
+        if not job_skills:
+            return []
+
+        now = datetime.utcnow()
+        candidate_ids, percentages = skill_index_service.bitsets.match(job_skills, MATCH_THRESHOLD)
+        return [
+            {
+                "job_id": job_id,
+                "candidate_id": ObjectId(candidate_id),
+                "match_percentage": percentage,
+                "matched_skills": skill_index_service.bitsets.matched_skills(candidate_id, job_skills),
+                "updated_at": now
+            }
+            for candidate_id, percentage in zip(candidate_ids, percentages.tolist())
+        ]
+
+    def _score_candidate_row(self, candidate_id: str, skills: Optional[List[str]]) -> List[Dict[str, Any]]:
+        """Score one candidate against every job sharing at least one skill"""
+        candidate_skills = set(skills or [])
+        now = datetime.utcnow()
+        rows = []
+        for job_id, matched_count in job_skill_index_service.count_matches(candidate_skills).items():
+            job_skills = job_skill_index_service.get_skills(job_id)
+            if not is_match(matched_count, len(job_skills)):
+                continue
+            rows.append({
+                "job_id": job_id,
+                "candidate_id": ObjectId(candidate_id),
+                "match_percentage": match_percentage(matched_count, len(job_skills)),
+                "matched_skills": [skill for skill in job_skills if skill in candidate_skills],
+                "updated_at": now
+            })
+        return rows
+
+    async def _write_rows(self, rows: List[Dict[str, Any]]) -> int:
+        for start in range(0, len(rows), WRITE_BATCH_SIZE):
+            await self.collection.insert_many(rows[start:start + WRITE_BATCH_SIZE], ordered=False)
+        return len(rows)
+
+    async def refresh_candidate(self, candidate_id: str, skills: Optional[List[str]]):
+        """Rescore a candidate's row after its skills changed"""
+        if not self._ready:
+            self._pending_candidates.add(candidate_id)
+            return
+        await job_skill_index_service.ensure_built()
+        await self.collection.delete_many({"candidate_id": ObjectId(candidate_id)})
+        await self._write_rows(self._score_candidate_row(candidate_id, skills))
+
+    async def add_candidates(self, candidates: Iterable[Tuple[str, Optional[List[str]]]]):
+        """Score the rows of newly inserted candidates, which have none yet, in batched writes"""
+        if not self._ready:
+            self._pending_candidates.update(candidate_id for candidate_id, _ in candidates)
+            return
+        await job_skill_index_service.ensure_built()
+        rows = []
+        for candidate_id, skills in candidates:
+            rows += self._score_candidate_row(candidate_id, skills)
+        await self._write_rows(rows)
+
+    async def remove_candidates(self, candidate_ids: List[ObjectId]):
+        """Drop the rows of many deleted candidates at once"""
+        if not self._ready:
+            self._pending_candidates.update(str(candidate_id) for candidate_id in candidate_ids)
+            return
+        await self.collection.delete_many({"candidate_id": {"$in": candidate_ids}})
+
+    async def refresh_job(self, job_id: str):
+        """Rescore a job's column after its skills changed"""
+        if not self._ready:
+            self._pending_jobs.add(job_id)
+            return
+        await skill_index_service.ensure_built()
+        await self.collection.delete_many({"job_id": job_id})
+        await self._write_rows(self._score_job_column(job_id))
+
+    async def remove_job(self, job_id: str):
+        """Drop a deleted job's column"""
+        if not self._ready:
+            self._pending_jobs.add(job_id)
+            return
+        await self.collection.delete_many({"job_id": job_id})
+
+    def build_query(
+        self,
+        job_id: str,
+        min_score: Optional[float] = None,
+        after_score: Optional[float] = None,
+        after_id: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Filter for one job's column, optionally continuing after a keyset position"""
+        query: Dict[str, Any] = {"job_id": job_id}
+        if min_score is not None:
+            query["match_percentage"] = {"$gte": min_score}
+        if after_id is not None:
+            query["$or"] = [
+                {"match_percentage": {"$lt": after_score}},
+                {"match_percentage": after_score, "candidate_id": {"$gt": ObjectId(after_id)}}
+            ]
+        return query
+
+    async def get_job_matches(
+        self,
+        job_id: str,
+        limit: Optional[int] = None,
+        min_score: Optional[float] = None,
+        after_score: Optional[float] = None,
+        after_id: Optional[str] = None,
+        exclude_fields: Optional[List[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Read a job's ranked matches joined with their candidates in one aggregation
+
+        Returns candidate documents with ``match_percentage`` and
+        ``matched_skills`` set, ordered by (match percentage desc, id asc).
+        """
+        candidate_projection = {field: 0 for field in exclude_fields} if exclude_fields else None
+        lookup: Dict[str, Any] = {
+            "from": "candidates",
+            "localField": "candidate_id",
+            "foreignField": "_id",
+            "as": "candidate"
+        }
+        if candidate_projection:
+            lookup["pipeline"] = [{"$project": candidate_projection}]
+
+        # The limit follows the join so rows whose candidate is gone do not shorten the page
+        pipeline: List[Dict[str, Any]] = [
+            {"$match": self.build_query(job_id, min_score, after_score, after_id)},
+            {"$sort": {"match_percentage": -1, "candidate_id": 1}},
+            {"$lookup": lookup},
+            {"$unwind": "$candidate"},
+        ]
+        if limit is not None:
+            pipeline.append({"$limit": limit})
+        pipeline += [
+            {"$replaceRoot": {"newRoot": {"$mergeObjects": [
+                "$candidate",
+                {"match_percentage": "$match_percentage", "matched_skills": "$matched_skills"}
+            ]}}},
+        ]
+        return await self.collection.aggregate(pipeline).to_list(length=None)
+
+
+# Global match store instance
+match_store_service = MatchStoreService()
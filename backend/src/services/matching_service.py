@@ -1,43 +1,431 @@
 """
 Matching service for TalentSync backend
 """
-from typing import List
+import heapq
+from typing import AsyncIterator, Dict, List, Optional, Sequence, Tuple
 
-from ..models.candidate import Candidate
-from ..models.job_posting import JobPosting
+import numpy as np
+
+from ..models.candidate import Candidate, CandidateFilters, SkillMatch
+from ..models.job_posting import JobMatch, JobPosting
 from ..services.candidate_service import CandidateService
+from ..services.job_service import job_service
+from ..services.match_cache_service import match_cache_service
+from ..services.match_store_service import match_store_service
+from ..services.semantic_index_service import semantic_index_service
+from ..services.skill_index_service import job_skill_index_service, skill_index_service
+from ..utils.config import config
+from ..utils.pagination import decode_cursor, encode_cursor
+from ..utils.scoring import (MATCH_THRESHOLD, SCORING_IDF, SCORING_MODES, SCORING_PLAIN, SCORING_SEMANTIC,
+                             SKILL_SCORING_MODES, is_match, match_percentage)
+from ..utils.text_features import job_text
+
+# Heavy fields left out of match results; fetch the candidate itself for them
+MATCH_EXCLUDED_FIELDS = ["raw_text"]
+
+# Candidates fetched per $in query while streaming match results
+STREAM_BATCH_SIZE = 500
 
 
 class MatchingService:
     """Service for matching candidates to job postings"""
-    
+
     def __init__(self):
         self.candidate_service = CandidateService()
-    
-    async def get_candidates_for_job(self, job: JobPosting) -> List[Candidate]:
+        self.job_service = job_service
+        self.skill_index = skill_index_service
+        self.job_index = job_skill_index_service
+        self.match_store = match_store_service
+        self.semantic_index = semantic_index_service
+        self.match_cache = match_cache_service
+        # Pools at least this large are shortlisted with MinHash/LSH before exact scoring
+        self.shortlist_min_pool_size = config.LSH_MIN_POOL_SIZE
+
+    async def get_candidates_for_job(
+        self,
+        job: JobPosting,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        min_score: Optional[float] = None,
+        scoring: str = SCORING_PLAIN,
+        filters: Optional[CandidateFilters] = None,
+        exact: bool = False
+    ) -> List[Candidate]:
         """Get candidates matching a job posting with minimum 20% match score"""
-        # Get all candidates from database
-        all_candidates = await self.candidate_service.get_candidates(skip=0, limit=1000)
-        
-        job_skills = set(job.skills)
+        candidates, _ = await self.get_candidate_page(
+            job, limit=limit, cursor=cursor, min_score=min_score, scoring=scoring, filters=filters, exact=exact
+        )
+        return candidates
+
+    async def get_candidate_page(
+        self,
+        job: JobPosting,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        min_score: Optional[float] = None,
+        scoring: str = SCORING_PLAIN,
+        filters: Optional[CandidateFilters] = None,
+        exact: bool = False
+    ) -> Tuple[List[Candidate], Optional[str]]:
+        """
+        Get one page of candidates matching a job posting, best match first
+
+        Results are ordered by (match percentage desc, candidate id asc) and the
+        cursor is the last position returned, so pages stay consistent while
+        candidates are inserted. Returns the page and the cursor for the next
+        page, or None when there are no more results.
+
+        ``scoring`` selects plain percentages (the default) or IDF-weighted
+        ones, where rare skills count for more of the job's total, or
+        ``semantic`` similarity between the resume text and the job text
+        (percentage = cosine similarity x 100, any positive similarity). ``filters``
+        narrow the pool by location, experience and recency before scoring.
+
+        Unfiltered plain reads come from the precomputed match store once it is
+        built, and are scored live from the skill bitsets until then; all other
+        reads are always scored live, over the filtered rows only. Once the
+        pool reaches ``shortlist_min_pool_size``, live skill-based reads only
+        exact-score the MinHash/LSH shortlist of candidates whose skill sets
+        resemble the job's, unless ``exact`` is set.
+
+        Pages are cached by the job's id and ``updated_at`` together with the
+        candidate pool's generation, so editing the job or writing any
+        candidate invalidates them. Skill-based scores come with a per-skill
+        ``match_explanation``.
+        """
+        if scoring not in SCORING_MODES:
+            raise ValueError(f"Unknown scoring mode: {scoring}")
+        after_score, after_id = self._parse_cursor(cursor, scoring)
+
+        filtered = filters is not None and filters.is_active()
+        cache_key = (
+            "job", job.id, job.updated_at, self.skill_index.generation, scoring,
+            tuple(sorted(filters.model_dump().items())) if filtered else None, min_score, cursor, limit, exact
+        )
+        cached = self.match_cache.get(cache_key)
+        if cached is not None:
+            candidates, next_cursor = cached
+            return [candidate.model_copy(deep=True) for candidate in candidates], next_cursor
+
+        if scoring == SCORING_PLAIN and not filtered and self.match_store.is_ready:
+            page, has_more = await self._stored_page(job, limit, min_score, after_score, after_id)
+        else:
+            page, has_more = await self._live_page(job, limit, min_score, after_score, after_id, scoring, filters, exact)
+
+        job_skills = list(dict.fromkeys(job.skills or []))
+        weights = self.skill_index.idf_weights(job_skills) if scoring == SCORING_IDF else None
         candidates_with_match = []
-        
-        for candidate in all_candidates:
-            candidate_skills = set(candidate.skills)
-            matched_skills = list(job_skills.intersection(candidate_skills))
-            match_percentage = (len(matched_skills) / len(job_skills)) * 100 if job_skills else 0
-            
-            # Only include candidates with match percentage > 20%
-            if match_percentage > 20:
-                # Update candidate with match information
-                candidate.match_percentage = round(match_percentage, 1)
-                candidate.matched_skills = matched_skills
-                candidates_with_match.append(candidate)
-        
-        # Sort by match percentage (highest first)
-        candidates_with_match.sort(key=lambda x: x.match_percentage, reverse=True)
-        return candidates_with_match
+        for score, candidate in page:
+            candidate.match_percentage = round(score, 1)
+            if scoring != SCORING_SEMANTIC:
+                candidate.match_explanation = self._explain(job_skills, candidate.matched_skills, weights)
+            candidates_with_match.append(candidate)
+
+        next_cursor = None
+        if has_more and page:
+            last_score, last_candidate = page[-1]
+            next_cursor = self._encode_position(last_score, str(last_candidate.id), scoring)
+
+        self.match_cache.put(
+            cache_key,
+            ([candidate.model_copy(deep=True) for candidate in candidates_with_match], next_cursor),
+            size=max(len(candidates_with_match), 1)
+        )
+        return candidates_with_match, next_cursor
+
+    @staticmethod
+    def _parse_cursor(cursor: Optional[str], scoring: str) -> Tuple[Optional[float], Optional[str]]:
+        """Decode a page cursor into the (score, candidate id) position it resumes after"""
+        if not cursor:
+            return None, None
+        position = decode_cursor(cursor)
+        try:
+            after_score, after_id = float(position["score"]), str(position["id"])
+        except (KeyError, TypeError, ValueError):
+            raise ValueError("Invalid cursor")
+        if position.get("scoring", SCORING_PLAIN) != scoring:
+            raise ValueError("Cursor belongs to a different scoring mode")
+        return after_score, after_id
+
+    @staticmethod
+    def _encode_position(score: float, candidate_id: str, scoring: str) -> str:
+        position = {"score": score, "id": candidate_id}
+        if scoring != SCORING_PLAIN:
+            position["scoring"] = scoring
+        return encode_cursor(position)
+
+    async def open_candidate_stream(
+        self,
+        job: JobPosting,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        min_score: Optional[float] = None,
+        scoring: str = SCORING_PLAIN,
+        filters: Optional[CandidateFilters] = None,
+        exact: bool = False
+    ) -> Tuple[AsyncIterator[Candidate], Optional[str]]:
+        """
+        Rank every match of a job up front and stream the candidates lazily
+
+        Takes the same arguments, and produces the same order and cursor, as
+        get_candidate_page. Validation and scoring happen before this returns,
+        so errors surface before anything is sent; the ranking itself is only
+        candidate ids and scores. Candidates are then fetched and yielded
+        ``STREAM_BATCH_SIZE`` at a time, so memory stays flat however many
+        match. Results are always scored live and are not cached.
+        """
+        if scoring not in SCORING_MODES:
+            raise ValueError(f"Unknown scoring mode: {scoring}")
+        after_score, after_id = self._parse_cursor(cursor, scoring)
+        await self.skill_index.ensure_built()
+
+        job_skills = list(dict.fromkeys(job.skills or []))
+        candidate_ids, percentages = await self._score_pool(job, job_skills, scoring, filters, exact)
+        candidate_ids = np.array(candidate_ids, dtype=str)
+        keep = np.ones(len(candidate_ids), dtype=bool)
+        if min_score is not None:
+            keep &= percentages >= min_score
+        if after_id is not None:
+            keep &= (percentages < after_score) | ((percentages == after_score) & (candidate_ids > after_id))
+        candidate_ids, percentages = candidate_ids[keep], percentages[keep]
+
+        order = np.lexsort((candidate_ids, -percentages))
+        next_cursor = None
+        if limit is not None and len(order) > limit:
+            order = order[:limit]
+            next_cursor = self._encode_position(float(percentages[order[-1]]), str(candidate_ids[order[-1]]), scoring)
+        weights = self.skill_index.idf_weights(job_skills) if scoring == SCORING_IDF else None
+        stream = self._stream_ranked(job_skills, weights, scoring, candidate_ids[order].tolist(), percentages[order].tolist())
+        return stream, next_cursor
+
+    async def _stream_ranked(
+        self,
+        job_skills: List[str],
+        weights: Optional[Dict[str, float]],
+        scoring: str,
+        candidate_ids: List[str],
+        percentages: List[float]
+    ) -> AsyncIterator[Candidate]:
+        for start in range(0, len(candidate_ids), STREAM_BATCH_SIZE):
+            batch_ids = candidate_ids[start:start + STREAM_BATCH_SIZE]
+            candidates = await self.candidate_service.get_candidates_by_ids(batch_ids, exclude_fields=MATCH_EXCLUDED_FIELDS)
+            candidates_by_id = {str(candidate.id): candidate for candidate in candidates}
+            for candidate_id, score in zip(batch_ids, percentages[start:start + STREAM_BATCH_SIZE]):
+                candidate = candidates_by_id.get(candidate_id)
+                if candidate is None:
+                    continue
+                candidate.match_percentage = round(score, 1)
+                candidate.matched_skills = self.skill_index.bitsets.matched_skills(candidate_id, job_skills)
+                if scoring != SCORING_SEMANTIC:
+                    candidate.match_explanation = self._explain(job_skills, candidate.matched_skills, weights)
+                yield candidate
+
+    @staticmethod
+    def _explain(
+        job_skills: Sequence[str],
+        matched_skills: Sequence[str],
+        weights: Optional[Dict[str, float]] = None
+    ) -> List[SkillMatch]:
+        """Break a skill-based match percentage down into each job skill's share of it"""
+        matched = set(matched_skills)
+        skill_weights = [weights[skill] if weights else 1.0 for skill in job_skills]
+        total = sum(skill_weights)
+        return [
+            SkillMatch(
+                skill=skill,
+                matched=skill in matched,
+                weight=round(weight, 4),
+                contribution=round(weight * 100 / total, 1) if skill in matched else 0.0
+            )
+            for skill, weight in zip(job_skills, skill_weights)
+        ]
+
+    async def _stored_page(
+        self,
+        job: JobPosting,
+        limit: Optional[int],
+        min_score: Optional[float],
+        after_score: Optional[float],
+        after_id: Optional[str]
+    ) -> Tuple[List[Tuple[float, Candidate]], bool]:
+        """Read one page from the match store with a single indexed aggregation"""
+        # One extra row tells whether another page follows
+        docs = await self.match_store.get_job_matches(
+            job.id,
+            limit=None if limit is None else limit + 1,
+            min_score=min_score,
+            after_score=after_score,
+            after_id=after_id,
+            exclude_fields=MATCH_EXCLUDED_FIELDS
+        )
+        has_more = limit is not None and len(docs) > limit
+        if has_more:
+            docs = docs[:limit]
+        return [(doc["match_percentage"], Candidate(**doc)) for doc in docs], has_more
+
+    async def _live_page(
+        self,
+        job: JobPosting,
+        limit: Optional[int],
+        min_score: Optional[float],
+        after_score: Optional[float],
+        after_id: Optional[str],
+        scoring: str = SCORING_PLAIN,
+        filters: Optional[CandidateFilters] = None,
+        exact: bool = False
+    ) -> Tuple[List[Tuple[float, Candidate]], bool]:
+        """Score the whole pool in memory and materialize only the selected page"""
+        await self.skill_index.ensure_built()
+
+        # Deduplicate while keeping the job's skill order for matched_skills
+        job_skills = list(dict.fromkeys(job.skills or []))
+        candidate_ids, percentages = await self._score_pool(job, job_skills, scoring, filters, exact)
+        if not candidate_ids:
+            return [], False
+
+        keep = np.ones(len(candidate_ids), dtype=bool)
+        if min_score is not None:
+            keep &= percentages >= min_score
+        if after_id is not None:
+            # Drop everything that sorts strictly before the cursor; ties are settled below by id
+            keep &= percentages <= after_score
+
+        ranked = (
+            (-score, candidate_id)
+            for candidate_id, score, kept in zip(candidate_ids, percentages.tolist(), keep.tolist())
+            if kept and not (after_id is not None and score == after_score and candidate_id <= after_id)
+        )
+        if limit is None:
+            page = sorted(ranked)
+            has_more = False
+        else:
+            # Heap-based top-K: only limit + 1 entries are ever held and ordered
+            page = heapq.nsmallest(limit + 1, ranked)
+            has_more = len(page) > limit
+            page = page[:limit]
+
+        candidates = await self.candidate_service.get_candidates_by_ids(
+            [candidate_id for _, candidate_id in page],
+            exclude_fields=MATCH_EXCLUDED_FIELDS
+        )
+        candidates_by_id = {str(candidate.id): candidate for candidate in candidates}
+
+        scored = []
+        for negative_score, candidate_id in page:
+            candidate = candidates_by_id.get(candidate_id)
+            if candidate is None:
+                continue
+            candidate.matched_skills = self.skill_index.bitsets.matched_skills(candidate_id, job_skills)
+            scored.append((-negative_score, candidate))
+        return scored, has_more
+
+    async def _score_pool(
+        self,
+        job: JobPosting,
+        job_skills: List[str],
+        scoring: str,
+        filters: Optional[CandidateFilters],
+        exact: bool
+    ) -> Tuple[List[str], np.ndarray]:
+        """Ids and percentages of every candidate matching a job, in no particular order"""
+        if not job_skills and scoring != SCORING_SEMANTIC:
+            return [], np.zeros(0, dtype=np.float64)
+
+        # Filters select rows up front so scoring only touches the candidates that pass them
+        rows = self.skill_index.bitsets.filter_rows(filters)
+
+        if scoring == SCORING_SEMANTIC:
+            await self.semantic_index.ensure_built()
+            candidate_ids, similarities = self.semantic_index.similarities(job_text(job.dict()))
+            percentages = similarities * 100
+            if rows is not None:
+                allowed = set(self.skill_index.bitsets.row_ids(rows))
+                keep = np.fromiter((candidate_id in allowed for candidate_id in candidate_ids), dtype=bool, count=len(candidate_ids))
+                candidate_ids = [candidate_id for candidate_id, kept in zip(candidate_ids, keep.tolist()) if kept]
+                percentages = percentages[keep]
+            return candidate_ids, percentages
+
+        # Weights are looked up once per request from the index's cache, never per candidate
+        weights = self.skill_index.idf_weights(job_skills) if scoring == SCORING_IDF else None
+
+        if not exact and self.skill_index.entry_count >= self.shortlist_min_pool_size:
+            shortlist = self.skill_index.shortlist.shortlist(job_skills)
+            rows = shortlist if rows is None else np.intersect1d(rows, shortlist, assume_unique=True)
+
+        # Score the pool in one vectorized pass over the packed skill bitsets
+        return self.skill_index.bitsets.match(job_skills, MATCH_THRESHOLD, weights, rows)
+
+    async def get_jobs_for_candidate(
+        self,
+        candidate: Candidate,
+        limit: Optional[int] = None,
+        scoring: str = SCORING_PLAIN
+    ) -> List[JobMatch]:
+        """
+        Get job postings a candidate matches, best match first
+
+        Uses the same score as job -> candidates matching (share of the job's
+        skills the candidate has, strictly above 20%, optionally IDF-weighted),
+        computed in one pass over the postings that share at least one skill
+        with the candidate.
+
+        Results are cached by the candidate's id and ``updated_at`` together
+        with the job pool's generation (and the candidate pool's for IDF
+        scores, whose weights depend on it).
+        """
+        if scoring not in SKILL_SCORING_MODES:
+            raise ValueError(f"Unknown scoring mode: {scoring}")
+        await self.job_index.ensure_built()
+        if scoring == SCORING_IDF:
+            await self.skill_index.ensure_built()
+
+        candidate_skills = set(candidate.skills or [])
+        if not candidate_skills:
+            return []
+
+        cache_key = (
+            "candidate", str(candidate.id), candidate.updated_at, self.job_index.generation,
+            self.skill_index.generation if scoring == SCORING_IDF else None, scoring, limit
+        )
+        cached = self.match_cache.get(cache_key)
+        if cached is not None:
+            return [job_match.model_copy(deep=True) for job_match in cached]
+
+        ranked = []
+        for job_id, matched_count in self.job_index.count_matches(candidate_skills).items():
+            job_skills = self.job_index.get_skills(job_id)
+            if scoring == SCORING_IDF:
+                weights = self.skill_index.idf_weights(job_skills)
+                score = sum(weights[skill] for skill in job_skills if skill in candidate_skills) * 100 / sum(weights.values())
+                if score > MATCH_THRESHOLD:
+                    ranked.append((-score, job_id))
+            elif is_match(matched_count, len(job_skills)):
+                ranked.append((-match_percentage(matched_count, len(job_skills)), job_id))
+        page = sorted(ranked) if limit is None else heapq.nsmallest(limit, ranked)
+
+        jobs = await self.job_service.get_jobs_by_ids([job_id for _, job_id in page])
+        jobs_by_id = {job.id: job for job in jobs}
+
+        job_matches = []
+        for negative_score, job_id in page:
+            job = jobs_by_id.get(job_id)
+            if job is None:
+                continue
+            job_skills = list(dict.fromkeys(job.skills or []))
+            matched_skills = [skill for skill in job_skills if skill in candidate_skills]
+            weights = self.skill_index.idf_weights(job_skills) if scoring == SCORING_IDF else None
+            job_matches.append(JobMatch(
+                **job.dict(),
+                match_percentage=round(-negative_score, 1),
+                matched_skills=matched_skills,
+                match_explanation=self._explain(job_skills, matched_skills, weights)
+            ))
+
+        self.match_cache.put(
+            cache_key, [job_match.model_copy(deep=True) for job_match in job_matches], size=max(len(job_matches), 1)
+        )
+        return job_matches
 
 
 # Global matching service instance
-matching_service = MatchingService()
\ No newline at end of file
+matching_service = MatchingService()
@@ -0,0 +1,149 @@
+"""
+MinHash shortlist service for TalentSync backend
+"""
+import zlib
+from typing import Dict, Iterable, List, Set, Tuple
+
+import numpy as np
+
+from ..utils.config import config
+
+# Mersenne prime modulus of the permutation hashes; operands stay below 2**31 so products fit in uint64
+_PRIME = (1 << 31) - 1
+
+# Fixed so signatures, and so shortlists, are identical across processes and restarts
+_SEED = 20240611
+
+# Rows whose signatures are computed per vectorized batch
+SIGNATURE_BATCH_SIZE = 16384
+
+# Share of rows written since the sorted band tables were built before they are rebuilt
+REFRESH_RATIO = 0.01
+
+
+class MinHashShortlistService:
+    """
+    MinHash signatures of candidate skill sets, banded for LSH lookups
+
+    Rows are the skill bitsets' rows. Each gets ``bands x rows_per_band``
+    min-hashes of its skills, and every band is folded into one 64-bit key.
+    A job's shortlist is the rows agreeing with it on a whole band, which
+    happens with probability 1 - (1 - J^r)^b for Jaccard similarity J between
+    the skill sets: more bands, or fewer rows per band, raise recall and
+    shortlist size together.
+
+    Writes only queue the row; signatures are computed in vectorized batches
+    on the next lookup. Each band keeps a sorted snapshot of its keys for
+    binary search, and rows written since are checked directly until more
+    than 1% of the pool has changed.
+    """
+
+    def __init__(self, bands: int = config.LSH_BANDS, rows_per_band: int = config.LSH_ROWS_PER_BAND):
+        self.bands = bands
+        self.rows_per_band = rows_per_band
+        random = np.random.default_rng(_SEED)
+        permutations = bands * rows_per_band
+        self._multipliers = random.integers(1, _PRIME, size=permutations, dtype=np.uint64)
+        self._offsets = random.integers(0, _PRIME, size=permutations, dtype=np.uint64)
+        # Odd multipliers folding a band's min-hashes into its key
+        self._band_mix = random.integers(0, 1 << 63, size=(bands, rows_per_band), dtype=np.uint64) | np.uint64(1)
+        self.clear()
+
+    def clear(self):
+        """Drop every row"""
+        self._skill_ids: Dict[str, int] = {}
+        self._skill_hashes = np.zeros((0, self.bands * self.rows_per_band), dtype=np.uint64)
+        # Band keys per row; 0 marks a row without skills, which never matches
+        self._keys = np.zeros((0, self.bands), dtype=np.uint64)
+        self._row_count = 0
+        self._pending: Dict[int, Tuple[str, ...]] = {}
+        self._dirty: Set[int] = set()
+        self._sorted_keys = np.zeros((self.bands, 0), dtype=np.uint64)
+        self._sorted_rows = np.zeros((self.bands, 0), dtype=np.int64)
+
+    def set_row(self, row: int, skills: Iterable[str]):
+        """Queue a row's skills to be (re)signed"""
+        self._pending[row] = tuple(skills)
+        self._row_count = max(self._row_count, row + 1)
+
+    def clear_row(self, row: int):
+        """Stop a row from matching anything"""
+        self._pending.pop(row, None)
+        if row < len(self._keys):
+            self._keys[row] = 0
+            self._dirty.add(row)
+
+    def _skill_id(self, skill: str) -> int:
+        skill_id = self._skill_ids.get(skill)
+        if skill_id is None:
+            skill_id = len(self._skill_ids)
+            self._skill_ids[skill] = skill_id
+            value = np.uint64(zlib.crc32(skill.encode()) % _PRIME)
+            hashes = (self._multipliers * value + self._offsets) % np.uint64(_PRIME)
+            self._skill_hashes = np.vstack([self._skill_hashes, hashes])
+        return skill_id
+
+    def _band_keys(self, signatures: np.ndarray) -> np.ndarray:
+        """Fold (n, bands x rows_per_band) signatures into (n, bands) nonzero keys"""
+        banded = signatures.reshape(len(signatures), self.bands, self.rows_per_band)
+        return (banded * self._band_mix).sum(axis=2, dtype=np.uint64) | np.uint64(1)
+
+    def _sign_pending(self):
+        if not self._pending:
+            return
+        if self._row_count > len(self._keys):
+            grown = np.zeros((max(self._row_count, 2 * len(self._keys)), self.bands), dtype=np.uint64)
+            grown[:len(self._keys)] = self._keys
+            self._keys = grown
+
+        pending = list(self._pending.items())
+        self._pending = {}
+        for start in range(0, len(pending), SIGNATURE_BATCH_SIZE):
+            batch = pending[start:start + SIGNATURE_BATCH_SIZE]
+            rows = np.array([row for row, _ in batch], dtype=np.int64)
+            lengths = np.array([len(skills) for _, skills in batch], dtype=np.int64)
+            skill_ids = [self._skill_id(skill) for _, skills in batch for skill in skills]
+
+            keys = np.zeros((len(batch), self.bands), dtype=np.uint64)
+            signed = lengths > 0
+            if skill_ids:
+                # Each row's signature is the column-wise minimum over its skills' hash rows
+                starts = (np.cumsum(lengths) - lengths)[signed]
+                keys[signed] = self._band_keys(np.minimum.reduceat(self._skill_hashes[skill_ids], starts, axis=0))
+            self._keys[rows] = keys
+            self._dirty.update(rows.tolist())
+
+    def _refresh(self):
+        keys = self._keys[:self._row_count]
+        order = np.argsort(keys, axis=0, kind="stable")
+        self._sorted_rows = np.ascontiguousarray(order.T)
+        self._sorted_keys = np.ascontiguousarray(np.take_along_axis(keys, order, axis=0).T)
+        self._dirty = set()
+
+    def refresh(self):
+        """Sign every queued row and rebuild the sorted band tables"""
+        self._sign_pending()
+        self._refresh()
+
+    def shortlist(self, skills: List[str]) -> np.ndarray:
+        """Rows sharing at least one whole band with the given skills, in row order"""
+        if not skills:
+            return np.zeros(0, dtype=np.int64)
+        self._sign_pending()
+        if len(self._dirty) > REFRESH_RATIO * self._row_count:
+            self._refresh()
+
+        # Ids first: signing an unseen skill replaces the hash table
+        skill_ids = [self._skill_id(skill) for skill in skills]
+        signature = self._skill_hashes[skill_ids].min(axis=0)
+        query = self._band_keys(signature[None, :])[0]
+        selected = np.zeros(self._row_count, dtype=bool)
+        for band in range(self.bands):
+            keys = self._sorted_keys[band]
+            start, end = np.searchsorted(keys, query[band], side="left"), np.searchsorted(keys, query[band], side="right")
+            selected[self._sorted_rows[band, start:end]] = True
+        if self._dirty:
+            # Snapshot entries of rows rewritten since are stale; their current keys decide
+            dirty = np.fromiter(self._dirty, dtype=np.int64, count=len(self._dirty))
+            selected[dirty] = (self._keys[dirty] == query).any(axis=1)
+        return np.flatnonzero(selected)
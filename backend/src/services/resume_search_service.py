@@ -0,0 +1,670 @@
+"""
+Resume search service for TalentSync backend
+"""
+import asyncio
+import hashlib
+import json
+import os
+import re
+import shutil
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
+from bson import ObjectId
+
+from ..services.db_service import get_database
+from ..utils.config import config
+from ..utils.logging import logger
+from ..utils.text_features import tokenize
+
+# BM25 term frequency saturation and document length normalization
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# Resumes buffered in memory before they are written out as a segment
+FLUSH_EVERY = 1000
+
+# Segments kept on disk before the smallest are merged together, and how many are merged at once
+MAX_SEGMENTS = 8
+MERGE_FACTOR = 4
+
+# Candidate ids fetched per $in query when catching up after a restart
+LOOKUP_BATCH_SIZE = 1000
+
+# Only candidates with resume text are indexed
+RESUME_FILTER = {"raw_text": {"$type": "string", "$ne": ""}}
+
+_QUERY_TOKEN = re.compile(r'"[^"]*"|\(|\)|-(?=[^\s()])|[^\s()"]+')
+
+_SEGMENT_ARRAYS = (
+    "term_hashes", "term_offsets", "term_position_offsets", "posting_docs", "posting_freqs",
+    "positions", "doc_ids", "doc_lengths"
+)
+
+
+@lru_cache(maxsize=1 << 20)
+def term_hash(term: str) -> int:
+    """Stable 64-bit hash a term is stored under"""
+    return int.from_bytes(hashlib.blake2b(term.encode(), digest_size=8).digest(), "little")
+
+
+def _expand_ranges(starts: np.ndarray, ends: np.ndarray) -> np.ndarray:
+    """Concatenate ``arange(start, end)`` for every pair without a Python loop"""
+    lengths = ends - starts
+    offsets = starts - (np.cumsum(lengths) - lengths)
+    return np.repeat(offsets, lengths) + np.arange(lengths.sum())
+
+
+def save_deletions(path: Path, deleted: np.ndarray):
+    """Replace a saved segment's deletion mask"""
+    temporary = path / "deleted.tmp.npy"
+    np.save(temporary, deleted)
+    os.replace(temporary, path / "deleted.npy")
+
+
+class Segment:
+    """
+    Immutable positional inverted index over a batch of resumes
+
+    Terms are sorted 64-bit hashes; each term's postings (local document,
+    term frequency) are sorted by document, and the token positions of a
+    term's postings are stored contiguously in the same order, so a posting's
+    positions are found from its term's offset and the frequencies before it. Saved as one ``.npy`` file per array
+    and loaded memory-mapped, so only the postings a query touches are read.
+    Deletions are a separate mask, the only part that ever changes.
+    """
+
+    def __init__(self, arrays: Dict[str, np.ndarray], deleted: Optional[np.ndarray] = None, path: Optional[Path] = None):
+        for name in _SEGMENT_ARRAYS:
+            setattr(self, name, arrays[name])
+        self.deleted = np.zeros(len(self.doc_ids), dtype=bool) if deleted is None else deleted
+        self.path = path
+        self.deletions_saved = True
+
+    @classmethod
+    def from_tokens(cls, terms: np.ndarray, docs: np.ndarray, positions: np.ndarray, doc_ids: Sequence[str], doc_lengths: np.ndarray) -> "Segment":
+        """Build a segment from one (term hash, local document, position) triple per token"""
+        order = np.lexsort((positions, docs, terms))
+        terms, docs, positions = terms[order], docs[order], positions[order]
+
+        starts_posting = np.ones(len(terms), dtype=bool)
+        starts_posting[1:] = (terms[1:] != terms[:-1]) | (docs[1:] != docs[:-1])
+        posting_starts = np.flatnonzero(starts_posting)
+        posting_terms = terms[posting_starts]
+
+        starts_term = np.ones(len(posting_starts), dtype=bool)
+        starts_term[1:] = posting_terms[1:] != posting_terms[:-1]
+        term_starts = np.flatnonzero(starts_term)
+
+        position_offsets = np.append(posting_starts, len(terms)).astype(np.int64)
+        term_offsets = np.append(term_starts, len(posting_starts)).astype(np.int64)
+        return cls({
+            "term_hashes": posting_terms[term_starts].astype(np.uint64),
+            "term_offsets": term_offsets,
+            "term_position_offsets": position_offsets[term_offsets],
+            "posting_docs": docs[posting_starts].astype(np.int32),
+            "posting_freqs": np.diff(position_offsets).astype(np.int32),
+            "positions": positions.astype(np.int32),
+            "doc_ids": np.array(doc_ids, dtype="<U24"),
+            "doc_lengths": np.asarray(doc_lengths, dtype=np.int32)
+        })
+
+    @classmethod
+    def from_documents(cls, documents: Sequence[Tuple[str, List[int]]]) -> "Segment":
+        """Build a segment from (candidate id, token hashes) pairs"""
+        lengths = np.array([len(hashes) for _, hashes in documents], dtype=np.int64)
+        starts = np.cumsum(lengths) - lengths
+        terms = np.fromiter((h for _, hashes in documents for h in hashes), dtype=np.uint64, count=int(lengths.sum()))
+        docs = np.repeat(np.arange(len(documents), dtype=np.int32), lengths)
+        positions = (np.arange(len(terms)) - np.repeat(starts, lengths)).astype(np.int32)
+        return cls.from_tokens(terms, docs, positions, [candidate_id for candidate_id, _ in documents], lengths)
+
+    @classmethod
+    def merge(cls, segments: Sequence["Segment"]) -> "Segment":
+        """One segment holding the live documents of several"""
+        terms, docs, positions, doc_ids, doc_lengths = [], [], [], [], []
+        base = 0
+        for segment in segments:
+            live = ~segment.deleted
+            renumbered = np.cumsum(live) - 1 + base
+            posting_terms = np.repeat(segment.term_hashes, np.diff(segment.term_offsets))
+            token_docs = np.repeat(np.asarray(segment.posting_docs), segment.posting_freqs)
+            keep = live[token_docs]
+            terms.append(np.repeat(posting_terms, segment.posting_freqs)[keep])
+            docs.append(renumbered[token_docs[keep]])
+            positions.append(np.asarray(segment.positions)[keep])
+            doc_ids.extend(np.asarray(segment.doc_ids)[live].tolist())
+            doc_lengths.append(np.asarray(segment.doc_lengths)[live])
+            base += int(live.sum())
+        return cls.from_tokens(
+            np.concatenate(terms), np.concatenate(docs), np.concatenate(positions), doc_ids, np.concatenate(doc_lengths)
+        )
+
+    @classmethod
+    def load(cls, path: Path) -> "Segment":
+        arrays = {name: np.load(path / f"{name}.npy", mmap_mode="r") for name in _SEGMENT_ARRAYS}
+        return cls(arrays, np.load(path / "deleted.npy"), path)
+
+    def save(self, path: Path):
+        path.mkdir(parents=True, exist_ok=True)
+        for name in _SEGMENT_ARRAYS:
+            np.save(path / f"{name}.npy", getattr(self, name))
+        self.path = path
+        self.save_deletions()
+
+    def save_deletions(self):
+        save_deletions(self.path, self.deleted)
+        self.deletions_saved = True
+
+    def snapshot(self) -> "Segment":
+        """A copy sharing this segment's immutable arrays, with the deletions made so far"""
+        return Segment({name: getattr(self, name) for name in _SEGMENT_ARRAYS}, self.deleted.copy(), self.path)
+
+    def delete(self, doc: int):
+        self.deleted[doc] = True
+        self.deletions_saved = False
+
+    @property
+    def live_count(self) -> int:
+        return len(self.doc_ids) - int(self.deleted.sum())
+
+    def _term_index(self, term: int) -> int:
+        index = int(np.searchsorted(self.term_hashes, np.uint64(term)))
+        if index < len(self.term_hashes) and int(self.term_hashes[index]) == term:
+            return index
+        return -1
+
+    def postings(self, term: int) -> Tuple[int, int]:
+        """Posting index range of a term; empty if the segment does not contain it"""
+        index = self._term_index(term)
+        if index < 0:
+            return 0, 0
+        return int(self.term_offsets[index]), int(self.term_offsets[index + 1])
+
+    def positions_in(self, term: int, docs: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Every position of a term in the given documents, which must all contain it, with their documents"""
+        index = self._term_index(term)
+        start, end = int(self.term_offsets[index]), int(self.term_offsets[index + 1])
+        postings = np.searchsorted(np.asarray(self.posting_docs[start:end]), docs)
+        ends = int(self.term_position_offsets[index]) + np.cumsum(self.posting_freqs[start:end], dtype=np.int64)
+        last = ends[postings]
+        first = last - np.asarray(self.posting_freqs[start:end])[postings]
+        positions = np.asarray(self.positions[_expand_ranges(first, last)])
+        return positions, np.repeat(docs, last - first)
+
+    def document_frequency(self, term: int) -> int:
+        start, end = self.postings(term)
+        return end - start
+
+
+class _Evaluator:
+    """Evaluates a parsed query against one segment as sorted arrays of local documents"""
+
+    def __init__(self, segment: Segment):
+        self.segment = segment
+
+    def evaluate(self, node) -> np.ndarray:
+        kind = node[0]
+        if kind == "term":
+            start, end = self.segment.postings(node[1])
+            return np.asarray(self.segment.posting_docs[start:end])
+        if kind == "phrase":
+            return self._phrase(node[1])
+        if kind == "not":
+            return np.setdiff1d(np.arange(len(self.segment.doc_ids), dtype=np.int32), self.evaluate(node[1]), assume_unique=True)
+        if kind == "or":
+            result = self.evaluate(node[1][0])
+            for child in node[1][1:]:
+                result = np.union1d(result, self.evaluate(child))
+            return result
+
+        positive = [child for child in node[1] if child[0] != "not"]
+        negative = [child[1] for child in node[1] if child[0] == "not"]
+        if positive:
+            result = self.evaluate(positive[0])
+            for child in positive[1:]:
+                if len(result) == 0:
+                    break
+                result = np.intersect1d(result, self.evaluate(child), assume_unique=True)
+        else:
+            result = np.arange(len(self.segment.doc_ids), dtype=np.int32)
+        for child in negative:
+            result = np.setdiff1d(result, self.evaluate(child), assume_unique=True)
+        return result
+
+    def _phrase(self, terms: List[int]) -> np.ndarray:
+        # Rarest terms first, so each step narrows the documents the next one reads positions for
+        order = sorted(range(len(terms)), key=lambda offset: self.segment.document_frequency(terms[offset]))
+        docs = None
+        for offset in order:
+            start, end = self.segment.postings(terms[offset])
+            term_docs = np.asarray(self.segment.posting_docs[start:end])
+            docs = term_docs if docs is None else np.intersect1d(docs, term_docs, assume_unique=True)
+            if len(docs) == 0:
+                return docs
+
+        # Key every position by (document, where the phrase would start); a document
+        # matches if some start survives the intersection over all of its terms
+        keys = None
+        for offset in order:
+            positions, position_docs = self.segment.positions_in(terms[offset], docs)
+            term_keys = np.unique((position_docs.astype(np.int64) << 32) | (positions.astype(np.int64) - offset + len(terms)))
+            keys = term_keys if keys is None else np.intersect1d(keys, term_keys, assume_unique=True)
+            docs = np.unique(keys >> 32).astype(np.int32)
+            if len(docs) == 0:
+                break
+        return docs
+
+
+def parse_query(query: str):
+    """
+    Parse a resume search query into a tree of term hashes
+
+    Words are combined with AND unless joined by OR; NOT or a leading ``-``
+    excludes, double quotes make a phrase and parentheses group. Operators
+    are case sensitive so "and" is an ordinary (stop) word. Raises
+    ValueError for a query that is empty or malformed.
+    """
+    tokens = _QUERY_TOKEN.findall(query or "")
+    position = 0
+
+    def peek():
+        return tokens[position] if position < len(tokens) else None
+
+    def take():
+        nonlocal position
+        position += 1
+        return tokens[position - 1]
+
+    def parse_or():
+        children = [parse_and()]
+        while peek() == "OR":
+            take()
+            children.append(parse_and())
+        children = [child for child in children if child is not None]
+        if not children:
+            return None
+        return children[0] if len(children) == 1 else ("or", children)
+
+    def parse_and():
+        children = [parse_unary()]
+        while peek() not in (None, ")", "OR"):
+            if peek() == "AND":
+                take()
+            children.append(parse_unary())
+        children = [child for child in children if child is not None]
+        if not children:
+            return None
+        return children[0] if len(children) == 1 else ("and", children)
+
+    def parse_unary():
+        token = peek()
+        if token is None:
+            raise ValueError("Query ends where a search term was expected")
+        if token in ("NOT", "-"):
+            take()
+            child = parse_unary()
+            return None if child is None else ("not", child)
+        if token == "(":
+            take()
+            child = parse_or()
+            if peek() != ")":
+                raise ValueError("Unbalanced parentheses in query")
+            take()
+            return child
+        if token in (")", "AND", "OR"):
+            raise ValueError(f"Unexpected '{token}' in query")
+        words = tokenize(take().strip('"'))
+        if not words:
+            return None
+        hashes = [term_hash(word) for word in words]
+        return ("term", hashes[0]) if len(hashes) == 1 else ("phrase", hashes)
+
+    tree = parse_or() if tokens else None
+    if position < len(tokens):
+        raise ValueError(f"Unexpected '{tokens[position]}' in query")
+    if tree is None:
+        raise ValueError("Query has no searchable terms")
+    return tree
+
+
+def _scored_terms(node) -> List[int]:
+    """Terms that count towards relevance: every term not under a NOT"""
+    kind = node[0]
+    if kind == "term":
+        return [node[1]]
+    if kind == "phrase":
+        return list(node[1])
+    if kind == "not":
+        return []
+    return [term for child in node[1] for term in _scored_terms(child)]
+
+
+class ResumeSearchService:
+    """
+    BM25 keyword search over candidates' resume text
+
+    New resumes are buffered in memory and written out as an immutable
+    segment every 1000 documents; once more than 8 segments exist the
+    smallest are merged. While the app runs, segments are built, merged and
+    saved in a worker thread from a snapshot, and swapped in when done. Removing a resume only marks it deleted in its
+    segment, and merging drops it for good. Collection statistics (document
+    count, lengths, document frequencies) include deleted documents until
+    they are merged away, as is usual for segmented indexes.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._flush_task: Optional[asyncio.Task] = None
+        self.clear()
+
+    @property
+    def is_built(self) -> bool:
+        return self._built
+
+    @property
+    def document_count(self) -> int:
+        return len(self._locations) + len(self._flushing) + len(self._buffer)
+
+    def clear(self):
+        """Drop every document, in memory only"""
+        self._segments: List[Segment] = []
+        self._next_segment = 1
+        self._buffer: Dict[str, List[int]] = {}
+        # Resumes being written out as a segment, and those of them removed meanwhile
+        self._flushing: Dict[str, List[int]] = {}
+        self._flush_removed: Set[str] = set()
+        self._buffer_segment: Optional[Segment] = None
+        self._locations: Dict[str, Tuple[Segment, int]] = {}
+        self._built = False
+
+    def add_document(self, candidate_id: str, text: str):
+        """Index (or re-index) a candidate's resume text"""
+        self.remove_document(candidate_id)
+        self._append(candidate_id, text)
+        if len(self._buffer) >= FLUSH_EVERY and self._flush_task is None:
+            self._flush_in_background()
+
+    def _append(self, candidate_id: str, text: str):
+        self._buffer[candidate_id] = [term_hash(token) for token in tokenize(text or "")]
+        self._buffer_segment = None
+
+    def remove_document(self, candidate_id: str):
+        """Stop a candidate's resume from matching"""
+        if self._buffer.pop(candidate_id, None) is not None:
+            self._buffer_segment = None
+        if self._flushing.pop(candidate_id, None) is not None:
+            self._flush_removed.add(candidate_id)
+            self._buffer_segment = None
+        location = self._locations.pop(candidate_id, None)
+        if location is not None:
+            segment, doc = location
+            segment.delete(doc)
+
+    def _segment_path(self) -> Path:
+        path = self.path / f"segment-{self._next_segment:06d}"
+        self._next_segment += 1
+        return path
+
+    def _start_flush(self) -> Dict[str, Any]:
+        """Set the buffer aside and pick the segments to merge, as a snapshot the slow part works from"""
+        documents = list(self._buffer.items())
+        self._flushing, self._buffer = self._buffer, {}
+        self._flush_removed = set()
+        segment_count = len(self._segments) + (1 if documents else 0)
+        merging = []
+        if segment_count > MAX_SEGMENTS:
+            merge_count = max(MERGE_FACTOR, segment_count - MAX_SEGMENTS + 1)
+            merging = sorted(self._segments, key=lambda segment: segment.live_count)[:merge_count]
+        return {
+            "documents": documents,
+            "path": self._segment_path() if documents else None,
+            "merging": merging,
+            "snapshots": [segment.snapshot() for segment in merging],
+            "merged_path": self._segment_path() if merging else None
+        }
+
+    @staticmethod
+    def _write_segments(flush: Dict[str, Any]) -> Tuple[Optional[Segment], Optional[Segment]]:
+        """Build and save the new and merged segments of a flush; touches no shared state"""
+        segment = merged = None
+        if flush["documents"]:
+            segment = Segment.from_documents(flush["documents"])
+            segment.save(flush["path"])
+        if flush["snapshots"]:
+            merged = Segment.merge(flush["snapshots"])
+            merged.save(flush["merged_path"])
+        return segment, merged
+
+    def _finish_flush(self, flush: Dict[str, Any], segment: Optional[Segment], merged: Optional[Segment]) -> List[Segment]:
+        """Swap the written segments in, deleting what was removed while they were written"""
+        if segment is not None:
+            for doc, candidate_id in enumerate(segment.doc_ids.tolist()):
+                if candidate_id in self._flush_removed:
+                    segment.delete(doc)
+                else:
+                    self._locations[candidate_id] = (segment, doc)
+            self._segments.append(segment)
+        self._flushing = {}
+        self._flush_removed = set()
+        self._buffer_segment = None
+
+        retired = flush["merging"]
+        if merged is not None:
+            for doc, candidate_id in enumerate(merged.doc_ids.tolist()):
+                location = self._locations.get(candidate_id)
+                if location is not None and any(location[0] is old for old in retired):
+                    self._locations[candidate_id] = (merged, doc)
+                else:
+                    merged.delete(doc)
+            self._segments = [kept for kept in self._segments if all(kept is not old for old in retired)] + [merged]
+        return retired
+
+    def _persistence(self, retired: List[Segment]) -> Dict[str, Any]:
+        """Snapshot of the deletions and manifest to write, and the retired segments to remove"""
+        deletions = []
+        for segment in self._segments:
+            if not segment.deletions_saved:
+                deletions.append((segment.path, segment.deleted.copy()))
+                segment.deletions_saved = True
+        return {
+            "deletions": deletions,
+            "manifest": {
+                "segments": [segment.path.name for segment in self._segments],
+                "next_segment": self._next_segment
+            },
+            "retired": [segment.path for segment in retired]
+        }
+
+    def _persist(self, persistence: Dict[str, Any]):
+        for path, deleted in persistence["deletions"]:
+            save_deletions(path, deleted)
+        self._write_manifest(persistence["manifest"])
+        for path in persistence["retired"]:
+            shutil.rmtree(path, ignore_errors=True)
+
+    def flush(self):
+        """Write buffered resumes out as a segment, merge if there are too many, and persist deletions"""
+        flush = self._start_flush()
+        retired = self._finish_flush(flush, *self._write_segments(flush))
+        self._persist(self._persistence(retired))
+
+    def _flush_in_background(self):
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self.flush()
+            return
+        self._flush_task = loop.create_task(self._flush_off_loop())
+
+    async def _flush_off_loop(self):
+        """flush() with the segment writing, merging and file removal in a worker thread"""
+        try:
+            flush = self._start_flush()
+            try:
+                segments = await asyncio.to_thread(self._write_segments, flush)
+            except Exception:
+                # Keep the resumes searchable and buffered for the next flush
+                self._buffer = {**self._flushing, **self._buffer}
+                self._flushing = {}
+                self._buffer_segment = None
+                raise
+            retired = self._finish_flush(flush, *segments)
+            await asyncio.to_thread(self._persist, self._persistence(retired))
+        except Exception as e:
+            logger.error(f"Error flushing resume search index: {str(e)}")
+        finally:
+            self._flush_task = None
+
+    def save(self):
+        """Persist everything indexed so far"""
+        self.flush()
+
+    async def close(self):
+        """Wait for a background flush to finish, then persist everything indexed since"""
+        if self._flush_task is not None:
+            await asyncio.shield(self._flush_task)
+        self.flush()
+
+    def _write_manifest(self, manifest: Dict[str, Any]):
+        self.path.mkdir(parents=True, exist_ok=True)
+        temporary = self.path / "manifest.tmp.json"
+        temporary.write_text(json.dumps(manifest))
+        os.replace(temporary, self.path / "manifest.json")
+
+    def load(self) -> bool:
+        """Load the segments saved by a previous run, if any"""
+        manifest_path = self.path / "manifest.json"
+        if not manifest_path.exists():
+            return False
+        manifest = json.loads(manifest_path.read_text())
+        self.clear()
+        self._next_segment = manifest["next_segment"]
+        for name in manifest["segments"]:
+            segment = Segment.load(self.path / name)
+            self._segments.append(segment)
+            for doc, candidate_id in enumerate(segment.doc_ids.tolist()):
+                if not segment.deleted[doc]:
+                    self._locations[candidate_id] = (segment, doc)
+        # Segments a crash left out of the manifest
+        for stale in self.path.glob("segment-*"):
+            if stale.name not in manifest["segments"]:
+                shutil.rmtree(stale, ignore_errors=True)
+        return True
+
+    def _searchable_segments(self) -> List[Segment]:
+        buffered = list(self._flushing.items()) + list(self._buffer.items())
+        if buffered and self._buffer_segment is None:
+            self._buffer_segment = Segment.from_documents(buffered)
+        return self._segments + ([self._buffer_segment] if buffered else [])
+
+    def search(self, query: str, limit: int = 20) -> List[Tuple[str, float]]:
+        """
+        Best matching candidates for a query, as (candidate id, BM25 score) pairs
+
+        Each segment resolves the boolean query with sorted-array set
+        operations on its postings; phrases additionally check token
+        positions. Matches are scored by BM25 over the terms not under a NOT.
+        Raises ValueError for a malformed query.
+        """
+        tree = parse_query(query)
+        segments = self._searchable_segments()
+        total_docs = sum(len(segment.doc_ids) for segment in segments)
+        if total_docs == 0:
+            return []
+        average_length = sum(int(np.sum(segment.doc_lengths)) for segment in segments) / total_docs
+
+        terms = list(dict.fromkeys(_scored_terms(tree)))
+        frequencies = [sum(segment.document_frequency(term) for segment in segments) for term in terms]
+        idf = [float(np.log(1 + (total_docs - df + 0.5) / (df + 0.5))) for df in frequencies]
+
+        matches, scores = [], []
+        for number, segment in enumerate(segments):
+            docs = _Evaluator(segment).evaluate(tree)
+            docs = docs[~segment.deleted[docs]]
+            if len(docs) == 0:
+                continue
+            lengths = np.asarray(segment.doc_lengths[docs], dtype=np.float64)
+            norms = BM25_K1 * (1 - BM25_B + BM25_B * lengths / average_length)
+            score = np.zeros(len(docs), dtype=np.float64)
+            for term, weight in zip(terms, idf):
+                start, end = segment.postings(term)
+                if start == end:
+                    continue
+                term_docs = np.asarray(segment.posting_docs[start:end])
+                at = np.minimum(np.searchsorted(term_docs, docs), len(term_docs) - 1)
+                present = term_docs[at] == docs
+                tf = np.where(present, np.asarray(segment.posting_freqs[start:end])[at], 0).astype(np.float64)
+                score += weight * tf * (BM25_K1 + 1) / (tf + norms)
+            matches.append(np.stack([np.full(len(docs), number), docs]))
+            scores.append(score)
+
+        if not scores:
+            return []
+        matches, scores = np.concatenate(matches, axis=1), np.concatenate(scores)
+        if len(scores) > limit:
+            top = np.argpartition(-scores, limit - 1)[:limit]
+            matches, scores = matches[:, top], scores[top]
+        # Candidate ids are only read for the results returned
+        ids = np.array([str(segments[number].doc_ids[doc]) for number, doc in matches.T.tolist()])
+        order = np.lexsort((ids, -scores))
+        return [(str(ids[i]), float(scores[i])) for i in order]
+
+    def _contains(self, candidate_id: str) -> bool:
+        return candidate_id in self._locations or candidate_id in self._flushing or candidate_id in self._buffer
+
+    async def _flush_and_wait(self):
+        if self._flush_task is not None:
+            await asyncio.shield(self._flush_task)
+        self._flush_in_background()
+        if self._flush_task is not None:
+            await asyncio.shield(self._flush_task)
+
+    async def build(self):
+        """
+        Load the saved segments and bring them in line with the candidates collection
+
+        Resumes may be indexed while this runs: those already indexed are
+        newer than what the build reads and are left alone, and only
+        resumes loaded from disk are removed for candidates that are gone.
+        """
+        collection = get_database().candidates
+        projection = {"raw_text": 1}
+        added = 0
+        loaded = self.load()
+        if not loaded:
+            async for doc in collection.find(RESUME_FILTER, projection):
+                if self._contains(str(doc["_id"])):
+                    continue
+                self._append(str(doc["_id"]), doc["raw_text"])
+                added += 1
+                if len(self._buffer) >= FLUSH_EVERY and self._flush_task is None:
+                    self._flush_in_background()
+        else:
+            # Only resumes added or deleted since the last save are touched
+            loaded_ids = set(self._locations)
+            stored_ids = set()
+            async for doc in collection.find(RESUME_FILTER, {"_id": 1}):
+                stored_ids.add(str(doc["_id"]))
+            for candidate_id in loaded_ids.difference(stored_ids):
+                self.remove_document(candidate_id)
+            missing = [ObjectId(candidate_id) for candidate_id in stored_ids if not self._contains(candidate_id)]
+            for start in range(0, len(missing), LOOKUP_BATCH_SIZE):
+                cursor = collection.find({"_id": {"$in": missing[start:start + LOOKUP_BATCH_SIZE]}}, projection)
+                async for doc in cursor:
+                    if not self._contains(str(doc["_id"])):
+                        self.add_document(str(doc["_id"]), doc["raw_text"])
+                        added += 1
+
+        await self._flush_and_wait()
+        self._built = True
+        logger.info(
+            f"Resume search index {'loaded' if loaded else 'built'}: "
+            f"{self.document_count} resumes in {len(self._segments)} segments, {added} indexed at startup"
+        )
+
+
+# Global resume search instance
+resume_search_service = ResumeSearchService(Path(config.INDEX_DATA_DIR) / "resume_search")
@@ -0,0 +1,420 @@
+"""
+Semantic index service for TalentSync backend
+"""
+import asyncio
+import os
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from ..services.db_service import get_database
+from ..utils.config import config
+from ..utils.logging import logger
+from ..utils.text_features import HASH_DIMENSIONS, candidate_text, hash_features
+
+# Rows scored per sparse product, bounding the temporary arrays a query allocates
+ROW_BATCH_SIZE = 16384
+
+# Minimum time between background saves of the matrix while writes keep arriving
+SAVE_INTERVAL_SECONDS = 60
+
+# Share of rows that may be removed before the in-memory matrix is compacted
+COMPACT_RATIO = 0.1
+
+# Share of the pool that must change before IDF weights and row norms are recomputed
+IDF_REFRESH_RATIO = 0.01
+
+# Candidate ids fetched per $in query when catching up after a restart
+LOOKUP_BATCH_SIZE = 1000
+
+# Candidate fields the indexed text is built from
+TEXT_FIELDS = ("raw_text", "summary", "experience", "skills")
+
+
+class SemanticIndexService:
+    """
+    Hashed TF-IDF vectors of every candidate's resume text
+
+    Term frequencies are kept as a CSR matrix (row pointers, hashed column
+    indexes, sublinear tf values) together with per-column document
+    frequencies. IDF weights are a snapshot of those, refreshed once more
+    than 1% of the pool has been written since; row norms are computed
+    against the same snapshot, for new rows only as they arrive, so adding a
+    resume is a single row append. The matrix is saved as one ``.npz`` file and reloaded on startup,
+    then reconciled with the candidates collection: each row keeps the
+    ``updated_at`` of the candidate it was vectorized from, so rows older
+    than their candidate are re-vectorized as well as missing ones. While the app runs, writes
+    trigger a save at most every SAVE_INTERVAL_SECONDS, written from a
+    snapshot in a worker thread so the event loop is not blocked.
+    """
+
+    def __init__(self, path: Path, dimensions: int = HASH_DIMENSIONS):
+        self.path = Path(path)
+        self.dimensions = dimensions
+        self._build_task: Optional[asyncio.Task] = None
+        self.clear()
+
+    @property
+    def is_built(self) -> bool:
+        return self._built
+
+    @property
+    def document_count(self) -> int:
+        return len(self._rows)
+
+    def clear(self):
+        """Drop every document"""
+        self._indptr = np.zeros(1, dtype=np.int64)
+        self._indices = np.zeros(0, dtype=np.int32)
+        self._data = np.zeros(0, dtype=np.float32)
+        # Rows appended since the arrays above were last consolidated
+        self._pending: List[Tuple[np.ndarray, np.ndarray]] = []
+        self._row_ids: List[Optional[str]] = []
+        # The candidate updated_at each row was vectorized from
+        self._updated_at: List[Optional[datetime]] = []
+        self._rows: Dict[str, int] = {}
+        self._document_frequency = np.zeros(self.dimensions, dtype=np.int32)
+        self._idf: Optional[np.ndarray] = None
+        self._norms: Optional[np.ndarray] = None
+        self._writes_since_idf = 0
+        self._unsaved_writes = 0
+        self._removed_rows = 0
+        self._saved_at = time.monotonic()
+        self._saving: Optional[asyncio.Task] = None
+        self._built = False
+
+    def _consolidate(self):
+        if not self._pending:
+            return
+        lengths = [len(indices) for indices, _ in self._pending]
+        self._indptr = np.concatenate([self._indptr, self._indptr[-1] + np.cumsum(lengths)])
+        self._indices = np.concatenate([self._indices] + [indices for indices, _ in self._pending])
+        self._data = np.concatenate([self._data] + [values for _, values in self._pending])
+        self._pending = []
+
+    def _row_indices(self, row: int) -> np.ndarray:
+        consolidated_rows = len(self._indptr) - 1
+        if row < consolidated_rows:
+            return self._indices[self._indptr[row]:self._indptr[row + 1]]
+        return self._pending[row - consolidated_rows][0]
+
+    def _record_write(self, count: int = 1):
+        self._writes_since_idf += count
+        self._unsaved_writes += count
+        if self._removed_rows > COMPACT_RATIO * len(self._row_ids):
+            self._compact()
+        if self._saving is None and time.monotonic() - self._saved_at >= SAVE_INTERVAL_SECONDS:
+            self._save_in_background()
+
+    def _save_in_background(self):
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self.save()
+            return
+        snapshot = self._snapshot()
+        self._unsaved_writes = 0
+        self._saved_at = time.monotonic()
+        self._saving = loop.create_task(self._write_snapshot(snapshot))
+
+    async def _write_snapshot(self, snapshot: Dict[str, Any]):
+        try:
+            await asyncio.to_thread(self._write, snapshot)
+        except Exception as e:
+            logger.error(f"Error saving semantic index: {str(e)}")
+            # Retry with the next write
+            self._unsaved_writes += 1
+            self._saved_at = 0.0
+        finally:
+            self._saving = None
+
+    def add_document(self, candidate_id: str, text: str, updated_at: Optional[datetime] = None):
+        """Vectorize (or re-vectorize) a candidate's text as a new row"""
+        self._drop_row(candidate_id)
+        self._append_row(candidate_id, text, updated_at)
+        self._record_write()
+
+    def add_documents(self, documents: Iterable[Tuple[str, str, Optional[datetime]]]):
+        """Vectorize many (candidate_id, text, updated_at) triples, saving at most once for the lot"""
+        count = 0
+        for candidate_id, text, updated_at in documents:
+            self._drop_row(candidate_id)
+            self._append_row(candidate_id, text, updated_at)
+            count += 1
+        if count:
+            self._record_write(count)
+
+    def _append_row(self, candidate_id: str, text: str, updated_at: Optional[datetime] = None):
+        indices, values = hash_features(text, self.dimensions)
+        self._pending.append((indices, values))
+        self._rows[candidate_id] = len(self._row_ids)
+        self._row_ids.append(candidate_id)
+        self._updated_at.append(updated_at or datetime.utcnow())
+        self._document_frequency[indices] += 1
+
+    def remove_document(self, candidate_id: str):
+        """Drop a candidate's row"""
+        if self._drop_row(candidate_id):
+            self._record_write()
+
+    def remove_documents(self, candidate_ids: Iterable[str]):
+        """Drop many candidates' rows, saving at most once for the lot"""
+        count = sum(self._drop_row(candidate_id) for candidate_id in candidate_ids)
+        if count:
+            self._record_write(count)
+
+    def _drop_row(self, candidate_id: str) -> bool:
+        # Rows are tombstoned; save() compacts them away
+        row = self._rows.pop(candidate_id, None)
+        if row is None:
+            return False
+        self._document_frequency[self._row_indices(row)] -= 1
+        self._row_ids[row] = None
+        self._removed_rows += 1
+        return True
+
+    def _idf_weights(self) -> np.ndarray:
+        count = self.document_count
+        if self._idf is None or self._writes_since_idf > IDF_REFRESH_RATIO * count:
+            self._idf = (np.log((1 + count) / (1 + self._document_frequency)) + 1).astype(np.float32)
+            self._writes_since_idf = 0
+            # Norms must use the same weights as the queries they normalize
+            self._norms = None
+        return self._idf
+
+    def _row_sums(self, values: np.ndarray, start: int, end: int) -> np.ndarray:
+        """Sum per-nonzero values over each row in [start, end), empty rows included"""
+        offsets = self._indptr[start:end + 1] - self._indptr[start]
+        cumulative = np.concatenate([[0.0], np.cumsum(values, dtype=np.float64)])
+        return cumulative[offsets[1:]] - cumulative[offsets[:-1]]
+
+    def _row_norms(self, idf: np.ndarray) -> np.ndarray:
+        """IDF-weighted L2 norm of every row, computing only rows added since the last call"""
+        row_count = len(self._indptr) - 1
+        known = 0 if self._norms is None else len(self._norms)
+        if known < row_count:
+            norms = np.empty(row_count - known, dtype=np.float64)
+            for start in range(known, row_count, ROW_BATCH_SIZE):
+                end = min(start + ROW_BATCH_SIZE, row_count)
+                span = slice(self._indptr[start], self._indptr[end])
+                weighted = self._data[span] * idf[self._indices[span]]
+                norms[start - known:end - known] = np.sqrt(self._row_sums(weighted * weighted, start, end))
+            self._norms = norms if self._norms is None else np.concatenate([self._norms, norms])
+        return self._norms
+
+    def similarities(self, text: str) -> Tuple[List[str], np.ndarray]:
+        """
+        Cosine similarity between a text and every indexed candidate
+
+        The query becomes a dense IDF-weighted vector and the matrix is
+        multiplied against it in row batches. Each batch first finds the
+        nonzeros that hit one of the query's columns with a byte lookup, so
+        only those are multiplied and summed. Returns the ids of candidates
+        with a positive similarity and their similarities, in row order.
+        """
+        self._consolidate()
+        query_indices, query_values = hash_features(text, self.dimensions)
+        row_count = len(self._indptr) - 1
+        if row_count == 0 or len(query_indices) == 0:
+            return [], np.zeros(0, dtype=np.float64)
+
+        idf = self._idf_weights()
+        query_weights = query_values * idf[query_indices]
+        query_norm = float(np.linalg.norm(query_weights))
+        # Fold the document-side idf into the query so rows can stay raw term frequencies
+        query = np.zeros(self.dimensions, dtype=np.float32)
+        query[query_indices] = query_weights * idf[query_indices] / query_norm
+
+        is_query_column = np.zeros(self.dimensions, dtype=bool)
+        is_query_column[query_indices] = True
+
+        norms = self._row_norms(idf)
+        scores = np.zeros(row_count, dtype=np.float64)
+        for start in range(0, row_count, ROW_BATCH_SIZE):
+            end = min(start + ROW_BATCH_SIZE, row_count)
+            offset = self._indptr[start]
+            hits = np.flatnonzero(is_query_column[self._indices[offset:self._indptr[end]]]) + offset
+            if len(hits) == 0:
+                continue
+            hit_rows = np.searchsorted(self._indptr[start:end + 1], hits, side="right") - 1
+            scores[start:end] = np.bincount(
+                hit_rows, weights=self._data[hits] * query[self._indices[hits]], minlength=end - start
+            )
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            scores = np.where(norms > 0, scores / norms, 0.0)
+        rows = [row for row in np.flatnonzero(scores > 0).tolist() if self._row_ids[row] is not None]
+        return [self._row_ids[row] for row in rows], scores[rows]
+
+    def _compact(self):
+        """Drop removed rows from the matrix"""
+        self._consolidate()
+        live = np.array([candidate_id is not None for candidate_id in self._row_ids], dtype=bool)
+        if live.all():
+            return
+        lengths = np.diff(self._indptr)
+        keep = np.repeat(live, lengths)
+        self._indptr = np.concatenate([[0], np.cumsum(lengths[live])]).astype(np.int64)
+        self._indices = self._indices[keep]
+        self._data = self._data[keep]
+        self._updated_at = [
+            updated_at for candidate_id, updated_at in zip(self._row_ids, self._updated_at) if candidate_id is not None
+        ]
+        self._row_ids = [candidate_id for candidate_id in self._row_ids if candidate_id is not None]
+        self._rows = {candidate_id: row for row, candidate_id in enumerate(self._row_ids)}
+        self._norms = None
+        self._removed_rows = 0
+
+    def _snapshot(self) -> Dict[str, Any]:
+        """The current rows, cheap to take: the arrays are only ever replaced, never written in place"""
+        return {
+            "indptr": self._indptr,
+            "indices": self._indices,
+            "data": self._data,
+            "pending": list(self._pending),
+            "ids": list(self._row_ids),
+            "updated_at": list(self._updated_at)
+        }
+
+    def _write(self, snapshot: Dict[str, Any]):
+        """Write a snapshot to disk without its removed rows"""
+        pending = snapshot["pending"]
+        indptr, indices, data = snapshot["indptr"], snapshot["indices"], snapshot["data"]
+        if pending:
+            lengths = [len(pending_indices) for pending_indices, _ in pending]
+            indptr = np.concatenate([indptr, indptr[-1] + np.cumsum(lengths)])
+            indices = np.concatenate([indices] + [pending_indices for pending_indices, _ in pending])
+            data = np.concatenate([data] + [values for _, values in pending])
+        live = np.array([candidate_id is not None for candidate_id in snapshot["ids"]], dtype=bool)
+        if not live.all():
+            lengths = np.diff(indptr)
+            keep = np.repeat(live, lengths)
+            indptr = np.concatenate([[0], np.cumsum(lengths[live])]).astype(np.int64)
+            indices, data = indices[keep], data[keep]
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temporary = self.path.with_suffix(".tmp.npz")
+        np.savez(
+            temporary,
+            indptr=indptr,
+            indices=indices,
+            data=data,
+            ids=np.array([candidate_id for candidate_id in snapshot["ids"] if candidate_id is not None], dtype=str),
+            updated_at=np.array(
+                [updated_at for candidate_id, updated_at in zip(snapshot["ids"], snapshot["updated_at"]) if candidate_id is not None],
+                dtype="datetime64[ms]"
+            ),
+            dimensions=np.array(self.dimensions)
+        )
+        os.replace(temporary, self.path)
+
+    def save(self):
+        """Compact the matrix and write it to disk"""
+        self._compact()
+        self._write(self._snapshot())
+        self._unsaved_writes = 0
+        self._saved_at = time.monotonic()
+
+    async def close(self):
+        """Stop a build still under way and save what has been indexed; the next build catches up"""
+        if self._build_task is not None and not self._build_task.done():
+            self._build_task.cancel()
+            await asyncio.gather(self._build_task, return_exceptions=True)
+        await self.flush()
+
+    async def flush(self):
+        """Wait for a background save to finish, then save any writes made since"""
+        if self._saving is not None:
+            await self._saving
+        if self._unsaved_writes:
+            self.save()
+
+    def load(self) -> bool:
+        """Load the matrix saved by a previous run, if one exists with matching dimensions"""
+        if not self.path.exists():
+            return False
+        with np.load(self.path) as saved:
+            # Files from before rows kept their updated_at cannot be reconciled, so are rebuilt
+            if int(saved["dimensions"]) != self.dimensions or "updated_at" not in saved.files:
+                return False
+            self.clear()
+            self._indptr = saved["indptr"].astype(np.int64)
+            self._indices = saved["indices"].astype(np.int32)
+            self._data = saved["data"].astype(np.float32)
+            self._row_ids = [str(candidate_id) for candidate_id in saved["ids"]]
+            self._updated_at = saved["updated_at"].astype(object).tolist()
+        self._rows = {candidate_id: row for row, candidate_id in enumerate(self._row_ids)}
+        np.add.at(self._document_frequency, self._indices, 1)
+        return True
+
+    async def build(self):
+        """
+        Load the saved matrix and bring it in line with the candidates collection
+
+        Candidates may be written while this runs: a row already newer than
+        the document read is kept, and only rows loaded from disk are dropped
+        for candidates that no longer exist.
+        """
+        collection = get_database().candidates
+        projection = {field: 1 for field in TEXT_FIELDS + ("updated_at",)}
+        added = 0
+        loaded = self.load()
+        if not loaded:
+            async for doc in collection.find({}, projection):
+                row = self._rows.get(str(doc["_id"]))
+                if row is not None and not self._is_stale(row, doc.get("updated_at")):
+                    continue
+                self._drop_row(str(doc["_id"]))
+                self._append_row(str(doc["_id"]), candidate_text(doc), doc.get("updated_at"))
+                added += 1
+        else:
+            # Only candidates created, updated or deleted since the last save are touched
+            loaded_ids = set(self._rows)
+            stored_ids = set()
+            stale = []
+            async for doc in collection.find({}, {"_id": 1, "updated_at": 1}):
+                candidate_id = str(doc["_id"])
+                stored_ids.add(candidate_id)
+                row = self._rows.get(candidate_id)
+                if row is None or self._is_stale(row, doc.get("updated_at")):
+                    stale.append(doc["_id"])
+            for candidate_id in loaded_ids.difference(stored_ids):
+                self._drop_row(candidate_id)
+            for start in range(0, len(stale), LOOKUP_BATCH_SIZE):
+                cursor = collection.find({"_id": {"$in": stale[start:start + LOOKUP_BATCH_SIZE]}}, projection)
+                async for doc in cursor:
+                    self._drop_row(str(doc["_id"]))
+                    self._append_row(str(doc["_id"]), candidate_text(doc), doc.get("updated_at"))
+                    added += 1
+
+        self._idf = None
+        if self._saving is not None:
+            await asyncio.shield(self._saving)
+        self._compact()
+        self._save_in_background()
+        self._built = True
+        logger.info(
+            f"Semantic index {'loaded' if loaded else 'built'}: "
+            f"{self.document_count} documents, {added} vectorized at startup"
+        )
+
+    def _is_stale(self, row: int, updated_at: Optional[datetime]) -> bool:
+        """Whether a candidate changed after its row was vectorized; stored times are millisecond precision like Mongo's"""
+        vectorized_at = self._updated_at[row]
+        return updated_at is not None and (vectorized_at is None or updated_at > vectorized_at)
+
+    async def ensure_built(self):
+        """Build the index on first use, or wait for the build already under way"""
+        if self._built:
+            return
+        if self._build_task is None or self._build_task.done():
+            self._build_task = asyncio.create_task(self.build())
+        # A cancelled request must not cancel a build other requests are waiting on
+        await asyncio.shield(self._build_task)
+
+
+# Global semantic index instance
+semantic_index_service = SemanticIndexService(Path(config.INDEX_DATA_DIR) / "semantic_index.npz")
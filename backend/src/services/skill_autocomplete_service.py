@@ -0,0 +1,180 @@
+"""
+Skill autocomplete service for TalentSync backend
+"""
+import bisect
+import heapq
+import re
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from ..models.skill import SkillSuggestion
+from ..services.skill_index_service import SkillIndexService, job_skill_index_service, skill_index_service
+from ..utils.skills import ALIAS_TABLE, skill_key
+
+# Suggestions cached per trie node; requests for more than this are computed uncached
+CACHED_SUGGESTIONS = 20
+
+# Word boundaries inside a skill name a completion may also start from ("learning" -> "Machine Learning")
+_WORD_BOUNDARY = re.compile(r"[\s/\-]+")
+
+# Canonical skill -> every alias key that maps to it
+_ALIAS_KEYS: Dict[str, Set[str]] = {}
+for _key, _skill in ALIAS_TABLE.items():
+    _ALIAS_KEYS.setdefault(_skill, set()).add(_key)
+
+
+class _Node:
+    __slots__ = ("children", "skills", "top")
+
+    def __init__(self):
+        self.children: Dict[str, "_Node"] = {}
+        # Every skill with a key passing through this node
+        self.skills: Set[str] = set()
+        # Best (-weight, lower-cased name, skill) entries under this node, or None until computed
+        self.top: Optional[List[tuple]] = None
+
+    def reposition(self, skill: str, entry: Optional[tuple]):
+        """Move a skill within the cached suggestions, or drop them when that cannot be done exactly"""
+        if self.top is None:
+            return
+        complete = len(self.top) == len(self.skills)
+        old = next((cached for cached in self.top if cached[2] == skill), None)
+        if old is not None:
+            if not complete and (entry is None or entry > old):
+                # A skill outside the cache may now outrank it
+                self.top = None
+                return
+            self.top.remove(old)
+        if entry is not None:
+            bisect.insort(self.top, entry)
+            del self.top[CACHED_SUGGESTIONS:]
+
+
+class SkillAutocompleteService:
+    """
+    Prefix trie of every known skill, ranked by how many documents use it
+
+    A skill is reachable from its lower-cased name, from each later word in
+    it and from its registry aliases, so "py", "learn" and "reactj" all
+    complete. Its weight is the number of candidates plus job postings
+    having it, read live from the skill indexes. Each node caches its best
+    suggestions; a write to the indexes moves the skills it touched within
+    the caches on their paths, so lookups are a walk down the trie and, in
+    the common case, a cached list.
+    """
+
+    def __init__(
+        self,
+        candidate_index: Optional[SkillIndexService] = None,
+        job_index: Optional[SkillIndexService] = None
+    ):
+        self.candidate_index = candidate_index
+        self.job_index = job_index
+        self._root = _Node()
+        self._keys: Dict[str, Set[str]] = {}
+        for skill in set(ALIAS_TABLE.values()):
+            self._insert(skill)
+        for index in (candidate_index, job_index):
+            if index is not None:
+                index.add_listener(self.skills_changed)
+                self.skills_changed(index.skills())
+
+    @staticmethod
+    def _skill_keys(skill: str) -> Set[str]:
+        key = skill_key(skill)
+        keys = {key} | _ALIAS_KEYS.get(skill, set())
+        keys.update(key[boundary.end():] for boundary in _WORD_BOUNDARY.finditer(key))
+        return {key for key in keys if key}
+
+    def _path(self, key: str, create: bool = False) -> List[_Node]:
+        """Nodes from the root down to a key, or as far as it exists"""
+        nodes = [self._root]
+        for character in key:
+            child = nodes[-1].children.get(character)
+            if child is None:
+                if not create:
+                    break
+                child = nodes[-1].children[character] = _Node()
+            nodes.append(child)
+        return nodes
+
+    def _entry(self, skill: str) -> tuple:
+        return (-sum(self.counts(skill)), skill.lower(), skill)
+
+    def _insert(self, skill: str):
+        keys = self._skill_keys(skill)
+        self._keys[skill] = keys
+        entry = self._entry(skill)
+        for node in self._nodes(keys, create=True):
+            if skill not in node.skills:
+                node.reposition(skill, entry)
+                node.skills.add(skill)
+
+    def _remove(self, skill: str):
+        keys = self._keys.pop(skill)
+        for node in self._nodes(keys):
+            node.reposition(skill, None)
+            node.skills.discard(skill)
+        for key in keys:
+            nodes = self._path(key)
+            # Prune the branch the skill alone kept alive
+            for parent, character, child in reversed(list(zip(nodes, key, nodes[1:]))):
+                if child.skills:
+                    break
+                del parent.children[character]
+
+    def counts(self, skill: str) -> Tuple[int, int]:
+        """How many candidates and job postings have a skill"""
+        return (
+            self.candidate_index.skill_count(skill) if self.candidate_index is not None else 0,
+            self.job_index.skill_count(skill) if self.job_index is not None else 0
+        )
+
+    def _nodes(self, keys: Iterable[str], create: bool = False) -> List[_Node]:
+        """Every node on the paths of some keys, each once"""
+        nodes = {}
+        for key in keys:
+            for node in self._path(key, create):
+                nodes[id(node)] = node
+        return list(nodes.values())
+
+    def skills_changed(self, skills: Iterable[str]):
+        """Bring the trie up to date with skills whose document counts may have changed"""
+        for skill in set(skills):
+            used = any(self.counts(skill))
+            if skill not in self._keys:
+                if used:
+                    self._insert(skill)
+                continue
+            if not used and skill not in _ALIAS_KEYS:
+                self._remove(skill)
+                continue
+            entry = self._entry(skill)
+            for node in self._nodes(self._keys[skill]):
+                node.reposition(skill, entry)
+
+    def _ranked(self, node: _Node, count: int) -> List[tuple]:
+        return heapq.nsmallest(count, map(self._entry, node.skills))
+
+    def suggest(self, prefix: str, limit: int = 10) -> List[SkillSuggestion]:
+        """Most used skills completing a prefix, with their candidate and job counts"""
+        key = skill_key(prefix)
+        nodes = self._path(key)
+        if len(nodes) <= len(key):
+            return []
+        node = nodes[-1]
+        if limit > CACHED_SUGGESTIONS:
+            top = self._ranked(node, limit)
+        else:
+            if node.top is None:
+                node.top = self._ranked(node, CACHED_SUGGESTIONS)
+            top = node.top[:limit]
+
+        suggestions = []
+        for _, _, skill in top:
+            candidates, jobs = self.counts(skill)
+            suggestions.append(SkillSuggestion(skill=skill, candidates=candidates, jobs=jobs))
+        return suggestions
+
+
+# Global skill autocomplete instance
+skill_autocomplete_service = SkillAutocompleteService(skill_index_service, job_skill_index_service)
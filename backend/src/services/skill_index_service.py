@@ -0,0 +1,208 @@
+"""
+Skill index service for TalentSync backend
+"""
+import itertools
+from collections import Counter
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from ..services.bitset_scoring_service import BitsetScoringService
+from ..services.db_service import get_database
+from ..services.minhash_shortlist_service import MinHashShortlistService
+from ..utils.config import config
+from ..utils.logging import logger
+from ..utils.scoring import idf_weight
+
+# Candidate fields the bitsets keep for structured filtering
+FILTER_FIELDS = ("location", "experience", "created_at")
+
+# Generations are drawn from one counter so no two index states ever share a number
+_generations = itertools.count(1)
+
+
+class SkillIndexService:
+    """
+    In-process inverted index mapping each skill to the ids of the documents that have it
+
+    One instance indexes candidates (keyed by ``_id``) and another indexes job
+    postings (keyed by ``id``). The candidate index also keeps packed skill
+    bitsets for vectorized job -> candidates scoring, and MinHash signatures
+    over the same rows for shortlisting very large pools.
+    """
+
+    def __init__(self, collection_name: str, id_field: str = "_id", with_bitsets: bool = False):
+        self.collection_name = collection_name
+        self.id_field = id_field
+        self._postings: Dict[str, Set[str]] = {}
+        self._entry_skills: Dict[str, Tuple[str, ...]] = {}
+        self.bitsets = BitsetScoringService() if with_bitsets else None
+        self.shortlist = MinHashShortlistService() if with_bitsets else None
+        # IDF weights computed since the last write; any write changes the pool and drops them
+        self._idf_cache: Dict[str, float] = {}
+        # Bumped on every write, so anything derived from the indexed pool can tell it is stale
+        self._generation = next(_generations)
+        # Called with the skills whose posting lists a write changed
+        self._listeners: List[Callable[[Iterable[str]], None]] = []
+        self._building = False
+        self._built = False
+
+    @property
+    def is_built(self) -> bool:
+        return self._built
+
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    @property
+    def entry_count(self) -> int:
+        return len(self._entry_skills)
+
+    async def build(self):
+        """(Re)build the index from every document stored in the collection"""
+        collection = get_database()[self.collection_name]
+        previous_skills = list(self._postings)
+        self._building = True
+        self._postings = {}
+        self._entry_skills = {}
+        self._idf_cache = {}
+        self._generation = next(_generations)
+        if self.bitsets is not None:
+            self.bitsets.clear()
+            self.shortlist.clear()
+
+        projection = {self.id_field: 1, "skills": 1}
+        if self.bitsets is not None:
+            projection.update({field: 1 for field in FILTER_FIELDS})
+        cursor = collection.find({}, projection)
+        try:
+            async for doc in cursor:
+                self.add_entry(str(doc[self.id_field]), doc.get("skills"), doc)
+        finally:
+            self._building = False
+        if self.shortlist is not None and self.entry_count >= config.LSH_MIN_POOL_SIZE:
+            # Sign the whole pool now rather than on the first shortlisted request
+            self.shortlist.refresh()
+
+        self._notify(set(previous_skills) | set(self._postings))
+        self._built = True
+        logger.info(
+            f"Skill index for {self.collection_name} built: "
+            f"{self.entry_count} entries, {len(self._postings)} skills"
+        )
+
+    async def ensure_built(self):
+        """Build the index on first use if startup did not already do it"""
+        if not self._built:
+            await self.build()
+
+    def add_entry(self, entry_id: str, skills: Optional[Iterable[str]], attributes: Optional[Dict[str, Any]] = None):
+        """
+        Index a document, replacing any skills previously indexed for it
+
+        ``attributes`` is the document (or any dict holding its filter fields)
+        and is only used by indexes that keep bitsets.
+        """
+        self.remove_entry(entry_id)
+
+        # Deduplicated but in their original order, so matched skills can follow it
+        entry_skills = tuple(dict.fromkeys(skills or []))
+        self._entry_skills[entry_id] = entry_skills
+        self._idf_cache.clear()
+        self._generation = next(_generations)
+        for skill in entry_skills:
+            self._postings.setdefault(skill, set()).add(entry_id)
+        if self.bitsets is not None:
+            self.bitsets.set_candidate(entry_id, entry_skills, attributes)
+            self.shortlist.set_row(self.bitsets.row_of(entry_id), entry_skills)
+        self._notify(entry_skills)
+
+    def remove_entry(self, entry_id: str):
+        """Drop a document from every posting list it appears in"""
+        entry_skills = self._entry_skills.pop(entry_id, None)
+        if self.bitsets is not None:
+            row = self.bitsets.row_of(entry_id)
+            if row is not None:
+                self.shortlist.clear_row(row)
+            self.bitsets.remove_candidate(entry_id)
+        if entry_skills is None:
+            return
+
+        self._idf_cache.clear()
+        self._generation = next(_generations)
+        for skill in entry_skills:
+            posting = self._postings.get(skill)
+            if posting is None:
+                continue
+            posting.discard(entry_id)
+            if not posting:
+                del self._postings[skill]
+        self._notify(entry_skills)
+
+    def add_listener(self, listener: Callable[[Iterable[str]], None]):
+        """Call ``listener`` with the skills whose document counts may have changed after every write"""
+        self._listeners.append(listener)
+
+    def _notify(self, skills: Iterable[str]):
+        # A build notifies once for the whole vocabulary when it is done
+        if self._building:
+            return
+        for listener in self._listeners:
+            listener(skills)
+
+    def get_skills(self, entry_id: str) -> Tuple[str, ...]:
+        """Get the indexed skills of a document, deduplicated, in their stored order"""
+        return self._entry_skills.get(entry_id, ())
+
+    def entry_ids(self) -> List[str]:
+        """Get the ids of every indexed document"""
+        return list(self._entry_skills)
+
+    def get_entry_ids(self, skill: str) -> Set[str]:
+        """Get the posting list for a single skill"""
+        return self._postings.get(skill, set())
+
+    def skill_count(self, skill: str) -> int:
+        """Get how many documents have a skill"""
+        return len(self._postings.get(skill, ()))
+
+    def skills(self) -> List[str]:
+        """Get every skill at least one document has"""
+        return list(self._postings)
+
+    def count_matches(self, skills: Iterable[str]) -> Dict[str, int]:
+        """
+        Count how many of the given skills each document has
+
+        Only documents sharing at least one skill are visited, so the cost is
+        proportional to the summed length of the touched posting lists.
+        """
+        counts: Counter = Counter()
+        for skill in set(skills):
+            counts.update(self._postings.get(skill, ()))
+        return dict(counts)
+
+    def idf_weights(self, skills: Iterable[str]) -> Dict[str, float]:
+        """
+        Get the IDF weight of each given skill over the indexed documents
+
+        Document frequencies are the posting list sizes, which every write
+        keeps current; weights are cached until the next write.
+        """
+        weights = {}
+        for skill in skills:
+            weight = self._idf_cache.get(skill)
+            if weight is None:
+                weight = idf_weight(len(self._postings.get(skill, ())), self.entry_count)
+                self._idf_cache[skill] = weight
+            weights[skill] = weight
+        return weights
+
+    def matched_skills(self, entry_id: str, skills: Iterable[str]) -> List[str]:
+        """Get the subset of the given skills that a document has"""
+        entry_skills = set(self.get_skills(entry_id))
+        return [skill for skill in skills if skill in entry_skills]
+
+
+# Global skill index instances
+skill_index_service = SkillIndexService("candidates", with_bitsets=True)
+job_skill_index_service = SkillIndexService("job_postings", id_field="id")
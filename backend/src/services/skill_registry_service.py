@@ -0,0 +1,74 @@
+"""
+Skill registry service for TalentSync backend
+"""
+from typing import Dict
+
+from pymongo import ReplaceOne, UpdateOne
+
+from ..services.db_service import get_database
+from ..utils.logging import logger
+from ..utils.skills import ALIAS_TABLE, canonicalize_skills
+
+# Documents rewritten per bulk_write during a backfill
+BACKFILL_BATCH_SIZE = 500
+
+# Collections holding skill lists, with the field their documents are keyed by
+SKILL_COLLECTIONS = {"candidates": "_id", "job_postings": "id"}
+
+
+class SkillRegistryService:
+    """
+    Publishes the skill alias table and backfills canonical skills
+
+    The alias table is mirrored into ``skill_aliases`` (lookup key -> canonical
+    name) so services that write candidates directly, such as the Zoho sync,
+    canonicalize skills the same way as the backend.
+    """
+
+    def __init__(self):
+        self._db = None
+
+    @property
+    def db(self):
+        if self._db is None:
+            self._db = get_database()
+        return self._db
+
+    @property
+    def collection(self):
+        return self.db.skill_aliases
+
+    async def publish(self):
+        """Mirror the in-code alias table into the skill_aliases collection"""
+        await self.collection.bulk_write(
+            [ReplaceOne({"_id": key}, {"_id": key, "skill": skill}, upsert=True) for key, skill in ALIAS_TABLE.items()],
+            ordered=False
+        )
+        await self.collection.delete_many({"_id": {"$nin": list(ALIAS_TABLE)}})
+
+    async def backfill(self) -> Dict[str, int]:
+        """Rewrite stored skill lists to their canonical form, returning updates per collection"""
+        updated = {}
+        for collection_name, id_field in SKILL_COLLECTIONS.items():
+            collection = self.db[collection_name]
+            operations = []
+            updated[collection_name] = 0
+
+            cursor = collection.find({"skills": {"$type": "array"}}, {id_field: 1, "skills": 1})
+            async for doc in cursor:
+                skills = canonicalize_skills(doc["skills"]) or None
+                if skills == doc["skills"]:
+                    continue
+                operations.append(UpdateOne({id_field: doc[id_field]}, {"$set": {"skills": skills}}))
+                if len(operations) >= BACKFILL_BATCH_SIZE:
+                    updated[collection_name] += (await collection.bulk_write(operations, ordered=False)).modified_count
+                    operations = []
+            if operations:
+                updated[collection_name] += (await collection.bulk_write(operations, ordered=False)).modified_count
+
+            logger.info(f"Canonicalized skills of {updated[collection_name]} documents in {collection_name}")
+        return updated
+
+
+# Global skill registry instance
+skill_registry_service = SkillRegistryService()
@@ -17,6 +17,27 @@ class Config:
     MONGO_URL = os.environ.get('MONGO_URL', 'mongodb://localhost:27017')
     DB_NAME = os.environ.get('DB_NAME', 'talentsync')
     
+    # Directory for on-disk search and matching indexes
+    INDEX_DATA_DIR = os.environ.get('INDEX_DATA_DIR', str(ROOT_DIR / 'data'))
+    
+    # Uploaded candidate documents, one subdirectory per candidate
+    UPLOAD_DIR = os.environ.get('UPLOAD_DIR', str(ROOT_DIR / 'uploads'))
+    
+    # Seconds between sweeps for documents, raw text, extra details and
+    # upload files whose candidate no longer exists; 0 disables the sweeper
+    ORPHAN_SWEEP_INTERVAL_SECONDS = int(os.environ.get('ORPHAN_SWEEP_INTERVAL_SECONDS', '3600'))
+    
+    # Match result cache bounds: cached pages, and candidates or jobs held across them
+    MATCH_CACHE_MAX_ENTRIES = int(os.environ.get('MATCH_CACHE_MAX_ENTRIES', '1024'))
+    MATCH_CACHE_MAX_RESULTS = int(os.environ.get('MATCH_CACHE_MAX_RESULTS', '100000'))
+    
+    # MinHash/LSH shortlisting: live skill matching only exact-scores the
+    # shortlist once the candidate pool reaches LSH_MIN_POOL_SIZE. More bands
+    # or fewer rows per band trade latency for recall.
+    LSH_MIN_POOL_SIZE = int(os.environ.get('LSH_MIN_POOL_SIZE', '250000'))
+    LSH_BANDS = int(os.environ.get('LSH_BANDS', '32'))
+    LSH_ROWS_PER_BAND = int(os.environ.get('LSH_ROWS_PER_BAND', '2'))
+    
     # CORS settings
     CORS_ORIGINS = os.environ.get('CORS_ORIGINS', '*').split(',')
     
@@ -0,0 +1,17 @@
+"""
+Experience parsing utilities for TalentSync backend
+"""
+import re
+from typing import Optional
+
+# "5 years", "3+ years", "2.5 yrs", "10 yr"; also valid as a Mongo $regexFind pattern
+YEARS_REGEX = r"(\d+(?:\.\d+)?)\s*\+?\s*(?:years?|yrs?)\b"
+_YEARS_PATTERN = re.compile(YEARS_REGEX, re.IGNORECASE)
+
+
+def parse_experience_years(experience: Optional[str]) -> Optional[float]:
+    """Read the number of years from a free-text experience summary, if it states one"""
+    if not experience:
+        return None
+    match = _YEARS_PATTERN.search(experience)
+    return float(match.group(1)) if match else None
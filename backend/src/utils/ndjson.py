@@ -0,0 +1,14 @@
+"""
+Newline-delimited JSON utilities for TalentSync backend
+"""
+from typing import AsyncIterable, AsyncIterator
+
+from pydantic import BaseModel
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
+async def ndjson_lines(models: AsyncIterable[BaseModel]) -> AsyncIterator[str]:
+    """Serialize models one JSON document per line, as a JSON response of them would"""
+    async for model in models:
+        yield model.model_dump_json(by_alias=True) + "\n"
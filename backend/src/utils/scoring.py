@@ -0,0 +1,30 @@
+"""
+Match scoring utilities for TalentSync backend
+"""
+import math
+
+# Candidates must match strictly more than this percentage of a job's skills
+MATCH_THRESHOLD = 20
+
+
+def is_match(matched_count: int, job_skill_count: int) -> bool:
+    """Whether matching this many of a job's skills clears the threshold"""
+    return matched_count * 100 > MATCH_THRESHOLD * job_skill_count
+
+
+def match_percentage(matched_count: int, job_skill_count: int) -> float:
+    """Percentage of a job's skills that were matched"""
+    return (matched_count / job_skill_count) * 100 if job_skill_count else 0.0
+
+
+# Scoring modes selectable per request
+SCORING_PLAIN = "plain"  # share of the job's skills matched, every skill counts the same
+SCORING_IDF = "idf"  # share of the job's skill weight matched, rare skills count more
+SCORING_SEMANTIC = "semantic"  # TF-IDF cosine similarity between the resume and the job text
+SKILL_SCORING_MODES = (SCORING_PLAIN, SCORING_IDF)
+SCORING_MODES = SKILL_SCORING_MODES + (SCORING_SEMANTIC,)
+
+
+def idf_weight(document_frequency: int, document_count: int) -> float:
+    """Smoothed inverse document frequency of a skill held by document_frequency of document_count candidates"""
+    return math.log((1 + document_count) / (1 + document_frequency)) + 1.0
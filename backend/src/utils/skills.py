@@ -0,0 +1,120 @@
+"""
+Skill canonicalization utilities for TalentSync backend
+
+Skills are canonicalized once, when a candidate or job posting is written, so
+matching can compare stored skill names directly without normalizing them on
+every request.
+"""
+from typing import Dict, Iterable, List, Optional
+
+# Canonical skill names with the aliases that should be stored as them.
+# Every canonical name also matches itself case-insensitively.
+SKILL_ALIASES: Dict[str, List[str]] = {
+    ".NET": ["dotnet", "dot net", ".net core", "asp.net", "asp.net core"],
+    "A/B Testing": ["ab testing", "a/b tests", "split testing"],
+    "Agile": ["agile methodology", "agile methodologies"],
+    "Angular": ["angularjs", "angular.js", "angular 2+"],
+    "AWS": ["amazon web services", "amazon aws"],
+    "Azure": ["microsoft azure", "ms azure"],
+    "C#": ["c sharp", "csharp"],
+    "C++": ["cpp", "c plus plus"],
+    "CI/CD": ["ci cd", "ci-cd", "continuous integration", "continuous delivery", "continuous deployment"],
+    "CSS": [],
+    "CSS3": ["css 3"],
+    "Computer Vision": ["computer-vision"],
+    "Django": [],
+    "Django REST Framework": ["drf", "django rest"],
+    "Docker": ["docker compose", "docker-compose"],
+    "Express": ["express.js", "expressjs"],
+    "FastAPI": ["fast api"],
+    "GCP": ["google cloud", "google cloud platform"],
+    "Git": ["git/github", "git scm"],
+    "GitLab": [],
+    "GitLab CI": ["gitlab ci/cd", "gitlab-ci"],
+    "Go": ["golang"],
+    "GraphQL": ["graph ql"],
+    "HTML": [],
+    "HTML5": ["html 5"],
+    "iOS": ["ios development"],
+    "Java": ["core java", "java se", "java ee"],
+    "JavaScript": ["js", "javascript (es6)", "es6", "ecmascript", "vanilla js"],
+    "JIRA": ["atlassian jira"],
+    "Kafka": ["apache kafka"],
+    "Kotlin": ["kotlin/jvm"],
+    "Kubernetes": ["k8s", "kube"],
+    "Machine Learning": ["ml"],
+    "Microservices": ["microservice", "microservices architecture"],
+    "MongoDB": ["mongo", "mongo db"],
+    "MySQL": ["my sql"],
+    "Next.js": ["nextjs", "next js"],
+    "Node.js": ["node", "nodejs", "node js"],
+    "Nuxt.js": ["nuxt", "nuxtjs"],
+    "Pandas": ["python pandas"],
+    "PostgreSQL": ["postgres", "postgresql db", "psql"],
+    "PowerBI": ["power bi", "microsoft power bi"],
+    "Python": ["python3", "python 3", "py"],
+    "PyTorch": ["torch"],
+    "Rails": ["ruby on rails", "ror"],
+    "React": ["react.js", "reactjs", "react js"],
+    "React Native": ["react-native", "reactnative"],
+    "Redis": ["redis cache"],
+    "REST APIs": ["rest", "rest api", "restful", "restful apis", "restful api"],
+    "Rust": ["rust lang", "rustlang"],
+    "SCSS": ["sass"],
+    "Spark": ["apache spark", "pyspark"],
+    "Spring": ["spring framework"],
+    "Spring Boot": ["springboot", "spring-boot"],
+    "SQL": ["structured query language"],
+    "SQL Server": ["mssql", "ms sql", "microsoft sql server"],
+    "Swift": ["swift 5"],
+    "Tableau": ["tableau desktop"],
+    "TensorFlow": ["tensor flow", "tensorflow 2"],
+    "Terraform": ["hashicorp terraform"],
+    "TypeScript": ["ts"],
+    "Vue.js": ["vue", "vuejs", "vue js"],
+}
+
+
+def skill_key(skill: str) -> str:
+    """Case- and whitespace-insensitive lookup key for a skill name"""
+    return " ".join(skill.split()).lower()
+
+
+def _build_alias_table() -> Dict[str, str]:
+    table: Dict[str, str] = {}
+    for canonical, aliases in SKILL_ALIASES.items():
+        for alias in aliases:
+            table.setdefault(skill_key(alias), canonical)
+    # Canonical names win over any alias that happens to share their key
+    for canonical in SKILL_ALIASES:
+        table[skill_key(canonical)] = canonical
+    return table
+
+
+# Lookup key -> canonical skill name
+ALIAS_TABLE: Dict[str, str] = _build_alias_table()
+
+
+def canonicalize_skill(skill: str) -> str:
+    """
+    Map a skill to its canonical name
+
+    Known skills and aliases map to their registry name. Unknown skills keep
+    their own casing unless written entirely in lower case, in which case each
+    word is capitalized so "terraform" and "Terraform" are stored the same way.
+    """
+    skill = " ".join(skill.split())
+    canonical = ALIAS_TABLE.get(skill.lower())
+    if canonical is not None:
+        return canonical
+    if skill.islower():
+        return " ".join(word[:1].upper() + word[1:] for word in skill.split(" "))
+    return skill
+
+
+def canonicalize_skills(skills: Optional[Iterable[str]]) -> Optional[List[str]]:
+    """Canonicalize a skill list, dropping blanks and duplicates but keeping order"""
+    if skills is None:
+        return None
+    canonical = (canonicalize_skill(skill) for skill in skills if skill and skill.strip())
+    return list(dict.fromkeys(canonical))
@@ -0,0 +1,68 @@
+"""
+Text feature hashing utilities for TalentSync backend
+
+Turns free text (resumes, job descriptions) into sparse hashed term-frequency
+vectors without a vocabulary, so documents can be vectorized one at a time
+and fully offline.
+"""
+import math
+import re
+import zlib
+from collections import Counter
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+
+# Number of hashed feature columns; a power of two so hashing is a mask
+HASH_DIMENSIONS = 1 << 20
+
+# Keeps tokens like "c++", "c#", "node.js" and ".net" intact
+_TOKEN_PATTERN = re.compile(r"[a-z0-9#+.]*[a-z0-9#+]")
+
+_STOP_WORDS = frozenset("""
+a about above after again all also am an and any are as at be been before being below between both but by
+can could did do does doing down during each few for from further had has have having he her here hers him
+his how i if in into is it its itself just me more most my no nor not now of off on once only or other our
+ours out over own same she should so some such than that the their theirs them then there these they this
+those through to too under until up very was we were what when where which while who whom why will with
+would you your yours
+""".split())
+
+
+def tokenize(text: str) -> List[str]:
+    """Lower-case word tokens with stop words removed"""
+    return [token for token in _TOKEN_PATTERN.findall(text.lower()) if token not in _STOP_WORDS]
+
+
+def hash_features(text: str, dimensions: int = HASH_DIMENSIONS) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Hash a text's unigrams and bigrams into a sparse term-frequency vector
+
+    Returns sorted unique column indexes and their sublinear term frequencies
+    (1 + log tf). crc32 is used instead of ``hash()`` so columns are stable
+    across processes and restarts.
+    """
+    tokens = tokenize(text or "")
+    terms = tokens + [f"{first} {second}" for first, second in zip(tokens, tokens[1:])]
+    if not terms:
+        return np.zeros(0, dtype=np.int32), np.zeros(0, dtype=np.float32)
+
+    mask = dimensions - 1
+    counts: Counter = Counter(zlib.crc32(term.encode()) & mask for term in terms)
+    indices = np.fromiter(sorted(counts), dtype=np.int32, count=len(counts))
+    values = np.fromiter((1.0 + math.log(counts[index]) for index in indices.tolist()), dtype=np.float32, count=len(counts))
+    return indices, values
+
+
+def candidate_text(candidate: Dict[str, Any]) -> str:
+    """Text a candidate is semantically matched on: the resume, or the profile fields without one"""
+    if candidate.get("raw_text"):
+        return candidate["raw_text"]
+    parts = [candidate.get("summary"), candidate.get("experience"), " ".join(candidate.get("skills") or [])]
+    return " ".join(part for part in parts if part)
+
+
+def job_text(job: Dict[str, Any]) -> str:
+    """Text a job posting is semantically matched on"""
+    parts = [job.get("title"), job.get("description"), " ".join(job.get("skills") or [])]
+    return " ".join(part for part in parts if part)
@@ -3,8 +3,49 @@ Test configuration and fixtures
 """
 import pytest
 import asyncio
+from bson import ObjectId
 from fastapi.testclient import TestClient
 from src.api.main import app
+from src.models.candidate import Candidate
+from src.services import skill_index_service as skill_index_module
+from src.services.matching_service import MatchingService
+from src.services.skill_index_service import SkillIndexService
+
+
+class FakeCursor:
+    """Async iterator over in-memory documents"""
+
+    def __init__(self, docs):
+        self.docs = docs
+
+    def __aiter__(self):
+        return self._iterate()
+
+    async def _iterate(self):
+        for doc in self.docs:
+            yield doc
+
+
+class FakeCollection:
+    """Collection whose find() yields every document it holds"""
+
+    def __init__(self, docs):
+        self.docs = docs
+
+    def find(self, query=None, projection=None):
+        return FakeCursor(self.docs)
+
+
+class FakeCandidateService:
+    """Serves candidates with the skills a skill index holds for them, recording each batch of ids fetched"""
+
+    def __init__(self, index):
+        self.index = index
+        self.fetched = []
+
+    async def get_candidates_by_ids(self, candidate_ids, exclude_fields=None):
+        self.fetched.append(list(candidate_ids))
+        return [Candidate(_id=ObjectId(i), skills=list(self.index.get_skills(i))) for i in candidate_ids]
 
 
 @pytest.fixture(scope="session")
@@ -31,4 +72,32 @@ def sample_job_data():
         "experience_level": "Mid",
         "department": "Engineering",
         "location": "Remote"
-    }
\ No newline at end of file
+    }
+
+
+@pytest.fixture
+def build_skill_index(monkeypatch):
+    """Build a skill index through its public build() from in-memory documents"""
+    async def build(index, docs):
+        monkeypatch.setattr(skill_index_module, "get_database", lambda: {index.collection_name: FakeCollection(docs)})
+        await index.build()
+        return index
+    return build
+
+
+@pytest.fixture
+def make_matching_service(build_skill_index):
+    """
+    MatchingService over in-memory candidate documents
+
+    Builds a candidate skill index (with bitsets, unless another index is
+    given) from the documents and serves candidates from it through a
+    FakeCandidateService.
+    """
+    async def make(docs, index=None):
+        index = await build_skill_index(index or SkillIndexService("candidates", with_bitsets=True), docs)
+        service = MatchingService()
+        service.skill_index = index
+        service.candidate_service = FakeCandidateService(index)
+        return service
+    return make
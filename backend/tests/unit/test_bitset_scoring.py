@@ -0,0 +1,75 @@
+"""
+Unit tests for the bitset scoring engine
+"""
+from src.services.bitset_scoring_service import BitsetScoringService
+
+
+class TestBitsetScoringService:
+    """Test cases for BitsetScoringService"""
+
+    def test_score_counts_shared_skills(self):
+        engine = BitsetScoringService()
+        engine.set_candidate("c1", ["Python", "FastAPI", "MongoDB"])
+        engine.set_candidate("c2", ["Python"])
+        engine.set_candidate("c3", ["Java"])
+
+        assert engine.score(["Python", "FastAPI"]).tolist() == [2, 1, 0]
+
+    def test_match_threshold_is_strict(self):
+        engine = BitsetScoringService()
+        engine.set_candidate("one", ["Python"])
+        engine.set_candidate("two", ["Python", "Docker"])
+
+        ids, percentages = engine.match(["Python", "FastAPI", "MongoDB", "Docker", "Kubernetes"], 20)
+
+        # 1 of 5 skills is exactly 20% and must be excluded
+        assert ids == ["two"]
+        assert percentages.tolist() == [40.0]
+
+    def test_unknown_job_skills_score_zero(self):
+        engine = BitsetScoringService()
+        engine.set_candidate("c1", ["Python"])
+
+        ids, _ = engine.match(["Haskell"], 20)
+
+        assert ids == []
+        assert engine.score(["Haskell"]).tolist() == [0]
+
+    def test_vocabulary_wider_than_one_word(self):
+        engine = BitsetScoringService()
+        skills = [f"skill-{i}" for i in range(200)]
+        engine.set_candidate("wide", skills)
+        engine.set_candidate("narrow", ["skill-0"])
+
+        assert engine.score(["skill-0", "skill-150", "skill-199"]).tolist() == [3, 1]
+        assert engine.matched_skills("wide", ["skill-199", "skill-0"]) == ["skill-199", "skill-0"]
+        assert engine.matched_skills("narrow", ["skill-199", "skill-0"]) == ["skill-0"]
+
+    def test_update_and_remove_reuse_rows(self):
+        engine = BitsetScoringService()
+        engine.set_candidate("c1", ["Python"])
+        engine.set_candidate("c1", ["Go"])
+        assert engine.matched_skills("c1", ["Python", "Go"]) == ["Go"]
+
+        engine.remove_candidate("c1")
+        engine.set_candidate("c2", ["Rust"])
+
+        ids, _ = engine.match(["Go", "Rust"], 20)
+        assert ids == ["c2"]
+        assert engine.candidate_count == 1
+
+    def test_grows_past_initial_capacity(self):
+        engine = BitsetScoringService()
+        for i in range(3000):
+            engine.set_candidate(f"c{i}", ["Python"] if i % 2 else ["Java"])
+
+        ids, _ = engine.match(["Python"], 20)
+        assert len(ids) == 1500
+
+    def test_job_spanning_many_words(self):
+        engine = BitsetScoringService()
+        skills = [f"skill-{i}" for i in range(64 * 40)]
+        engine.set_candidate("all", skills)
+        engine.set_candidate("half", skills[::2])
+
+        assert engine.score(skills).tolist() == [len(skills), len(skills) // 2]
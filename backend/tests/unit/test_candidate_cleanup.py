@@ -0,0 +1,134 @@
+"""
+Unit tests for cascading candidate deletes and the orphan sweeper
+"""
+import os
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from bson import ObjectId
+from pydantic import ValidationError
+
+from src.models.candidate import CandidateBulkDelete
+from src.services import candidate_cleanup_service as cleanup_module
+from src.services.candidate_cleanup_service import CandidateCleanupService
+from src.services.document_service import remove_files
+
+
+class FakeCursor:
+    def __init__(self, documents):
+        self.documents = documents
+
+    def batch_size(self, size):
+        return self
+
+    async def __aiter__(self):
+        for document in self.documents:
+            yield document
+
+
+def fake_collection(documents=(), deleted_count=0):
+    collection = MagicMock()
+    collection.find.return_value = FakeCursor(list(documents))
+    collection.aggregate.return_value = FakeCursor(list(documents))
+    collection.delete_many = AsyncMock(return_value=MagicMock(deleted_count=deleted_count))
+    return collection
+
+
+@pytest.fixture
+def indexes(monkeypatch):
+    for name in ("skill_index_service", "resume_search_service", "semantic_index_service"):
+        monkeypatch.setattr(cleanup_module, name, MagicMock())
+    match_store = MagicMock()
+    match_store.remove_candidates = AsyncMock()
+    monkeypatch.setattr(cleanup_module, "match_store_service", match_store)
+    return cleanup_module
+
+
+class FakeDatabase(dict):
+    def __getattr__(self, name):
+        return self[name]
+
+
+def make_service(candidates, documents=(), deleted=(0, 0, 0, 0)):
+    service = CandidateCleanupService()
+    service.candidate_service._collection = fake_collection(candidates, deleted[0])
+    service._db = FakeDatabase(
+        documents=fake_collection(documents, deleted[1]),
+        raw_text_data=fake_collection(deleted_count=deleted[2]),
+        candidate_extra_details=fake_collection(deleted_count=deleted[3])
+    )
+    return service
+
+
+@pytest.mark.asyncio
+async def test_bulk_delete_cascades_in_batches(indexes, monkeypatch):
+    monkeypatch.setattr(cleanup_module, "DELETE_BATCH_SIZE", 2)
+    ids = [ObjectId() for _ in range(3)]
+    service = make_service(
+        [{"_id": object_id} for object_id in ids],
+        documents=[{"raw_file_path": "uploads/a/resume.pdf"}],
+        deleted=(2, 1, 2, 3)
+    )
+
+    result, file_paths = await service.delete_candidates(CandidateBulkDelete(skills=["python"], location="Remote"))
+
+    assert service.candidate_service.collection.find.call_args.args[0] == {"skills": {"$in": ["Python"]}, "location": "Remote"}
+    batches = [call.args[0]["_id"]["$in"] for call in service.candidate_service.collection.delete_many.call_args_list]
+    assert batches == [ids[:2], ids[2:]]
+    raw_texts = service.db["raw_text_data"].delete_many
+    assert raw_texts.call_args_list[1].args[0] == {"candidate_id": {"$in": ids[2:]}}
+    assert (result.candidates, result.documents, result.raw_texts, result.extra_details) == (4, 2, 4, 6)
+    assert file_paths == ["uploads/a/resume.pdf"] * 2 and result.files == 2
+    assert indexes.skill_index_service.remove_entry.call_count == 3
+    indexes.match_store_service.remove_candidates.assert_any_call(ids[:2])
+
+
+def test_bulk_delete_needs_ids_or_filters():
+    CandidateBulkDelete(ids=[str(ObjectId())])
+    CandidateBulkDelete(created_before=datetime(2020, 1, 1))
+    with pytest.raises(ValidationError):
+        CandidateBulkDelete()
+    with pytest.raises(ValidationError):
+        CandidateBulkDelete(ids=[str(ObjectId())], location="Remote")
+    with pytest.raises(ValidationError):
+        CandidateBulkDelete(ids=["not-an-id"])
+
+
+@pytest.mark.asyncio
+async def test_sweeper_removes_orphaned_artifacts_and_unreferenced_files(indexes, tmp_path, monkeypatch):
+    monkeypatch.setattr(cleanup_module.config, "UPLOAD_DIR", str(tmp_path))
+    orphan = ObjectId()
+    (tmp_path / str(orphan)).mkdir()
+    orphan_file = tmp_path / str(orphan) / "resume.pdf"
+    kept_file = tmp_path / "kept.pdf"
+    stray_file = tmp_path / "stray.pdf"
+    new_file = tmp_path / "new.pdf"
+    for path in (orphan_file, kept_file, stray_file, new_file):
+        path.write_bytes(b"%PDF")
+    for path in (orphan_file, kept_file, stray_file):
+        os.utime(path, (0, 0))
+
+    service = make_service([], deleted=(0, 1, 1, 0))
+    service.db["raw_text_data"].aggregate.return_value = FakeCursor([{"_id": orphan}])
+    documents = service.db.documents
+    documents.find.side_effect = [
+        FakeCursor([{"raw_file_path": str(orphan_file)}]),
+        FakeCursor([{"raw_file_path": str(kept_file)}])
+    ]
+
+    result = await service.sweep_orphans()
+
+    assert documents.delete_many.call_args.args[0] == {"candidate_id": {"$in": [orphan]}}
+    assert (result.documents, result.raw_texts, result.files) == (1, 1, 2)
+    assert not orphan_file.exists() and not orphan_file.parent.exists() and not stray_file.exists()
+    assert kept_file.exists() and new_file.exists()
+
+
+def test_remove_files_skips_missing_files(tmp_path):
+    path = tmp_path / "candidate" / "resume.pdf"
+    path.parent.mkdir()
+    path.write_bytes(b"")
+
+    assert remove_files([str(path), str(tmp_path / "missing.pdf")]) == 1
+    assert not path.parent.exists()
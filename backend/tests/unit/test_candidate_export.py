@@ -0,0 +1,108 @@
+"""
+Unit tests for streaming candidate export
+"""
+import csv
+import io
+import json
+from datetime import datetime
+from unittest.mock import MagicMock
+
+import pytest
+from bson import ObjectId
+
+from src.services.candidate_export_service import (DEFAULT_EXPORT_COLUMNS, CandidateExportService,
+                                                   export_columns)
+from src.services.candidate_service import PAGE_SORT
+
+CANDIDATES = [
+    {"_id": ObjectId(), "name": f"Candidate {number}", "email": f"c{number}@example.com",
+     "skills": ["Python", "Go"] if number % 2 else None, "created_at": datetime(2024, 1, number + 1)}
+    for number in range(5)
+]
+
+
+class FakeCursor:
+    def __init__(self, documents):
+        self.documents = documents
+
+    def sort(self, sort):
+        self.sort_order = sort
+        return self
+
+    def batch_size(self, size):
+        self.size = size
+        return self
+
+    async def __aiter__(self):
+        for document in self.documents:
+            yield document
+
+
+def make_service(documents=CANDIDATES):
+    service = CandidateExportService()
+    service.candidate_service._collection = MagicMock()
+    cursor = FakeCursor(documents)
+    service.candidate_service._collection.find.return_value = cursor
+    return service, cursor
+
+
+async def collect(chunks):
+    return [chunk async for chunk in chunks]
+
+
+@pytest.mark.asyncio
+async def test_csv_export_streams_one_chunk_per_batch_without_raw_text():
+    service, cursor = make_service()
+
+    chunks = await collect(service.open_export("csv", batch_size=2))
+
+    projection = service.candidate_service.collection.find.call_args.args[1]
+    assert "raw_text" not in projection and cursor.sort_order == PAGE_SORT and cursor.size == 2
+    assert len(chunks) == 3
+    rows = list(csv.DictReader(io.StringIO(b"".join(chunks).decode())))
+    assert list(rows[0]) == DEFAULT_EXPORT_COLUMNS
+    assert [row["name"] for row in rows] == [f"Candidate {number}" for number in range(5)]
+    assert rows[1]["skills"] == "Python, Go" and rows[0]["skills"] == ""
+    assert rows[0]["id"] == str(CANDIDATES[0]["_id"]) and rows[0]["created_at"] == "2024-01-01T00:00:00"
+
+
+@pytest.mark.asyncio
+async def test_ndjson_export_writes_selected_columns():
+    service, _ = make_service()
+
+    chunks = await collect(service.open_export("ndjson", columns=export_columns("email, name"), batch_size=10))
+
+    assert service.candidate_service.collection.find.call_args.args[1] == {"name": 1, "email": 1, "_id": 0}
+    lines = b"".join(chunks).decode().splitlines()
+    assert json.loads(lines[1]) == {"name": "Candidate 1", "email": "c1@example.com"}
+
+
+@pytest.mark.asyncio
+async def test_parquet_export_writes_a_row_group_per_batch():
+    pq = pytest.importorskip("pyarrow.parquet")
+    service, _ = make_service()
+
+    chunks = await collect(service.open_export("parquet", columns=["id", "name", "skills", "created_at"], batch_size=2))
+
+    parquet = pq.ParquetFile(io.BytesIO(b"".join(chunks)))
+    assert parquet.metadata.num_row_groups == 3
+    table = parquet.read()
+    assert table.column("name").to_pylist() == [f"Candidate {number}" for number in range(5)]
+    assert table.column("skills").to_pylist()[1] == ["Python", "Go"]
+    assert table.column("created_at").to_pylist()[0] == datetime(2024, 1, 1)
+
+
+@pytest.mark.asyncio
+async def test_empty_csv_export_still_has_a_header():
+    service, _ = make_service([])
+
+    chunks = await collect(service.open_export("csv", columns=["id", "email"]))
+
+    assert b"".join(chunks).decode().splitlines() == ["id,email"]
+
+
+def test_unknown_export_fields_are_rejected():
+    assert export_columns(None) == DEFAULT_EXPORT_COLUMNS
+    assert export_columns("raw_text,id") == ["id", "raw_text"]
+    with pytest.raises(ValueError):
+        export_columns("name,password")
@@ -1,5 +1,5 @@
 import pytest
-from unittest.mock import mock_open, patch, MagicMock
+from unittest.mock import AsyncMock, mock_open, patch, MagicMock
 import io
 from bson import ObjectId
 from datetime import datetime
@@ -204,6 +204,87 @@ class TestCandidateExtraDetailsService:
             
             assert detected_type == expected_type, f"Failed for filename: {filename}"
 
+    @pytest.mark.asyncio
+    @patch.object(CandidateService, 'extra_details_collection')
+    async def test_extra_details_for_a_page_are_read_in_one_query(self, mock_collection, candidate_service):
+        """Test extra details for many candidates come from a single $in query"""
+        first, second, third = ObjectId(), ObjectId(), ObjectId()
+        docs = [
+            {'_id': ObjectId(), 'candidate_id': second, 'text_content': 'Newer', 'created_at': datetime(2024, 2, 1)},
+            {'_id': ObjectId(), 'candidate_id': first, 'text_content': 'Only', 'created_at': datetime(2024, 1, 15)},
+            {'_id': ObjectId(), 'candidate_id': second, 'text_content': 'Older', 'created_at': datetime(2024, 1, 1)}
+        ]
+
+        async def iterate():
+            for doc in docs:
+                yield doc
+
+        mock_collection.find.return_value.sort.return_value = iterate()
+
+        result = await candidate_service.get_extra_details_for_candidates([str(first), str(second), str(third)])
+
+        mock_collection.find.assert_called_once_with({'candidate_id': {'$in': [first, second, third]}})
+        assert [detail.text_content for detail in result[str(first)]] == ['Only']
+        assert [detail.text_content for detail in result[str(second)]] == ['Newer', 'Older']
+        assert result[str(third)] == []
+
+    @pytest.mark.asyncio
+    async def test_candidate_details_are_read_in_one_aggregation(self, candidate_service, mock_candidate):
+        """Test a candidate, its documents and extra details come from a single $lookup pipeline"""
+        candidate_id = mock_candidate['_id']
+        aggregated = dict(mock_candidate, documents=[{
+            '_id': ObjectId(), 'candidate_id': candidate_id, 'file_name': 'resume.pdf', 'file_type': 'PDF',
+            'content_text': 'Resume', 'raw_file_path': 'uploads/resume.pdf', 'upload_date': datetime(2024, 1, 1)
+        }], extra_details=[
+            {'_id': ObjectId(), 'candidate_id': candidate_id, 'text_content': 'Newer', 'created_at': datetime(2024, 2, 1)},
+            {'_id': ObjectId(), 'candidate_id': candidate_id, 'text_content': 'Older', 'type': 'feedback', 'created_at': datetime(2024, 1, 1)}
+        ])
+        candidate_service._collection = MagicMock()
+        candidate_service._collection.aggregate.return_value.to_list = AsyncMock(return_value=[aggregated])
+
+        candidate, documents, extra_details = await candidate_service.get_candidate_details(str(candidate_id))
+
+        pipeline = candidate_service.collection.aggregate.call_args.args[0]
+        assert candidate_service.collection.aggregate.call_count == 1
+        assert pipeline[0] == {'$match': {'_id': candidate_id}}
+        assert [stage['$lookup']['from'] for stage in pipeline[1:]] == ['documents', 'candidate_extra_details']
+        assert candidate.name == 'Test Candidate'
+        assert [document.file_name for document in documents] == ['resume.pdf']
+        assert [detail.text_content for detail in extra_details] == ['Newer', 'Older']
+        assert extra_details[1].candidate_id == str(candidate_id)
+
+    @pytest.mark.asyncio
+    async def test_candidate_details_for_missing_or_invalid_ids_are_none(self, candidate_service):
+        """Test unknown and malformed ids read as missing candidates"""
+        candidate_service._collection = MagicMock()
+        candidate_service._collection.aggregate.return_value.to_list = AsyncMock(return_value=[])
+
+        assert await candidate_service.get_candidate_details(str(ObjectId())) is None
+        assert await candidate_service.get_candidate_details("non-existent-id") is None
+        assert candidate_service.collection.aggregate.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_extra_details_alone_join_nothing_else(self, candidate_service):
+        """Test the extra details endpoint's read keeps only the candidate's _id and joins only its extra details"""
+        candidate_id = ObjectId()
+        candidate_service._collection = MagicMock()
+        candidate_service._collection.aggregate.return_value.to_list = AsyncMock(side_effect=[[{
+            '_id': candidate_id, 'extra_details': [
+                {'_id': ObjectId(), 'candidate_id': candidate_id, 'text_content': 'Newer', 'created_at': datetime(2024, 2, 1)},
+                {'_id': ObjectId(), 'candidate_id': candidate_id, 'text_content': 'Older', 'created_at': datetime(2024, 1, 1)}
+            ]
+        }], [{'_id': candidate_id, 'extra_details': []}], []])
+
+        extra_details = await candidate_service.find_candidate_extra_details(str(candidate_id))
+
+        pipeline = candidate_service.collection.aggregate.call_args.args[0]
+        assert pipeline[:2] == [{'$match': {'_id': candidate_id}}, {'$project': {'_id': 1}}]
+        assert [stage['$lookup']['from'] for stage in pipeline[2:]] == ['candidate_extra_details']
+        assert [detail.text_content for detail in extra_details] == ['Newer', 'Older']
+        assert await candidate_service.find_candidate_extra_details(str(candidate_id)) == []
+        assert await candidate_service.find_candidate_extra_details(str(ObjectId())) is None
+        assert await candidate_service.find_candidate_extra_details("non-existent-id") is None
+
 
 class TestFileParsingServiceUnit:
     """Additional unit tests for file parsing service"""
@@ -0,0 +1,100 @@
+"""
+Unit tests for bulk candidate import
+"""
+import io
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from bson import ObjectId
+from pymongo.errors import BulkWriteError
+
+from src.services import candidate_import_service as import_module
+from src.services.candidate_import_service import CandidateImportService, csv_rows, import_format, ndjson_rows
+
+
+class FakeCandidates:
+    """Collection whose email index rejects emails it has already seen, as the unique index does"""
+
+    def __init__(self, existing=()):
+        self.emails = set(existing)
+        self.batches = []
+
+    async def insert_many(self, documents, ordered=True):
+        assert ordered is False
+        self.batches.append(len(documents))
+        errors = []
+        for index, document in enumerate(documents):
+            document["_id"] = ObjectId()
+            if document["email"] in self.emails:
+                errors.append({"index": index, "code": 11000, "errmsg": "E11000 duplicate key"})
+            self.emails.add(document["email"])
+        if errors:
+            raise BulkWriteError({"writeErrors": errors, "nInserted": len(documents) - len(errors)})
+
+
+@pytest.fixture
+def service(monkeypatch):
+    for name in ("skill_index_service", "semantic_index_service"):
+        monkeypatch.setattr(import_module, name, MagicMock())
+    match_store = MagicMock()
+    match_store.add_candidates = AsyncMock()
+    monkeypatch.setattr(import_module, "match_store_service", match_store)
+    service = CandidateImportService()
+    service.candidate_service._collection = FakeCandidates(existing={"taken@example.com"})
+    return service
+
+
+def ndjson(*rows):
+    return io.BytesIO("".join((row if isinstance(row, str) else json.dumps(row)) + "\n" for row in rows).encode())
+
+
+@pytest.mark.asyncio
+async def test_ndjson_import_reports_each_row_it_did_not_insert(service):
+    file = ndjson(
+        {"name": "Ada", "email": "ada@example.com", "skills": ["python", "reactjs"]},
+        {"name": "Taken", "email": "taken@example.com"},
+        "{not json",
+        {"name": "", "email": "blank@example.com"},
+        "",
+        {"name": "Again", "email": "ada@example.com"},
+        {"name": "Grace", "email": "grace@example.com"}
+    )
+
+    result = await service.import_file(file, "ndjson", batch_size=3)
+
+    assert (result.inserted, result.duplicates, result.failed) == (2, 2, 2)
+    assert [(error.row, error.reason) for error in result.errors] == [
+        (2, "duplicate"), (3, "invalid"), (4, "invalid"), (6, "duplicate")
+    ]
+    assert result.errors[1].detail.startswith("Invalid JSON")
+    assert service.candidate_service.collection.batches == [2, 2]
+    assert import_module.skill_index_service.add_entry.call_args_list[0].args[1] == ["Python", "React"]
+    assert import_module.semantic_index_service.add_documents.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_csv_import_splits_skill_cells(service):
+    file = io.BytesIO(
+        b'\xef\xbb\xbfName,Email,Skills,Location\n'
+        b'Ada,ada@example.com,"python, go;k8s",Remote\n'
+        b'\n'
+        b'Grace,grace@example.com,,\n'
+        b'Bad,bad@example.com,Go,Remote,extra\n'
+    )
+
+    result = await service.import_file(file, "csv")
+
+    assert (result.inserted, result.duplicates, result.failed) == (2, 0, 1)
+    assert result.errors[0].row == 4
+    first_call = import_module.skill_index_service.add_entry.call_args_list[0]
+    assert first_call.args[1] == ["Python", "Go", "Kubernetes"]
+    assert first_call.args[2]["location"] == "Remote"
+
+
+def test_parsers_and_format_detection():
+    assert import_format("candidates.JSONL") == "ndjson"
+    assert import_format("export.csv") == "csv"
+    assert import_format("resume.pdf") is None and import_format(None) is None
+    assert list(ndjson_rows(io.BytesIO(b'[1, 2]\n'))) == [(1, None, "Each line must be a JSON object")]
+    assert list(csv_rows(io.BytesIO(b''))) == []
@@ -0,0 +1,117 @@
+"""
+Unit tests for keyset pagination of the candidate list
+"""
+from datetime import datetime, timedelta
+
+import pytest
+from bson import ObjectId
+
+from src.services.candidate_service import CandidateService
+
+
+def matches(doc, query):
+    """Evaluate the subset of Mongo queries get_candidate_page issues"""
+    if "$or" in query:
+        return any(matches(doc, clause) for clause in query["$or"])
+    for field, condition in query.items():
+        value = doc.get(field)
+        if isinstance(condition, dict):
+            if value is None or not value < condition["$lt"]:
+                return False
+        elif value != condition:
+            return False
+    return True
+
+
+class FakeCursor:
+    def __init__(self, docs, query):
+        self.docs = [doc for doc in docs if matches(doc, query)]
+
+    def sort(self, keys):
+        for field, direction in reversed(keys):
+            # Missing values sort lowest, as in Mongo
+            self.docs.sort(key=lambda doc: (doc.get(field) is not None, doc.get(field) or 0), reverse=direction < 0)
+        return self
+
+    def limit(self, count):
+        self.docs = self.docs[:count]
+        return self
+
+    async def to_list(self, length=None):
+        return list(self.docs)
+
+
+class FakeCollection:
+    def __init__(self, docs):
+        self.docs = docs
+
+    def find(self, query=None, projection=None):
+        return FakeCursor(self.docs, query or {})
+
+
+def make_doc(created_at):
+    return {"_id": ObjectId(), "name": "Candidate", "email": "c@example.com", "created_at": created_at}
+
+
+def make_service(docs):
+    service = CandidateService()
+    service._collection = FakeCollection(docs)
+    return service
+
+
+async def read_all(service, limit):
+    ids, cursor = [], None
+    while True:
+        page, cursor = await service.get_candidate_page(limit=limit, cursor=cursor)
+        ids += [str(candidate.id) for candidate in page]
+        if cursor is None:
+            return ids
+
+
+@pytest.mark.asyncio
+async def test_pages_walk_every_candidate_newest_first_with_ties_broken_by_id():
+    start = datetime(2024, 1, 1)
+    # Pairs share a timestamp so pages have to split ties on _id
+    docs = [make_doc(start + timedelta(minutes=i // 2)) for i in range(7)]
+    service = make_service(docs)
+
+    expected = [str(doc["_id"]) for doc in sorted(docs, key=lambda d: (d["created_at"], d["_id"]), reverse=True)]
+    assert await read_all(service, limit=2) == expected
+    assert await read_all(service, limit=7) == expected
+
+
+@pytest.mark.asyncio
+async def test_pages_do_not_shift_when_candidates_are_inserted():
+    start = datetime(2024, 1, 1)
+    docs = [make_doc(start + timedelta(minutes=i)) for i in range(4)]
+    service = make_service(docs)
+
+    first, cursor = await service.get_candidate_page(limit=2)
+    docs.append(make_doc(start + timedelta(days=1)))
+    second, cursor = await service.get_candidate_page(limit=2, cursor=cursor)
+
+    assert cursor is None
+    assert [str(c.id) for c in first + second] == [str(doc["_id"]) for doc in reversed(docs[:4])]
+
+
+@pytest.mark.asyncio
+async def test_candidates_without_created_at_are_paged_last_by_id():
+    start = datetime(2024, 1, 1)
+    docs = [make_doc(start + timedelta(minutes=i)) for i in range(3)]
+    undated = [make_doc(None) for _ in range(3)]
+    for doc in undated:
+        # Shaped like the Zoho sync's documents
+        del doc["created_at"]
+    service = make_service(docs + undated)
+
+    expected = [str(doc["_id"]) for doc in reversed(docs)] + sorted((str(doc["_id"]) for doc in undated), reverse=True)
+    assert await read_all(service, limit=2) == expected
+    assert await read_all(service, limit=1) == expected
+
+
+@pytest.mark.asyncio
+async def test_malformed_cursor_is_rejected():
+    service = make_service([])
+
+    with pytest.raises(ValueError):
+        await service.get_candidate_page(cursor="not-a-cursor")
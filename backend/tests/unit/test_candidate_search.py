@@ -0,0 +1,87 @@
+"""
+Unit tests for text-index candidate search
+"""
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from bson import ObjectId
+
+from src.services.candidate_service import PAGE_SORT, SUMMARY_PROJECTION, CandidateService
+
+
+def make_service(docs):
+    cursor = MagicMock()
+    cursor.sort.return_value = cursor
+    cursor.skip.return_value = cursor
+    cursor.limit.return_value = cursor
+    cursor.to_list = AsyncMock(return_value=docs)
+    service = CandidateService()
+    service._collection = MagicMock()
+    service._collection.find.return_value = cursor
+    return service, cursor
+
+
+@pytest.mark.asyncio
+async def test_query_uses_the_text_index_and_ranks_by_relevance():
+    service, cursor = make_service([{"_id": ObjectId(), "name": "Ada Lovelace"}])
+
+    candidates = await service.search_candidates("lovelace", ["python"], skip=20, limit=10)
+
+    search_filter, projection = service.collection.find.call_args.args
+    assert search_filter == {"$text": {"$search": "lovelace"}, "skills": {"$in": ["Python"]}}
+    assert projection is None
+    assert cursor.sort.call_args.args[0][0] == ("score", {"$meta": "textScore"})
+    cursor.skip.assert_called_once_with(20)
+    cursor.limit.assert_called_once_with(10)
+    assert [candidate.name for candidate in candidates] == ["Ada Lovelace"]
+
+
+@pytest.mark.asyncio
+async def test_skills_only_search_lists_newest_first_in_summary_view():
+    service, cursor = make_service([])
+
+    await service.search_candidates("", ["Go"], summary=True)
+
+    search_filter, projection = service.collection.find.call_args.args
+    assert search_filter == {"skills": {"$in": ["Go"]}}
+    assert projection is SUMMARY_PROJECTION
+    cursor.sort.assert_called_once_with(PAGE_SORT)
+
+
+@pytest.mark.asyncio
+async def test_facet_search_is_one_aggregation_over_summary_fields():
+    service = CandidateService()
+    service._collection = MagicMock()
+    service._collection.aggregate.return_value.to_list = AsyncMock(return_value=[{
+        "candidates": [{"_id": ObjectId(), "name": "Ada", "has_raw_text": True}],
+        "total": [{"count": 42}],
+        "skills": [{"_id": "Python", "count": 30}, {"_id": "Go", "count": 12}],
+        "location": [{"_id": "Remote", "count": 20}],
+        "experience": [{"_id": 5, "count": 25}, {"_id": 20, "count": 2}, {"_id": "unknown", "count": 15}]
+    }])
+
+    candidates, total, facets = await service.facet_search("engineer", ["python"], location="Remote", limit=1)
+
+    pipeline = service.collection.aggregate.call_args.args[0]
+    assert service.collection.aggregate.call_count == 1
+    assert pipeline[0] == {"$match": {"$text": {"$search": "engineer"}, "skills": {"$in": ["Python"]}, "location": "Remote"}}
+    assert pipeline[2] == {"$project": SUMMARY_PROJECTION}
+    assert set(pipeline[3]["$facet"]) == {"candidates", "total", "skills", "location", "experience"}
+    assert [candidate.name for candidate in candidates] == ["Ada"] and total == 42
+    assert [(facet.value, facet.count) for facet in facets["skills"]] == [("Python", 30), ("Go", 12)]
+    assert [facet.value for facet in facets["experience"]] == ["5-10 years", "20+ years", "unknown"]
+
+
+@pytest.mark.asyncio
+async def test_facet_search_with_no_matches_counts_zero():
+    service = CandidateService()
+    service._collection = MagicMock()
+    service._collection.aggregate.return_value.to_list = AsyncMock(return_value=[{
+        "candidates": [], "total": [], "skills": [], "location": [], "experience": []
+    }])
+
+    candidates, total, facets = await service.facet_search("")
+
+    assert service.collection.aggregate.call_args.args[0][0] == {"$match": {}}
+    assert candidates == [] and total == 0
+    assert facets == {"skills": [], "location": [], "experience": []}
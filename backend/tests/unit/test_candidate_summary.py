@@ -0,0 +1,73 @@
+"""
+Unit tests for summary candidate reads that leave the resume text in Mongo
+"""
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from bson import ObjectId
+
+from src.models.candidate import Candidate
+from src.services.candidate_service import SUMMARY_PROJECTION, CandidateService
+
+
+def make_service(docs):
+    cursor = MagicMock()
+    cursor.sort.return_value = cursor
+    cursor.limit.return_value = cursor
+    cursor.to_list = AsyncMock(return_value=docs)
+    service = CandidateService()
+    service._collection = MagicMock()
+    service._collection.find.return_value = cursor
+    return service
+
+
+def test_summary_projection_leaves_out_raw_text_but_keeps_response_fields():
+    assert "raw_text" not in SUMMARY_PROJECTION
+    assert {"name", "email", "skills", "created_at", "document_id"} <= SUMMARY_PROJECTION.keys()
+    assert isinstance(SUMMARY_PROJECTION["has_raw_text"], dict)
+
+
+@pytest.mark.asyncio
+async def test_summary_page_projects_and_reports_whether_text_exists():
+    doc = {"_id": ObjectId(), "name": "Ada", "created_at": datetime(2024, 1, 1), "has_raw_text": True}
+    service = make_service([doc])
+
+    page, _ = await service.get_candidate_page(limit=10, summary=True)
+    response = service.to_response(page[0])
+
+    assert service.collection.find.call_args.args[1] is SUMMARY_PROJECTION
+    assert response.raw_text is None and response.has_raw_text is True
+
+
+@pytest.mark.asyncio
+async def test_full_page_reads_whole_documents():
+    service = make_service([])
+
+    await service.get_candidate_page(limit=10)
+
+    assert service.collection.find.call_args.args[1] is None
+    assert service.to_response(Candidate(raw_text="resume")).has_raw_text is True
+
+
+def test_list_endpoint_returns_full_candidates_unless_asked_for_summary(client, monkeypatch):
+    get_page = AsyncMock(return_value=([Candidate(name="Ada", raw_text="resume")], None))
+    monkeypatch.setattr(CandidateService, "get_candidate_page", get_page)
+
+    assert client.get("/api/candidates/").json()[0]["raw_text"] == "resume"
+    assert get_page.call_args.kwargs["summary"] is False
+    client.get("/api/candidates/", params={"view": "summary"})
+    assert get_page.call_args.kwargs["summary"] is True
+
+
+@pytest.mark.asyncio
+async def test_raw_text_is_read_on_its_own():
+    service = CandidateService()
+    service._collection = MagicMock()
+    service._collection.find_one = AsyncMock(side_effect=[{"_id": ObjectId(), "raw_text": "resume"}, {"_id": ObjectId()}, None])
+    candidate_id = str(ObjectId())
+
+    assert await service.get_candidate_raw_text(candidate_id) == "resume"
+    assert service.collection.find_one.call_args.args[1] == {"raw_text": 1}
+    assert await service.get_candidate_raw_text(candidate_id) == ""
+    assert await service.get_candidate_raw_text(candidate_id) is None
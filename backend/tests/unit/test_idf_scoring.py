@@ -0,0 +1,73 @@
+"""
+Unit tests for IDF-weighted match scoring
+"""
+import math
+
+import pytest
+from bson import ObjectId
+
+from src.models.job_posting import JobPosting
+from src.services.skill_index_service import SkillIndexService
+
+
+JOB = JobPosting(title="Platform", skills=["Git", "Agile", "Kubernetes", "Rust"])
+
+
+def candidate_docs():
+    # Git and Agile are everywhere, Kubernetes and Rust are rare
+    rare = ObjectId()
+    docs = [{"_id": ObjectId(), "skills": ["Git", "Agile"]} for _ in range(8)]
+    return docs + [{"_id": rare, "skills": ["Kubernetes", "Rust"]}], str(rare)
+
+
+@pytest.mark.asyncio
+async def test_idf_weights_favour_rare_skills_and_refresh_on_write(build_skill_index):
+    docs, _ = candidate_docs()
+    index = await build_skill_index(SkillIndexService("candidates", with_bitsets=True), docs)
+
+    weights = index.idf_weights(["Git", "Rust", "Unknown"])
+    assert weights["Git"] == pytest.approx(math.log(10 / 9) + 1)
+    assert weights["Rust"] == pytest.approx(math.log(10 / 2) + 1)
+    assert weights["Unknown"] > weights["Rust"] > weights["Git"]
+
+    index.add_entry(str(ObjectId()), ["Rust"])
+    assert index.idf_weights(["Rust"])["Rust"] == pytest.approx(math.log(11 / 3) + 1)
+
+
+@pytest.mark.asyncio
+async def test_weighted_bitset_match_matches_direct_computation(build_skill_index):
+    docs, rare = candidate_docs()
+    index = await build_skill_index(SkillIndexService("candidates", with_bitsets=True), docs)
+    skills = list(JOB.skills)
+    weights = index.idf_weights(skills)
+
+    candidate_ids, percentages = index.bitsets.match(skills, 20, weights)
+
+    expected = (weights["Kubernetes"] + weights["Rust"]) * 100 / sum(weights.values())
+    assert percentages[candidate_ids.index(rare)] == pytest.approx(expected)
+
+
+@pytest.mark.asyncio
+async def test_idf_mode_ranks_rare_matches_first(make_matching_service):
+    docs, rare = candidate_docs()
+    service = await make_matching_service(docs)
+
+    plain = await service.get_candidates_for_job(JOB)
+    weighted = await service.get_candidates_for_job(JOB, scoring="idf")
+
+    # Every candidate matches half the skills, so plain scoring ties them all
+    assert {c.match_percentage for c in plain} == {50.0}
+    assert str(weighted[0].id) == rare
+    assert weighted[0].match_percentage > 50.0 > weighted[-1].match_percentage
+
+
+@pytest.mark.asyncio
+async def test_cursor_is_tied_to_scoring_mode(make_matching_service):
+    service = await make_matching_service(candidate_docs()[0])
+
+    _, next_cursor = await service.get_candidate_page(JOB, limit=1, scoring="idf")
+
+    with pytest.raises(ValueError):
+        await service.get_candidate_page(JOB, limit=1, cursor=next_cursor)
+    with pytest.raises(ValueError):
+        await service.get_candidate_page(JOB, scoring="bm25")
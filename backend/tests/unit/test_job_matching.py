@@ -0,0 +1,74 @@
+"""
+Unit tests for candidate -> jobs matching
+"""
+import pytest
+from unittest.mock import AsyncMock
+
+from src.services.matching_service import MatchingService
+from src.services.skill_index_service import SkillIndexService
+from src.models.candidate import Candidate
+from src.models.job_posting import JobPosting
+
+
+JOBS = [
+    JobPosting(id="backend", title="Backend", skills=["Python", "FastAPI", "MongoDB"]),
+    JobPosting(id="data", title="Data", skills=["Python", "SQL", "Pandas", "Spark", "Airflow"]),
+    JobPosting(id="ios", title="iOS", skills=["Swift"]),
+    JobPosting(id="open", title="Open role", skills=[]),
+]
+
+
+@pytest.fixture
+def make_service(build_skill_index):
+    async def make():
+        service = MatchingService()
+        service.job_index = await build_skill_index(
+            SkillIndexService("job_postings", id_field="id"), [job.model_dump() for job in JOBS]
+        )
+        service.job_service = AsyncMock()
+        service.job_service.get_jobs_by_ids.side_effect = lambda ids: [job for job in JOBS if job.id in ids]
+        return service
+    return make
+
+
+@pytest.mark.asyncio
+async def test_jobs_ranked_with_job_side_percentage(make_service):
+    service = await make_service()
+    candidate = Candidate(name="Dev", skills=["Python", "FastAPI", "SQL"])
+
+    matches = await service.get_jobs_for_candidate(candidate)
+
+    assert [job.id for job in matches] == ["backend", "data"]
+    assert [job.match_percentage for job in matches] == [66.7, 40.0]
+    assert matches[0].matched_skills == ["Python", "FastAPI"]
+    assert matches[1].matched_skills == ["Python", "SQL"]
+
+
+@pytest.mark.asyncio
+async def test_jobs_below_threshold_are_not_fetched(make_service):
+    service = await make_service()
+    candidate = Candidate(name="Dev", skills=["Python"])
+
+    matches = await service.get_jobs_for_candidate(candidate)
+
+    # 1/5 of the data job is exactly 20% and is excluded
+    assert [job.id for job in matches] == ["backend"]
+    service.job_service.get_jobs_by_ids.assert_called_once_with(["backend"])
+
+
+@pytest.mark.asyncio
+async def test_candidate_without_skills_matches_nothing(make_service):
+    service = await make_service()
+
+    assert await service.get_jobs_for_candidate(Candidate(name="Dev")) == []
+    service.job_service.get_jobs_by_ids.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_limit_keeps_best_jobs(make_service):
+    service = await make_service()
+    candidate = Candidate(name="Dev", skills=["Python", "FastAPI", "SQL", "Swift"])
+
+    matches = await service.get_jobs_for_candidate(candidate, limit=1)
+
+    assert [job.id for job in matches] == ["ios"]
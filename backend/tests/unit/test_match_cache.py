@@ -0,0 +1,111 @@
+"""
+Unit tests for the match result cache
+"""
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock
+
+import pytest
+from bson import ObjectId
+
+from src.models.candidate import Candidate
+from src.models.job_posting import JobPosting
+from src.services.match_cache_service import MatchCacheService
+from src.services.skill_index_service import SkillIndexService
+
+
+@pytest.fixture
+def make_service(make_matching_service):
+    async def make():
+        full = ObjectId()
+        service = await make_matching_service([
+            {"_id": full, "skills": ["Python", "FastAPI"]},
+            {"_id": ObjectId(), "skills": ["Python"]},
+        ])
+        service.match_store = AsyncMock(is_ready=False)
+        service.match_cache = MatchCacheService(max_entries=8, max_results=100)
+        return service, str(full)
+    return make
+
+
+def test_lru_evicts_least_recently_used_and_respects_result_budget():
+    cache = MatchCacheService(max_entries=2, max_results=10)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+    cache.put("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1 and cache.get("c") == 3
+
+    cache.put("big", 4, size=9)
+    assert cache.get("a") is None and cache.get("big") == 4
+    cache.put("too big", 5, size=11)
+    assert cache.get("too big") is None
+
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["evictions"]) == (4, 3, 2)
+    assert stats["results"] == 10
+
+
+@pytest.mark.asyncio
+async def test_repeated_job_page_is_served_from_cache_with_explanations(make_service):
+    service, full = await make_service()
+    job = JobPosting(title="API", skills=["Python", "FastAPI"])
+
+    first, _ = await service.get_candidate_page(job, limit=10)
+    second, _ = await service.get_candidate_page(job, limit=10)
+
+    assert len(service.candidate_service.fetched) == 1
+    assert service.match_cache.hits == 1
+    assert [str(candidate.id) for candidate in second] == [str(candidate.id) for candidate in first]
+    explanation = second[1].match_explanation
+    assert [(item.skill, item.matched, item.contribution) for item in explanation] == [
+        ("Python", True, 50.0), ("FastAPI", False, 0.0)
+    ]
+    # Callers get copies, so mutating a result never reaches the cache
+    second[0].match_percentage = 0
+    third, _ = await service.get_candidate_page(job, limit=10)
+    assert third[0].match_percentage == 100.0
+
+
+@pytest.mark.asyncio
+async def test_job_or_candidate_writes_invalidate_job_pages(make_service):
+    service, full = await make_service()
+    job = JobPosting(title="API", skills=["Python", "FastAPI"])
+    await service.get_candidate_page(job)
+
+    job.updated_at = job.updated_at + timedelta(seconds=1)
+    await service.get_candidate_page(job)
+    assert len(service.candidate_service.fetched) == 2
+
+    service.skill_index.add_entry(full, ["FastAPI"])
+    page, _ = await service.get_candidate_page(job)
+    assert len(service.candidate_service.fetched) == 3
+    assert [candidate.match_percentage for candidate in page] == [50.0, 50.0]
+
+
+@pytest.mark.asyncio
+async def test_candidate_jobs_cached_by_candidate_version_and_job_pool(make_service, build_skill_index):
+    service, _ = await make_service()
+    job_index = await build_skill_index(
+        SkillIndexService("job_postings", id_field="id"), [{"id": "api", "skills": ["Python", "FastAPI"]}]
+    )
+    jobs = {"api": JobPosting(id="api", title="API", skills=["Python", "FastAPI"])}
+    service.job_index = job_index
+    service.job_service = AsyncMock()
+    service.job_service.get_jobs_by_ids.side_effect = lambda ids: [jobs[i] for i in ids]
+    candidate = Candidate(name="Dev", skills=["Python"], updated_at=datetime(2024, 1, 1))
+
+    matches = await service.get_jobs_for_candidate(candidate)
+    await service.get_jobs_for_candidate(candidate)
+    assert service.job_service.get_jobs_by_ids.call_count == 1
+    assert matches[0].match_explanation[0].contribution == 50.0
+
+    candidate.updated_at = datetime(2024, 1, 2)
+    await service.get_jobs_for_candidate(candidate)
+    job_index.add_entry("other", ["Python"])
+    jobs["other"] = JobPosting(id="other", title="Other", skills=["Python"])
+    matches = await service.get_jobs_for_candidate(candidate)
+
+    assert service.job_service.get_jobs_by_ids.call_count == 3
+    assert [job.id for job in matches] == ["other", "api"]
@@ -0,0 +1,77 @@
+"""
+Unit tests for structured filters applied before match scoring
+"""
+from datetime import datetime, timedelta
+
+import pytest
+from bson import ObjectId
+
+from src.models.candidate import CandidateFilters
+from src.models.job_posting import JobPosting
+from src.services.bitset_scoring_service import BitsetScoringService
+from src.utils.experience import parse_experience_years
+
+
+NOW = datetime(2024, 6, 1)
+
+
+def make_engine():
+    engine = BitsetScoringService()
+    engine.set_candidate("sf-senior", ["Python"], {"location": "San Francisco, CA", "experience": "8 years in backend", "created_at": NOW})
+    engine.set_candidate("sf-junior", ["Python"], {"location": "san francisco", "experience": "1 year", "created_at": NOW - timedelta(days=400)})
+    engine.set_candidate("ny", ["Python"], {"location": "New York, NY", "experience": "5+ years", "created_at": NOW})
+    engine.set_candidate("unknown", ["Python"])
+    return engine
+
+
+def test_parse_experience_years():
+    assert parse_experience_years("5 years in frontend development") == 5.0
+    assert parse_experience_years("3+ years") == 3.0
+    assert parse_experience_years("2.5 yrs of Go") == 2.5
+    assert parse_experience_years("Senior engineer") is None
+    assert parse_experience_years(None) is None
+
+
+def test_no_active_filters_selects_nothing_up_front():
+    engine = make_engine()
+
+    assert engine.filter_rows(None) is None
+    assert engine.filter_rows(CandidateFilters()) is None
+
+
+def test_filters_select_rows_before_scoring():
+    engine = make_engine()
+
+    def matched(**filters):
+        ids, _ = engine.match(["Python"], 20, rows=engine.filter_rows(CandidateFilters(**filters)))
+        return sorted(ids)
+
+    assert matched(location="San Francisco") == ["sf-junior", "sf-senior"]
+    assert matched(min_experience_years=3) == ["ny", "sf-senior"]
+    assert matched(max_experience_years=2) == ["sf-junior"]
+    assert matched(created_after=NOW - timedelta(days=30)) == ["ny", "sf-senior"]
+    assert matched(location="francisco", min_experience_years=3) == ["sf-senior"]
+    assert matched(location="Berlin") == []
+
+
+def test_removed_candidate_drops_out_of_filters():
+    engine = make_engine()
+    engine.remove_candidate("ny")
+    engine.set_candidate("berlin", ["Python"], {"location": "Berlin"})
+
+    ids, _ = engine.match(["Python"], 20, rows=engine.filter_rows(CandidateFilters(location="new york")))
+    assert ids == []
+
+
+@pytest.mark.asyncio
+async def test_matching_applies_filters(make_matching_service):
+    local, remote = ObjectId(), ObjectId()
+    service = await make_matching_service([
+        {"_id": local, "skills": ["Python", "FastAPI"], "location": "Austin, TX", "experience": "6 years"},
+        {"_id": remote, "skills": ["Python", "FastAPI"], "location": "Remote", "experience": "6 years"},
+    ])
+
+    job = JobPosting(title="Backend", skills=["Python", "FastAPI"])
+    candidates = await service.get_candidates_for_job(job, filters=CandidateFilters(location="austin"))
+
+    assert [str(c.id) for c in candidates] == [str(local)]
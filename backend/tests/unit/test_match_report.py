@@ -0,0 +1,85 @@
+"""
+Unit tests for the bulk job x candidates match report
+"""
+import numpy as np
+import pytest
+from bson import ObjectId
+
+from src.services import match_report_service as report_module
+from src.services.match_report_service import MatchReportService
+from src.services.skill_index_service import SkillIndexService
+from src.utils.scoring import SCORING_IDF
+
+SKILLS = ["Python", "FastAPI", "SQL", "React", "Docker", "Go", "Rust", "AWS"]
+
+
+@pytest.fixture
+def make_service(build_skill_index):
+    async def make(size=300, seed=7):
+        random = np.random.default_rng(seed)
+        docs = []
+        for _ in range(size):
+            picks = random.choice(len(SKILLS), size=int(random.integers(1, 5)), replace=False)
+            docs.append({"_id": ObjectId(), "skills": [SKILLS[pick] for pick in picks]})
+        service = MatchReportService()
+        service.skill_index = await build_skill_index(SkillIndexService("candidates", with_bitsets=True), docs)
+        return service
+    return make
+
+
+JOBS = [
+    {"id": "api", "title": "API", "skills": ["Python", "FastAPI", "SQL"]},
+    {"id": "infra", "title": "Infra", "skills": ["Docker", "AWS", "Go", "Rust", "Python"]},
+    {"id": "none", "title": "No skills", "skills": []},
+]
+
+
+def expected_top(index, job, top_n, weights=None):
+    """The matching API's ranking: percentage desc, candidate id asc"""
+    skills = list(dict.fromkeys(job["skills"]))
+    if not skills:
+        return []
+    candidate_ids, percentages = index.bitsets.match(skills, 20, weights)
+    ranked = sorted(zip((-p for p in percentages.tolist()), candidate_ids))[:top_n]
+    return [(candidate_id, round(-score, 1)) for score, candidate_id in ranked]
+
+
+async def collect(service, **kwargs):
+    return [report async for report in service.generate(jobs=JOBS, **kwargs)]
+
+
+@pytest.mark.asyncio
+async def test_report_matches_per_job_ranking(make_service):
+    service = await make_service()
+
+    reports = await collect(service, top_n=5, workers=1)
+
+    assert [report["job_id"] for report in reports] == ["api", "infra", "none"]
+    for job, report in zip(JOBS, reports):
+        got = [(row["candidate_id"], row["match_percentage"]) for row in report["candidates"]]
+        assert got == expected_top(service.skill_index, job, 5)
+    first = reports[0]["candidates"][0]
+    assert first["matched_skills"] == service.skill_index.matched_skills(first["candidate_id"], JOBS[0]["skills"])
+
+
+@pytest.mark.asyncio
+async def test_idf_report_uses_pool_weights(make_service):
+    service = await make_service()
+
+    reports = await collect(service, top_n=3, workers=1, scoring=SCORING_IDF)
+
+    weights = service.skill_index.idf_weights(JOBS[1]["skills"])
+    got = [(row["candidate_id"], row["match_percentage"]) for row in reports[1]["candidates"]]
+    assert got == expected_top(service.skill_index, JOBS[1], 3, weights)
+
+
+@pytest.mark.asyncio
+async def test_blocks_scored_across_processes_merge_to_the_same_report(monkeypatch, make_service):
+    service = await make_service(size=500)
+    monkeypatch.setattr(report_module, "CANDIDATE_BLOCK_SIZE", 64)
+
+    serial = await collect(service, top_n=20, workers=1)
+    parallel = await collect(service, top_n=20, workers=2)
+
+    assert parallel == serial
+    assert len(serial[0]["candidates"]) == 20
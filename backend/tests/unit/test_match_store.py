@@ -0,0 +1,190 @@
+"""
+Unit tests for the precomputed job x candidate match store
+"""
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from bson import ObjectId
+
+import src.services.match_store_service as match_store_module
+from src.services.match_store_service import MatchStoreService
+from src.services.matching_service import MatchingService
+from src.services.skill_index_service import SkillIndexService
+from src.models.job_posting import JobPosting
+
+
+@pytest.fixture
+def indexes(monkeypatch, build_skill_index):
+    """Build the candidate and job skill indexes the store scores from"""
+    async def build(candidates=None, jobs=None):
+        candidate_index = await build_skill_index(
+            SkillIndexService("candidates", with_bitsets=True),
+            [{"_id": ObjectId(candidate_id), "skills": skills} for candidate_id, skills in (candidates or {}).items()],
+        )
+        job_index = await build_skill_index(
+            SkillIndexService("job_postings", id_field="id"),
+            [{"id": job_id, "skills": skills} for job_id, skills in (jobs or {}).items()],
+        )
+        monkeypatch.setattr(match_store_module, "skill_index_service", candidate_index)
+        monkeypatch.setattr(match_store_module, "job_skill_index_service", job_index)
+        return candidate_index, job_index
+    return build
+
+
+@pytest.fixture
+def store():
+    service = MatchStoreService()
+    service._db = MagicMock()
+    service._db.job_candidate_matches.delete_many = AsyncMock()
+    service._db.job_candidate_matches.insert_many = AsyncMock()
+    return service
+
+
+@pytest.mark.asyncio
+async def test_candidate_row_scores_against_every_sharing_job(indexes, store):
+    await indexes(jobs={
+        "backend": ["Python", "FastAPI", "MongoDB"],
+        "data": ["Python", "SQL", "Pandas", "Spark", "Airflow"],
+    })
+    candidate_id = str(ObjectId())
+
+    rows = store._score_candidate_row(candidate_id, ["MongoDB", "Python"])
+
+    assert [(row["job_id"], round(row["match_percentage"], 1)) for row in rows] == [("backend", 66.7)]
+    assert rows[0]["matched_skills"] == ["Python", "MongoDB"]
+    assert rows[0]["candidate_id"] == ObjectId(candidate_id)
+
+
+@pytest.mark.asyncio
+async def test_job_column_scores_against_every_candidate(indexes, store):
+    strong, weak = str(ObjectId()), str(ObjectId())
+    await indexes(
+        candidates={strong: ["Python", "FastAPI"], weak: ["Python"]},
+        jobs={"backend": ["Python", "FastAPI", "MongoDB", "Docker", "Kubernetes"]},
+    )
+
+    rows = store._score_job_column("backend")
+
+    assert [row["candidate_id"] for row in rows] == [ObjectId(strong)]
+    assert rows[0]["match_percentage"] == 40.0
+
+
+@pytest.mark.asyncio
+async def test_incremental_updates_wait_for_first_build(indexes, store):
+    await indexes()
+    await store.refresh_candidate(str(ObjectId()), ["Python"])
+    await store.refresh_job("backend")
+
+    store.collection.delete_many.assert_not_called()
+    store.collection.insert_many.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_refresh_candidate_replaces_its_row(indexes, store):
+    await indexes(jobs={"backend": ["Python", "FastAPI"]})
+    store._ready = True
+    candidate_id = str(ObjectId())
+
+    await store.refresh_candidate(candidate_id, ["Python"])
+
+    store.collection.delete_many.assert_called_once_with({"candidate_id": ObjectId(candidate_id)})
+    inserted = store.collection.insert_many.call_args[0][0]
+    assert [row["job_id"] for row in inserted] == ["backend"]
+
+
+class _Cursor:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def __aiter__(self):
+        return self._iterate()
+
+    async def _iterate(self):
+        for row in self.rows:
+            yield row
+
+
+@pytest.mark.asyncio
+async def test_reconcile_rewrites_only_rows_that_differ(indexes, store):
+    kept, missing, changed, gone = (str(ObjectId()) for _ in range(4))
+    await indexes(
+        candidates={candidate_id: ["Python", "FastAPI"] for candidate_id in (kept, missing, changed)},
+        jobs={"backend": ["Python", "FastAPI"]},
+    )
+    store.collection.delete_many.return_value = MagicMock(deleted_count=0)
+    store.collection.find = MagicMock(return_value=_Cursor([
+        {"candidate_id": ObjectId(kept), "match_percentage": 100.0, "matched_skills": ["FastAPI", "Python"]},
+        {"candidate_id": ObjectId(changed), "match_percentage": 50.0, "matched_skills": ["Python"]},
+        {"candidate_id": ObjectId(gone), "match_percentage": 100.0, "matched_skills": ["Python", "FastAPI"]},
+    ]))
+    store.meta_collection.update_one = AsyncMock()
+
+    changes = await store.reconcile()
+
+    assert store.is_ready
+    assert changes == 4
+    store.collection.delete_many.assert_any_call({"job_id": {"$nin": ["backend"]}})
+    store.collection.delete_many.assert_any_call(
+        {"job_id": "backend", "candidate_id": {"$in": [ObjectId(changed), ObjectId(gone)]}}
+    )
+    inserted = store.collection.insert_many.call_args[0][0]
+    assert sorted(str(row["candidate_id"]) for row in inserted) == sorted([missing, changed])
+
+
+@pytest.mark.asyncio
+async def test_writes_during_reconcile_are_rescored_after_it(indexes, store):
+    candidate_id = str(ObjectId())
+    await indexes(candidates={candidate_id: ["Python", "FastAPI"]}, jobs={"backend": ["Python", "FastAPI"]})
+    store.collection.delete_many.return_value = MagicMock(deleted_count=0)
+    store.collection.find = MagicMock(return_value=_Cursor([]))
+    store.meta_collection.update_one = AsyncMock()
+
+    await store.refresh_candidate(candidate_id, ["Python", "FastAPI"])
+    await store.remove_job("data")
+    store.collection.insert_many.reset_mock()
+    await store.reconcile()
+
+    assert store.is_ready
+    store.collection.delete_many.assert_any_call({"candidate_id": ObjectId(candidate_id)})
+    store.collection.delete_many.assert_any_call({"job_id": "data"})
+    replayed = store.collection.insert_many.call_args[0][0]
+    assert [(row["job_id"], str(row["candidate_id"])) for row in replayed] == [("backend", candidate_id)]
+
+
+@pytest.mark.asyncio
+async def test_job_matches_limit_after_candidate_join(store):
+    store.collection.aggregate = MagicMock()
+    store.collection.aggregate.return_value.to_list = AsyncMock(return_value=[])
+
+    await store.get_job_matches("backend", limit=10)
+
+    stages = [next(iter(stage)) for stage in store.collection.aggregate.call_args[0][0]]
+    assert stages.index("$limit") > stages.index("$unwind")
+
+
+def test_build_query_continues_after_cursor(store):
+    after_id = str(ObjectId())
+
+    query = store.build_query("backend", min_score=50, after_score=75.0, after_id=after_id)
+
+    assert query["job_id"] == "backend"
+    assert query["match_percentage"] == {"$gte": 50}
+    assert query["$or"][1] == {"match_percentage": 75.0, "candidate_id": {"$gt": ObjectId(after_id)}}
+
+
+@pytest.mark.asyncio
+async def test_matching_reads_page_from_store():
+    ids = [ObjectId(), ObjectId()]
+    service = MatchingService()
+    service.match_store = MagicMock(is_ready=True)
+    service.match_store.get_job_matches = AsyncMock(return_value=[
+        {"_id": ids[0], "name": "A", "match_percentage": 200 / 3, "matched_skills": ["Python", "FastAPI"]},
+        {"_id": ids[1], "name": "B", "match_percentage": 100 / 3, "matched_skills": ["Python"]},
+    ])
+
+    job = JobPosting(id="backend", skills=["Python", "FastAPI", "MongoDB"])
+    page, next_cursor = await service.get_candidate_page(job, limit=1)
+
+    assert service.match_store.get_job_matches.call_args.kwargs["limit"] == 2
+    assert [c.name for c in page] == ["A"]
+    assert page[0].match_percentage == 66.7
+    assert next_cursor is not None
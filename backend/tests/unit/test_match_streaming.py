@@ -0,0 +1,78 @@
+"""
+Unit tests for streaming job -> candidates match results
+"""
+import json
+
+import pytest
+from bson import ObjectId
+
+from src.models.job_posting import JobPosting
+from src.services import matching_service as matching_module
+from src.services.match_cache_service import MatchCacheService
+from src.utils.ndjson import ndjson_lines
+
+
+JOB = JobPosting(title="API", skills=["Python", "FastAPI", "SQL"])
+
+
+@pytest.fixture
+def make_service(make_matching_service):
+    async def make():
+        skill_sets = (["Python"], ["Python", "FastAPI"], ["SQL", "FastAPI"], ["Python", "FastAPI", "SQL"], ["Go"]) * 3
+        service = await make_matching_service([{"_id": ObjectId(), "skills": skills} for skills in skill_sets])
+        service.match_cache = MatchCacheService(max_entries=0)
+        return service
+    return make
+
+
+async def drain(stream):
+    return [candidate async for candidate in stream]
+
+
+@pytest.mark.asyncio
+async def test_stream_matches_page_order_and_fetches_in_batches(monkeypatch, make_service):
+    service = await make_service()
+    monkeypatch.setattr(matching_module, "STREAM_BATCH_SIZE", 4)
+
+    page, _ = await service.get_candidate_page(JOB)
+    stream, next_cursor = await service.open_candidate_stream(JOB)
+    streamed = await drain(stream)
+
+    assert next_cursor is None
+    assert [(str(c.id), c.match_percentage) for c in streamed] == [(str(c.id), c.match_percentage) for c in page]
+    assert [len(batch) for batch in service.candidate_service.fetched[1:]] == [4, 4, 4]
+    assert streamed[0].match_explanation[0].contribution == pytest.approx(33.3)
+
+
+@pytest.mark.asyncio
+async def test_stream_cursor_continues_where_a_page_left_off(make_service):
+    service = await make_service()
+
+    first, cursor = await service.open_candidate_stream(JOB, limit=5)
+    first = await drain(first)
+    rest, last_cursor = await service.open_candidate_stream(JOB, cursor=cursor)
+    rest = await drain(rest)
+    everything, _ = await service.get_candidate_page(JOB)
+
+    assert last_cursor is None
+    assert [str(c.id) for c in first + rest] == [str(c.id) for c in everything]
+
+
+@pytest.mark.asyncio
+async def test_stream_rejects_bad_arguments_before_streaming(make_service):
+    service = await make_service()
+
+    with pytest.raises(ValueError):
+        await service.open_candidate_stream(JOB, scoring="bogus")
+    assert service.candidate_service.fetched == []
+
+
+@pytest.mark.asyncio
+async def test_ndjson_lines_serialize_like_json_responses(make_service):
+    service = await make_service()
+    stream, _ = await service.open_candidate_stream(JOB, limit=2)
+
+    lines = [line async for line in ndjson_lines(stream)]
+
+    assert len(lines) == 2 and all(line.endswith("\n") for line in lines)
+    assert json.loads(lines[0])["match_percentage"] == 100.0
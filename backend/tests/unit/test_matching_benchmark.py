@@ -0,0 +1,32 @@
+"""
+Smoke test for the matching benchmark so it keeps working as matching evolves
+"""
+import pytest
+
+from benchmarks.matching import SyntheticPool, load_skill_weights, main
+
+
+def test_skill_weights_are_seeded_from_init_script():
+    skills, weights = load_skill_weights()
+
+    assert "Python" in skills
+    assert weights.sum() == pytest.approx(1.0)
+    # Skills that occur most in the seed data are the most likely to be drawn
+    assert weights[0] == weights.max()
+
+
+def test_synthetic_pool_is_deterministic():
+    first = SyntheticPool(seed=7).candidates(5)
+    second = SyntheticPool(seed=7).candidates(5)
+
+    assert [doc["skills"] for doc in first] == [doc["skills"] for doc in second]
+    assert all(3 <= len(doc["skills"]) <= 12 for doc in first)
+
+
+@pytest.mark.asyncio
+async def test_benchmark_runs_on_small_in_memory_pool(capsys):
+    results = await main(["--sizes", "200", "--queries", "3", "--scoring", "plain", "idf", "semantic"])
+
+    assert [(result.pool_size, result.scoring) for result in results] == [(200, "plain"), (200, "idf"), (200, "semantic")]
+    assert all(result.end_to_end_p99_ms >= result.end_to_end_p50_ms > 0 for result in results)
+    assert "kernel p50" in capsys.readouterr().out
@@ -0,0 +1,75 @@
+"""
+Unit tests for top-K and cursor pagination of job matches
+"""
+import pytest
+from bson import ObjectId
+
+from src.models.job_posting import JobPosting
+
+
+JOB = JobPosting(title="Backend", skills=["Python", "FastAPI", "MongoDB", "Docker"])
+
+
+@pytest.fixture
+def make_service(make_matching_service):
+    async def make(skill_sets):
+        return await make_matching_service([{"_id": ObjectId(), "skills": skills} for skills in skill_sets])
+    return make
+
+
+@pytest.mark.asyncio
+async def test_limit_materializes_only_requested_page(make_service):
+    service = await make_service([["Python", "FastAPI", "MongoDB"], ["Python", "FastAPI"], ["Python", "Docker"], ["Java"]])
+
+    page, next_cursor = await service.get_candidate_page(JOB, limit=1)
+
+    assert [c.match_percentage for c in page] == [75.0]
+    assert service.candidate_service.fetched == [[str(page[0].id)]]
+    assert next_cursor is not None
+
+
+@pytest.mark.asyncio
+async def test_cursor_walks_every_match_once(make_service):
+    service = await make_service([["Python", "FastAPI"]] * 5 + [["Python", "FastAPI", "MongoDB"]] * 3)
+
+    expected = await service.get_candidates_for_job(JOB)
+    seen, cursor = [], None
+    while True:
+        page, cursor = await service.get_candidate_page(JOB, limit=3, cursor=cursor)
+        seen.extend(page)
+        if cursor is None:
+            break
+
+    assert [str(c.id) for c in seen] == [str(c.id) for c in expected]
+    assert len(seen) == 8
+
+
+@pytest.mark.asyncio
+async def test_cursor_is_stable_under_inserts(make_service):
+    service = await make_service([["Python", "FastAPI", "MongoDB"], ["Python", "FastAPI"], ["Python", "Docker"]])
+
+    first, cursor = await service.get_candidate_page(JOB, limit=1)
+    # A better match inserted after the first page must not shift the next page
+    service.skill_index.add_entry(str(ObjectId()), ["Python", "FastAPI", "MongoDB", "Docker"])
+    rest, _ = await service.get_candidate_page(JOB, cursor=cursor)
+
+    assert [c.match_percentage for c in rest] == [50.0, 50.0]
+    assert str(first[0].id) not in {str(c.id) for c in rest}
+
+
+@pytest.mark.asyncio
+async def test_min_score_filters_before_materializing(make_service):
+    service = await make_service([["Python", "FastAPI", "MongoDB"], ["Python", "FastAPI"]])
+
+    page, next_cursor = await service.get_candidate_page(JOB, min_score=60)
+
+    assert [c.match_percentage for c in page] == [75.0]
+    assert next_cursor is None
+
+
+@pytest.mark.asyncio
+async def test_malformed_cursor_raises_value_error(make_service):
+    service = await make_service([["Python", "FastAPI"]])
+
+    with pytest.raises(ValueError):
+        await service.get_candidate_page(JOB, limit=1, cursor="not-a-cursor")
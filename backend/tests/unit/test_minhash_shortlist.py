@@ -0,0 +1,74 @@
+"""
+Unit tests for MinHash/LSH candidate shortlisting
+"""
+import pytest
+from bson import ObjectId
+
+from src.models.job_posting import JobPosting
+from src.services.match_cache_service import MatchCacheService
+from src.services.minhash_shortlist_service import MinHashShortlistService
+from src.services.skill_index_service import SkillIndexService
+
+
+def test_shortlist_finds_identical_sets_and_skips_disjoint_ones():
+    shortlist = MinHashShortlistService(bands=16, rows_per_band=2)
+    shortlist.set_row(0, ["Python", "FastAPI", "MongoDB"])
+    shortlist.set_row(1, ["Swift", "Kotlin"])
+    shortlist.set_row(2, [])
+    shortlist.refresh()
+
+    assert shortlist.shortlist(["MongoDB", "Python", "FastAPI"]).tolist() == [0]
+    assert shortlist.shortlist(["Haskell"]).tolist() == []
+    assert shortlist.shortlist([]).tolist() == []
+
+
+def test_rows_written_after_the_snapshot_are_looked_up_by_their_current_keys():
+    shortlist = MinHashShortlistService(bands=16, rows_per_band=2)
+    shortlist.set_row(0, ["Python", "FastAPI"])
+    shortlist.set_row(1, ["Swift"])
+    shortlist.refresh()
+
+    shortlist.set_row(1, ["Python", "FastAPI"])
+    shortlist.clear_row(0)
+    shortlist.set_row(2, ["Python", "FastAPI"])
+
+    assert shortlist.shortlist(["Python", "FastAPI"]).tolist() == [1, 2]
+    shortlist.refresh()
+    assert shortlist.shortlist(["Python", "FastAPI"]).tolist() == [1, 2]
+
+
+def test_skill_index_keeps_shortlist_rows_in_step_with_bitsets():
+    index = SkillIndexService("candidates", with_bitsets=True)
+    first, second = str(ObjectId()), str(ObjectId())
+    index.add_entry(first, ["Go", "gRPC"])
+    index.add_entry(second, ["Go", "gRPC"])
+    index.remove_entry(first)
+
+    rows = index.shortlist.shortlist(["Go", "gRPC"])
+    assert index.bitsets.row_ids(rows) == [second]
+
+
+@pytest.mark.asyncio
+async def test_large_pools_only_exact_score_the_shortlist_unless_exact(make_matching_service):
+    index = SkillIndexService("candidates", with_bitsets=True)
+    # One band of many rows only shortlists identical skill sets
+    index.shortlist = MinHashShortlistService(bands=1, rows_per_band=64)
+    same, superset = ObjectId(), ObjectId()
+    service = await make_matching_service([
+        {"_id": same, "skills": ["Python", "SQL"]},
+        {"_id": superset, "skills": ["Python", "SQL", "Go", "Rust", "Docker", "AWS"]},
+    ], index=index)
+    same, superset = str(same), str(superset)
+    service.match_cache = MatchCacheService()
+    service.shortlist_min_pool_size = 2
+    job = JobPosting(title="Data", skills=["Python", "SQL"])
+
+    shortlisted = await service.get_candidates_for_job(job)
+    exact = await service.get_candidates_for_job(job, exact=True)
+
+    assert [str(candidate.id) for candidate in shortlisted] == [same]
+    assert sorted(str(candidate.id) for candidate in exact) == sorted([same, superset])
+
+    service.shortlist_min_pool_size = 3
+    service.match_cache.clear()
+    assert len(await service.get_candidates_for_job(job)) == 2
@@ -0,0 +1,158 @@
+"""
+Unit tests for the BM25 resume search index
+"""
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+from bson import ObjectId
+
+from src.services import resume_search_service as resume_search_module
+from src.services.resume_search_service import ResumeSearchService, parse_query
+
+KAFKA_FINTECH = str(ObjectId())
+FINTECH = str(ObjectId())
+KAFKA = str(ObjectId())
+
+RESUMES = {
+    KAFKA_FINTECH: "Senior engineer building Kafka pipelines at a fintech startup. Event sourcing with Kafka.",
+    FINTECH: "Fintech analyst working with Excel and SQL reporting",
+    KAFKA: "Platform engineer running Kafka clusters, sourcing event data from payments",
+}
+
+
+def make_index(path):
+    index = ResumeSearchService(path)
+    for candidate_id, text in RESUMES.items():
+        index.add_document(candidate_id, text)
+    return index
+
+
+def ids(hits):
+    return [candidate_id for candidate_id, _ in hits]
+
+
+def test_boolean_queries_and_phrases(tmp_path):
+    index = make_index(tmp_path)
+
+    assert ids(index.search("kafka AND fintech")) == [KAFKA_FINTECH]
+    assert ids(index.search("kafka fintech")) == [KAFKA_FINTECH]
+    assert ids(index.search("kafka -fintech")) == [KAFKA]
+    assert ids(index.search("kafka NOT (fintech OR excel)")) == [KAFKA]
+    assert ids(index.search('"event sourcing"')) == [KAFKA_FINTECH]
+    assert set(ids(index.search("excel OR payments"))) == {FINTECH, KAFKA}
+
+
+def test_more_occurrences_rank_higher(tmp_path):
+    index = make_index(tmp_path)
+
+    hits = index.search("kafka")
+
+    assert ids(hits) == [KAFKA_FINTECH, KAFKA]
+    assert hits[0][1] > hits[1][1] > 0
+    assert len(index.search("kafka", limit=1)) == 1
+
+
+def test_segments_persist_updates_and_deletions(tmp_path, monkeypatch):
+    monkeypatch.setattr(resume_search_module, "FLUSH_EVERY", 2)
+    monkeypatch.setattr(resume_search_module, "MAX_SEGMENTS", 2)
+    monkeypatch.setattr(resume_search_module, "MERGE_FACTOR", 2)
+    index = make_index(tmp_path)
+    for _ in range(4):
+        index.add_document(str(ObjectId()), "Go developer")
+    index.add_document(FINTECH, "Kafka streams for a fintech ledger")
+    index.remove_document(KAFKA)
+    index.save()
+
+    reloaded = ResumeSearchService(tmp_path)
+    assert reloaded.load()
+    assert len(reloaded._segments) <= 2
+    assert reloaded.document_count == 6
+    assert set(ids(reloaded.search("kafka fintech"))) == {KAFKA_FINTECH, FINTECH}
+    assert reloaded.search("excel") == []
+    assert len(reloaded.search("go developer")) == 4
+
+
+@pytest.mark.asyncio
+async def test_background_flush_keeps_removals_made_while_writing(tmp_path, monkeypatch):
+    monkeypatch.setattr(resume_search_module, "FLUSH_EVERY", 2)
+    monkeypatch.setattr(resume_search_module, "MAX_SEGMENTS", 2)
+    monkeypatch.setattr(resume_search_module, "MERGE_FACTOR", 2)
+    index = ResumeSearchService(tmp_path)
+    first, second, *rest = (str(ObjectId()) for _ in range(6))
+
+    index.add_document(first, "Kafka engineer")
+    index.add_document(second, "Kafka analyst")
+    await asyncio.sleep(0)
+    index.remove_document(second)
+    assert ids(index.search("kafka")) == [first]
+    await index._flush_task
+
+    index.add_document(rest[0], "Go developer")
+    index.add_document(rest[1], "Go developer")
+    await index._flush_task
+    index.add_document(rest[2], "Go developer")
+    index.add_document(rest[3], "Go developer")
+    await asyncio.sleep(0)
+    # Lands while the third flush merges the first two segments
+    index.remove_document(first)
+    await index.close()
+
+    reloaded = ResumeSearchService(tmp_path)
+    assert reloaded.load()
+    assert len(reloaded._segments) <= 2
+    assert reloaded.document_count == 4
+    assert reloaded.search("kafka") == []
+    assert set(ids(reloaded.search("go"))) == set(rest)
+
+
+class _Candidates:
+    def __init__(self, docs):
+        self.docs = docs
+
+    def find(self, query, projection):
+        wanted = set(query["_id"]["$in"]) if "_id" in query else None
+        return _Cursor([doc for doc in self.docs if wanted is None or doc["_id"] in wanted])
+
+
+class _Cursor:
+    def __init__(self, docs):
+        self.docs = docs
+
+    def __aiter__(self):
+        return self._iterate()
+
+    async def _iterate(self):
+        for doc in self.docs:
+            await asyncio.sleep(0)
+            yield doc
+
+
+@pytest.mark.asyncio
+async def test_build_catches_up_without_undoing_concurrent_writes(tmp_path, monkeypatch):
+    make_index(tmp_path).save()
+    added, concurrent = ObjectId(), str(ObjectId())
+    candidates = _Candidates([
+        {"_id": ObjectId(KAFKA_FINTECH), "raw_text": RESUMES[KAFKA_FINTECH]},
+        {"_id": ObjectId(FINTECH), "raw_text": RESUMES[FINTECH]},
+        {"_id": added, "raw_text": "Go developer"},
+    ])
+    monkeypatch.setattr(resume_search_module, "get_database", lambda: MagicMock(candidates=candidates))
+    index = ResumeSearchService(tmp_path)
+
+    building = asyncio.create_task(index.build())
+    await asyncio.sleep(0)
+    assert not index.is_built
+    index.add_document(concurrent, "Rust developer")
+    await building
+
+    assert index.is_built
+    assert index.search("payments") == []
+    assert ids(index.search("go")) == [str(added)]
+    assert ids(index.search("rust")) == [concurrent]
+
+
+@pytest.mark.parametrize("query", ["", "   ", "the and of", "(kafka", "kafka)", "AND kafka", "kafka OR"])
+def test_malformed_or_empty_queries_are_rejected(query):
+    with pytest.raises(ValueError):
+        parse_query(query)
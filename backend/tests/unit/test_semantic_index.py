@@ -0,0 +1,206 @@
+"""
+Unit tests for semantic (hashed TF-IDF) resume to job matching
+"""
+import asyncio
+from datetime import datetime
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+from bson import ObjectId
+
+from src.models.candidate import CandidateFilters
+from src.models.job_posting import JobPosting
+import src.services.semantic_index_service as semantic_index_module
+from src.services.semantic_index_service import SemanticIndexService
+from src.utils.text_features import candidate_text, hash_features, tokenize
+
+
+BACKEND_RESUME = "Senior Python developer building REST APIs with FastAPI and MongoDB on AWS"
+JAVA_RESUME = "Java engineer working on Spring Boot microservices and Kafka pipelines"
+DESIGN_RESUME = "Product designer creating prototypes in Figma and running user research"
+
+
+def make_index(tmp_path):
+    return SemanticIndexService(tmp_path / "semantic_index.npz", dimensions=1 << 16)
+
+
+def test_tokenize_keeps_technology_names():
+    assert tokenize("Node.js, C++ and C# with the .NET stack.") == ["node.js", "c++", "c#", ".net", "stack"]
+
+
+def test_hash_features_are_stable_and_sublinear():
+    indices, values = hash_features("python python python fastapi", 1 << 16)
+    again, _ = hash_features("python python python fastapi", 1 << 16)
+
+    assert indices.tolist() == again.tolist()
+    assert sorted(values.tolist())[-1] == pytest.approx(1 + np.log(3))
+
+
+def test_candidate_text_falls_back_to_profile():
+    assert candidate_text({"raw_text": "resume"}) == "resume"
+    assert candidate_text({"summary": "Backend dev", "skills": ["Python", "Go"]}) == "Backend dev Python Go"
+
+
+def test_similarity_ranks_relevant_resume_first(tmp_path):
+    index = make_index(tmp_path)
+    index.add_document("backend", BACKEND_RESUME)
+    index.add_document("java", JAVA_RESUME)
+    index.add_document("design", DESIGN_RESUME)
+
+    ids, scores = index.similarities("Python backend developer for REST APIs using MongoDB")
+
+    assert ids == ["backend"]
+    assert 0 < scores[0] <= 1
+
+
+def test_similarity_is_cosine(tmp_path):
+    index = make_index(tmp_path)
+    index.add_document("same", BACKEND_RESUME)
+    index.add_document("other", JAVA_RESUME)
+
+    ids, scores = index.similarities(BACKEND_RESUME)
+
+    assert ids == ["same"]
+    assert scores[0] == pytest.approx(1.0)
+
+
+def test_updates_and_removals_are_incremental(tmp_path):
+    index = make_index(tmp_path)
+    index.add_document("a", BACKEND_RESUME)
+    index.similarities("python")
+    index.add_document("a", JAVA_RESUME)
+    index.add_document("b", DESIGN_RESUME)
+    index.remove_document("b")
+
+    assert index.document_count == 1
+    assert index.similarities("python") == ([], pytest.approx(np.zeros(0)))
+    assert index.similarities("kafka")[0] == ["a"]
+    assert index._document_frequency.sum() == len(hash_features(JAVA_RESUME, 1 << 16)[0])
+
+
+def test_save_and_load_round_trip(tmp_path):
+    index = make_index(tmp_path)
+    index.add_document("a", BACKEND_RESUME)
+    index.add_document("b", JAVA_RESUME)
+    index.remove_document("a")
+    index.save()
+
+    reloaded = make_index(tmp_path)
+    assert reloaded.load()
+    assert reloaded.document_count == 1
+    assert reloaded.similarities(JAVA_RESUME)[0] == ["b"]
+    assert reloaded.similarities(JAVA_RESUME)[1] == pytest.approx(index.similarities(JAVA_RESUME)[1])
+
+
+class _Candidates:
+    def __init__(self, docs):
+        self.docs = docs
+
+    def find(self, query, projection):
+        wanted = set(query["_id"]["$in"]) if query else None
+        return _Cursor([doc for doc in self.docs if wanted is None or doc["_id"] in wanted])
+
+
+class _Cursor:
+    def __init__(self, docs):
+        self.docs = docs
+
+    def __aiter__(self):
+        return self._iterate()
+
+    async def _iterate(self):
+        for doc in self.docs:
+            # Let other tasks run between documents, as a real cursor does between batches
+            await asyncio.sleep(0)
+            yield doc
+
+
+@pytest.mark.asyncio
+async def test_build_revectorizes_rows_older_than_their_candidate(tmp_path, monkeypatch):
+    kept, updated, added, deleted = (ObjectId() for _ in range(4))
+    index = make_index(tmp_path)
+    index.add_document(str(kept), JAVA_RESUME, datetime(2024, 1, 1))
+    index.add_document(str(updated), DESIGN_RESUME, datetime(2024, 1, 1))
+    index.add_document(str(deleted), DESIGN_RESUME, datetime(2024, 1, 1))
+    index.save()
+
+    candidates = _Candidates([
+        {"_id": kept, "raw_text": JAVA_RESUME, "updated_at": datetime(2024, 1, 1)},
+        {"_id": updated, "raw_text": BACKEND_RESUME, "updated_at": datetime(2024, 2, 1)},
+        {"_id": added, "raw_text": DESIGN_RESUME, "updated_at": datetime(2024, 2, 1)},
+    ])
+    monkeypatch.setattr(semantic_index_module, "get_database", lambda: MagicMock(candidates=candidates))
+    reloaded = SemanticIndexService(tmp_path / "semantic_index.npz", dimensions=1 << 16)
+    await reloaded.build()
+
+    assert reloaded.document_count == 3
+    assert reloaded.similarities(BACKEND_RESUME)[0] == [str(updated)]
+    assert reloaded.similarities(DESIGN_RESUME)[0] == [str(added)]
+    # Untouched rows keep their place; re-vectorized ones are appended
+    assert reloaded._row_ids == [str(kept), str(updated), str(added)]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_first_use_shares_one_build_and_keeps_newer_writes(tmp_path, monkeypatch):
+    first, second = ObjectId(), ObjectId()
+    candidates = _Candidates([
+        {"_id": first, "raw_text": JAVA_RESUME, "updated_at": datetime(2024, 1, 1)},
+        {"_id": second, "raw_text": DESIGN_RESUME, "updated_at": datetime(2024, 1, 1)},
+    ])
+    database = MagicMock(return_value=MagicMock(candidates=candidates))
+    monkeypatch.setattr(semantic_index_module, "get_database", database)
+    index = SemanticIndexService(tmp_path / "semantic_index.npz", dimensions=1 << 16)
+
+    building = asyncio.create_task(index.ensure_built())
+    await asyncio.sleep(0)
+    index.add_document(str(second), BACKEND_RESUME, datetime(2024, 2, 1))
+    await asyncio.gather(building, index.ensure_built())
+
+    assert database.call_count == 1
+    assert index.is_built and index.document_count == 2
+    assert index.similarities(BACKEND_RESUME)[0] == [str(second)]
+    await index.close()
+
+
+@pytest.mark.asyncio
+async def test_writes_save_in_background_at_most_once_per_interval(tmp_path, monkeypatch):
+    monkeypatch.setattr(semantic_index_module, "SAVE_INTERVAL_SECONDS", 0)
+    index = make_index(tmp_path)
+    index.add_document("a", BACKEND_RESUME)
+    saving = index._saving
+    index.add_document("b", JAVA_RESUME)
+    index.remove_document("a")
+
+    assert saving is not None and index._saving is saving
+    await index.flush()
+
+    assert index._saving is None and index._unsaved_writes == 0
+    reloaded = make_index(tmp_path)
+    assert reloaded.load()
+    assert reloaded.similarities(JAVA_RESUME)[0] == ["b"]
+    assert reloaded.similarities(BACKEND_RESUME)[0] == []
+
+
+@pytest.mark.asyncio
+async def test_semantic_matching_mode_respects_filters(tmp_path, monkeypatch, make_matching_service):
+    local, remote = ObjectId(), ObjectId()
+    # No extracted skills: only the resume text can match
+    docs = [
+        {"_id": local, "location": "Austin", "raw_text": BACKEND_RESUME},
+        {"_id": remote, "location": "Remote", "raw_text": BACKEND_RESUME},
+    ]
+    service = await make_matching_service(docs)
+    monkeypatch.setattr(semantic_index_module, "get_database", lambda: MagicMock(candidates=_Candidates(docs)))
+    service.semantic_index = make_index(tmp_path)
+    local, remote = str(local), str(remote)
+
+    job = JobPosting(title="Backend Engineer", description="Python REST APIs with FastAPI", skills=["Go"])
+    assert await service.get_candidates_for_job(job) == []
+
+    everyone = await service.get_candidates_for_job(job, scoring="semantic")
+    filtered = await service.get_candidates_for_job(job, scoring="semantic", filters=CandidateFilters(location="austin"))
+
+    assert {str(c.id) for c in everyone} == {local, remote}
+    assert [str(c.id) for c in filtered] == [local]
+    assert 0 < filtered[0].match_percentage <= 100
@@ -0,0 +1,58 @@
+"""
+Unit tests for the prefix-trie skill autocomplete
+"""
+from src.services.skill_autocomplete_service import SkillAutocompleteService
+from src.services.skill_index_service import SkillIndexService
+
+
+def make_service():
+    candidates = SkillIndexService("candidates")
+    jobs = SkillIndexService("job_postings", id_field="id")
+    candidates.add_entry("c1", ["Python", "Pandas"])
+    candidates.add_entry("c2", ["Python", "PyTorch"])
+    jobs.add_entry("j1", ["PyTorch"])
+    jobs.add_entry("j2", ["PyTorch", "Pyramid Scheme Detection"])
+    return SkillAutocompleteService(candidates, jobs), candidates, jobs
+
+
+def names(suggestions):
+    return [suggestion.skill for suggestion in suggestions]
+
+
+def test_most_used_skills_rank_first_with_their_counts():
+    service, _, _ = make_service()
+
+    suggestions = service.suggest("py")
+
+    # Pandas completes through its "python pandas" alias
+    assert names(suggestions)[:4] == ["PyTorch", "Python", "Pandas", "Pyramid Scheme Detection"]
+    assert (suggestions[0].candidates, suggestions[0].jobs) == (1, 2)
+    assert names(service.suggest("PY", limit=1)) == ["PyTorch"]
+    assert service.suggest("pyx") == []
+
+
+def test_aliases_and_later_words_complete():
+    service, _, _ = make_service()
+
+    assert names(service.suggest("reactj")) == ["React"]
+    assert "Machine Learning" in names(service.suggest("learn"))
+    assert "Pyramid Scheme Detection" in names(service.suggest("detect"))
+
+
+def test_writes_update_the_trie_incrementally():
+    service, candidates, jobs = make_service()
+    assert names(service.suggest("py", limit=1)) == ["PyTorch"]
+
+    for number in range(3):
+        candidates.add_entry(f"new{number}", ["Python"])
+    assert names(service.suggest("py", limit=1)) == ["Python"]
+
+    candidates.add_entry("c3", ["Rust Embedded"])
+    assert names(service.suggest("embed")) == ["Rust Embedded"]
+
+    candidates.remove_entry("c3")
+    jobs.remove_entry("j2")
+    assert service.suggest("embed") == []
+    assert "Pyramid Scheme Detection" not in names(service.suggest("py", limit=50))
+    # Registry skills stay completable when nothing uses them
+    assert names(service.suggest("kubern")) == ["Kubernetes"]
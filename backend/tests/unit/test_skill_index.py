@@ -0,0 +1,87 @@
+"""
+Unit tests for the in-process skill index and index-backed matching
+"""
+import pytest
+from unittest.mock import AsyncMock
+from bson import ObjectId
+
+from src.services.skill_index_service import SkillIndexService
+from src.models.candidate import Candidate
+from src.models.job_posting import JobPosting
+
+
+class TestSkillIndexService:
+    """Test cases for SkillIndexService"""
+
+    def test_add_entry_creates_postings(self):
+        index = SkillIndexService("candidates", with_bitsets=True)
+        index.add_entry("c1", ["Python", "FastAPI"])
+        index.add_entry("c2", ["Python"])
+
+        assert index.get_entry_ids("Python") == {"c1", "c2"}
+        assert index.get_entry_ids("FastAPI") == {"c1"}
+        assert index.entry_count == 2
+
+    def test_update_entry_replaces_skills(self):
+        index = SkillIndexService("candidates", with_bitsets=True)
+        index.add_entry("c1", ["Python", "FastAPI"])
+        index.add_entry("c1", ["Go"])
+
+        assert index.get_entry_ids("Python") == set()
+        assert index.get_entry_ids("Go") == {"c1"}
+        assert index.get_skills("c1") == ("Go",)
+
+    def test_remove_entry(self):
+        index = SkillIndexService("candidates", with_bitsets=True)
+        index.add_entry("c1", ["Python"])
+        index.remove_entry("c1")
+        index.remove_entry("missing")
+
+        assert index.get_entry_ids("Python") == set()
+        assert index.entry_count == 0
+
+    def test_entry_without_skills(self):
+        index = SkillIndexService("candidates", with_bitsets=True)
+        index.add_entry("c1", None)
+
+        assert index.entry_count == 1
+        assert index.count_matches(["Python"]) == {}
+
+    def test_count_matches_only_touches_sharing_candidates(self):
+        index = SkillIndexService("candidates", with_bitsets=True)
+        index.add_entry("c1", ["Python", "FastAPI", "MongoDB"])
+        index.add_entry("c2", ["Python"])
+        index.add_entry("c3", ["Java"])
+
+        counts = index.count_matches(["Python", "FastAPI", "Python"])
+
+        assert counts == {"c1": 2, "c2": 1}
+
+    def test_matched_skills_keeps_job_order(self):
+        index = SkillIndexService("candidates", with_bitsets=True)
+        index.add_entry("c1", ["MongoDB", "Python"])
+
+        assert index.matched_skills("c1", ["Python", "FastAPI", "MongoDB"]) == ["Python", "MongoDB"]
+
+
+@pytest.mark.asyncio
+async def test_matching_uses_index_and_threshold(make_matching_service):
+    """Matching fetches only candidates above the threshold and scores them from the index"""
+    strong, weak = ObjectId(), ObjectId()
+    service = await make_matching_service([
+        {"_id": strong, "skills": ["Python", "FastAPI"]},
+        {"_id": weak, "skills": ["Python"]},
+        {"_id": ObjectId(), "skills": ["Java"]},
+    ])
+    service.candidate_service.get_candidates_by_ids = AsyncMock(
+        return_value=[Candidate(_id=strong, name="Strong", skills=["Python", "FastAPI"])]
+    )
+
+    job = JobPosting(title="Backend", skills=["Python", "FastAPI", "MongoDB", "Docker", "Kubernetes"])
+    candidates = await service.get_candidates_for_job(job)
+
+    # 1/5 = 20% is not above the threshold, so only the strong candidate is fetched
+    service.candidate_service.get_candidates_by_ids.assert_called_once_with([str(strong)], exclude_fields=["raw_text"])
+    assert len(candidates) == 1
+    assert candidates[0].match_percentage == 40.0
+    assert candidates[0].matched_skills == ["Python", "FastAPI"]
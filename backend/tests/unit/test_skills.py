@@ -0,0 +1,52 @@
+"""
+Unit tests for skill canonicalization
+"""
+from src.models.candidate import CandidateCreate, CandidateUpdate
+from src.utils.skills import ALIAS_TABLE, SKILL_ALIASES, canonicalize_skill, canonicalize_skills
+
+
+def test_aliases_map_to_canonical_name():
+    assert canonicalize_skill("React.js") == "React"
+    assert canonicalize_skill("reactjs") == "React"
+    assert canonicalize_skill("k8s") == "Kubernetes"
+    assert canonicalize_skill("Golang") == "Go"
+
+
+def test_aliases_keep_distinct_skills_apart():
+    assert canonicalize_skill("spring") == "Spring"
+    assert canonicalize_skill("spring boot") == "Spring Boot"
+    assert canonicalize_skill("gitlab") == "GitLab"
+    assert canonicalize_skill("gitlab ci/cd") == "GitLab CI"
+    assert canonicalize_skill("DRF") == "Django REST Framework"
+    assert canonicalize_skill("django") == "Django"
+    assert canonicalize_skill("css") == "CSS"
+    assert canonicalize_skill("html") == "HTML"
+    assert canonicalize_skill("html 5") == "HTML5"
+
+
+def test_canonical_names_match_case_insensitively():
+    assert canonicalize_skill("python") == "Python"
+    assert canonicalize_skill("  PYTHON ") == "Python"
+    assert canonicalize_skill("ios") == "iOS"
+
+
+def test_unknown_skills_casing():
+    assert canonicalize_skill("figma") == "Figma"
+    assert canonicalize_skill("user   research") == "User Research"
+    assert canonicalize_skill("UX") == "UX"
+    assert canonicalize_skill("WebAssembly") == "WebAssembly"
+
+
+def test_canonicalize_skills_dedupes_in_order():
+    assert canonicalize_skills(["react", "Python", "React.js", " ", "python3"]) == ["React", "Python"]
+    assert canonicalize_skills(None) is None
+
+
+def test_every_canonical_name_is_its_own_entry():
+    for canonical in SKILL_ALIASES:
+        assert ALIAS_TABLE[canonical.lower()] == canonical
+
+
+def test_candidate_models_store_canonical_skills():
+    assert CandidateCreate(name="A", skills=["node", "Node.js", "postgres"]).skills == ["Node.js", "PostgreSQL"]
+    assert CandidateUpdate(skills=["vue"]).skills == ["Vue.js"]
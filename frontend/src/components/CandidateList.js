@@ -50,7 +50,7 @@ const CandidateList = ({
             ...(candidate.email && { email: candidate.email }),
             ...(candidate.phone && { phone: candidate.phone }),
             ...(candidate.education && { education: candidate.education }),
-            ...(candidate.document_id || candidate.raw_text ? { resume: 'Resume uploaded' } : {}),
+            ...(candidate.document_id || candidate.has_raw_text ? { resume: 'Resume uploaded' } : {}),
             ...(candidateExtraDetails[candidate.id]?.length > 0 && { 
               extraDetails: `${candidateExtraDetails[candidate.id].length} additional details` 
             }),
@@ -45,24 +45,14 @@ const Candidates = () => {
 
   const fetchCandidates = async () => {
     try {
-      const response = await axios.get(`${API}/candidates`);
+      // Extra details come with the page instead of one request per candidate;
+      // the list shows no resume text, so leave it out
+      const response = await axios.get(`${API}/candidates`, { params: { view: 'summary', include: 'extra_details' } });
       setCandidates(response.data);
       
-      // Fetch extra details for all candidates
-      const extraDetailsPromises = response.data.map(async (candidate) => {
-        try {
-          const detailsResponse = await axios.get(`${API}/candidates/${candidate.id}/extra-details`);
-          return { candidateId: candidate.id, details: detailsResponse.data };
-        } catch (error) {
-          console.error(`Error fetching extra details for candidate ${candidate.id}:`, error);
-          return { candidateId: candidate.id, details: [] };
-        }
-      });
-      
-      const extraDetailsResults = await Promise.all(extraDetailsPromises);
       const extraDetailsMap = {};
-      extraDetailsResults.forEach(result => {
-        extraDetailsMap[result.candidateId] = result.details;
+      response.data.forEach(candidate => {
+        extraDetailsMap[candidate.id] = candidate.extra_details || [];
       });
       setCandidateExtraDetails(extraDetailsMap);
       
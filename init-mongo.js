@@ -22,9 +22,16 @@ db.job_postings.createIndex({ "location": 1 });
 // Create indexes for candidates
 db.candidates.createIndex({ "email": 1 }, { unique: true });
 db.candidates.createIndex({ "skills": 1 });
-db.candidates.createIndex({ "created_at": -1 });
+db.candidates.createIndex({ "created_at": -1, "_id": -1 });
 db.candidates.createIndex({ "location": 1 });
 db.candidates.createIndex({ "experience_level": 1 });
+db.candidates.createIndex(
+    { "name": "text", "email": "text", "skills": "text", "summary": "text", "raw_text": "text" },
+    { name: "candidate_text_search", weights: { name: 10, email: 10, skills: 5, summary: 2, raw_text: 1 } }
+);
+
+// Create indexes for candidate extra details
+db.candidate_extra_details.createIndex({ "candidate_id": 1, "created_at": -1 });
 
 // Create indexes for documents
 db.documents.createIndex({ "candidate_id": 1 });
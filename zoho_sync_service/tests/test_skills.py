@@ -0,0 +1,38 @@
+import os
+import sys
+
+import pytest
+
+# Import the sync service and, when the repository checkout is available, the backend it mirrors
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.dirname(HERE))
+sys.path.append(os.path.join(HERE, '..', '..', 'backend'))
+
+from service import canonicalize_skill, canonicalize_skills
+
+backend_skills = pytest.importorskip("src.utils.skills")
+
+SKILLS = [
+    "Python", "python", "PYTHON", "  python   3 ", "py", "golang", "GoLang", "k8s", "Node JS",
+    "react.js", "REST", "restful apis", "c sharp", "C#", ".net core", "Ruby on Rails", "ror",
+    "terraform", "Hashicorp Terraform", "machine  learning", "ml", "ML", "deep learning",
+    "Deep Learning", "sAP", "SAP hana", "data   engineering", "tensorflow 2", "git scm",
+]
+
+
+@pytest.mark.parametrize("skill", SKILLS)
+def test_skill_matches_backend_canonical_name(skill):
+    """The published alias table with the sync service's rules gives the backend's name"""
+    assert canonicalize_skill(skill, backend_skills.ALIAS_TABLE) == backend_skills.canonicalize_skill(skill)
+
+
+def test_skill_list_matches_backend():
+    skills = SKILLS + ["", "   ", "Python3", "node"]
+
+    assert canonicalize_skills(skills, backend_skills.ALIAS_TABLE) == backend_skills.canonicalize_skills(skills)
+
+
+def test_published_keys_are_backend_lookup_keys():
+    """Every published key is what the sync service looks a skill up by"""
+    for key in backend_skills.ALIAS_TABLE:
+        assert " ".join(key.split()).lower() == key == backend_skills.skill_key(key)